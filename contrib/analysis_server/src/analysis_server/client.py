@@ -13,6 +13,45 @@ _ASERVER_PREFIX = 'com.phoenix_int.aserver.'
 _TYPE_PREFIX = _ASERVER_PREFIX+'types.'
 
 
+def _parse_property(line):
+    """
+    Parse a ``name (type=T) (access=A)`` line from 'listProperties'.
+    Returns ``(name, type, access)`` with `type` shortened and `access`
+    translated to 'in' or 'out'.
+    """
+    name, typ, access = line.strip().split()
+    typ = typ.split('=')[1][:-1]
+    if typ.startswith(_TYPE_PREFIX):
+        typ = typ[len(_TYPE_PREFIX):]
+    elif typ.startswith(_ASERVER_PREFIX):
+        typ = typ[len(_ASERVER_PREFIX):]
+    access = access.split('=')[1][:-1]
+    if access == 'sg':
+        access = 'in'
+    else:
+        access = 'out'
+    return (name, typ, access)
+
+
+def _parse_value(reply, pos):
+    """
+    Parse a ``name (type=T) (access=A)  vLen=N  val=V`` entry from
+    'listValues' starting at `pos` in `reply`. The value may contain
+    newlines, so it is extracted using its length.
+    Returns ``(name, type, access, value, next_pos)``.
+    """
+    vlen_pos = reply.index('  vLen=', pos)
+    name, typ, access = _parse_property(reply[pos:vlen_pos])
+    val_pos = reply.index('  val=', vlen_pos)
+    vlen = int(reply[vlen_pos+7:val_pos])
+    start = val_pos+6
+    end = start+vlen
+    next_pos = end
+    while reply[next_pos:next_pos+1] in ('\r', '\n'):
+        next_pos += 1
+    return (name, typ, access, reply[start:end], next_pos)
+
+
 class Client(object):
     """
     ModelCenter AnalysisServer client, providing a Python interface to the
@@ -339,25 +378,45 @@ class Client(object):
         reply = self._send_recv(req)
         lines = reply.split('\n')
         if path:
-            lines = lines[1:]
-            info = []
-            for line in lines:
-                name, typ, access = line.strip().split()
-                typ = typ.split('=')[1][:-1]
-                if typ.startswith(_TYPE_PREFIX):
-                    typ = typ[len(_TYPE_PREFIX):]
-                elif typ.startswith(_ASERVER_PREFIX):
-                    typ = typ[len(_ASERVER_PREFIX):]
-                access = access.split('=')[1][:-1]
-                if access == 'sg':
-                    access = 'in'
-                else:
-                    access = 'out'
-                info.append((name, typ, access))
-            return info
+            return [_parse_property(line) for line in lines[1:]]
         else:
             return lines[1:]
 
+    def list_values(self, path):
+        """
+        Returns a list of component properties and their values in the form
+        ``(name, type, access, value, sub_props)``, where `name`, `type`, and
+        `access` are as returned by :meth:`list_properties`, `value` is the
+        value string, and `sub_props` is a dictionary mapping sub-property
+        names (such as 'description' or 'units') to value strings. The server
+        only reports sub-properties for top-level variables, `sub_props` is
+        empty for other variables and for groups.
+
+        This returns in a single request what would otherwise take
+        :meth:`list_properties` plus a :meth:`get` for each property and
+        sub-property.
+
+        path: string
+            Path to component or group.
+        """
+        reply = self._send_recv('listValues %s' % path)
+        info = []
+        nlpos = reply.find('\n')
+        pos = len(reply) if nlpos < 0 else nlpos+1  # Skip 'N properties found'
+        while pos < len(reply):
+            name, typ, access, valstr, pos = _parse_value(reply, pos)
+            sub_props = {}
+            if reply.startswith('   ', pos):
+                nlpos = reply.find('\n', pos)
+                count = int(reply[pos:nlpos].split()[0])  # 'N SubProps found:'
+                pos = nlpos+1
+                for i in range(count):
+                    sub_name, sub_typ, sub_access, sub_val, pos = \
+                        _parse_value(reply, pos)
+                    sub_props[sub_name] = sub_val
+            info.append((name, typ, access, valstr, sub_props))
+        return info
+
     def start_monitor(self, path):
         """
         Starts monitor `path`. Returns ``(initial_value, monitor_id)``.
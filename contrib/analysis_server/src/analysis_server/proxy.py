@@ -59,6 +59,9 @@ class ComponentProxy(Component):
         self._client.start(typname, self._objname)
         super(ComponentProxy, self).__init__()
 
+        # Output value strings read since the last execution.
+        self._values = {}
+
         # Add properties (variables).
         self._populate(self, self._objname)
 
@@ -75,61 +78,71 @@ class ComponentProxy(Component):
 
         path: string
             Path on server corresponding to `container`.
+
+        All values and (top-level) variable properties are read with a single
+        'listValues' request, only those not reported there are requested
+        individually.
         """
-        info = self._client.list_properties(path)
-        for prop, typ, iotype in info:
+        info = self._client.list_values(path)
+        for prop, typ, iotype, valstr, sub_props in info:
             if hasattr(container, prop):
                 container.raise_exception('Name %r already bound to %r'
                                           % (prop, getattr(container, prop)),
                                           AttributeError)
 
             rpath = '.'.join([path, prop])
+            props = _Properties(self._client, rpath, sub_props, valstr)
             if typ == 'PHXDouble' or typ == 'PHXLong' or typ == 'PHXString':
-                enum_valstrs = self._client.get(rpath+'.enumValues')
+                enum_valstrs = props.get('enumValues')
                 if enum_valstrs:
-                    container.add_trait(prop,
-                                        EnumProxy(iotype, self._client, rpath,
-                                                  typ, enum_valstrs))
+                    self._add_proxy(container, prop,
+                                    EnumProxy(iotype, self._client, rpath,
+                                              typ, enum_valstrs, props))
                     continue
 
             if typ == 'PHXBoolean':
-                container.add_trait(prop,
-                                    BoolProxy(iotype, self._client, rpath))
+                self._add_proxy(container, prop,
+                                BoolProxy(iotype, self._client, rpath, props))
             elif typ == 'PHXDouble':
-                container.add_trait(prop,
-                                    FloatProxy(iotype, self._client, rpath))
+                self._add_proxy(container, prop,
+                                FloatProxy(iotype, self._client, rpath, props))
             elif typ == 'PHXLong':
-                container.add_trait(prop,
-                                    IntProxy(iotype, self._client, rpath))
+                self._add_proxy(container, prop,
+                                IntProxy(iotype, self._client, rpath, props))
             elif typ == 'PHXRawFile':
-                container.add_trait(prop,
-                                    FileProxy(iotype, self._client, rpath,
-                                              self))
+                self._add_proxy(container, prop,
+                                FileProxy(iotype, self._client, rpath,
+                                          self, props))
             elif typ == 'PHXString':
-                container.add_trait(prop,
-                                    StrProxy(iotype, self._client, rpath))
+                self._add_proxy(container, prop,
+                                StrProxy(iotype, self._client, rpath, props))
             elif typ == 'PHXGroup':
                 group = container.add(prop, Container())
                 self._populate(group, rpath)  # Recurse.
 
             elif typ.startswith('double['):
-                container.add_trait(prop,
-                                    ArrayProxy(iotype, self._client, rpath,
-                                               float))
+                self._add_proxy(container, prop,
+                                ArrayProxy(iotype, self._client, rpath,
+                                           float, props))
             elif typ.startswith('long['):
-                container.add_trait(prop,
-                                    ArrayProxy(iotype, self._client, rpath,
-                                               int))
+                self._add_proxy(container, prop,
+                                ArrayProxy(iotype, self._client, rpath,
+                                           int, props))
             elif typ.startswith('java.lang.String['):
-                container.add_trait(prop,
-                                    ListProxy(iotype, self._client, rpath,
-                                              str))
+                self._add_proxy(container, prop,
+                                ListProxy(iotype, self._client, rpath,
+                                          str, props))
             elif typ == 'PHXScriptObject':
                 container.add(prop,
-                              ObjProxy(iotype, self._client, rpath))
+                              ObjProxy(iotype, self._client, rpath, props))
             else:
                 raise NotImplementedError('%r type %r' % (prop, typ))
 
+    def _add_proxy(self, container, name, proxy):
+        """ Add variable `proxy` to `container` as `name`. """
+        proxy.cache = self._values
+        container.add_trait(name, proxy)
+
     def _add_methods(self):
         """ Add methods to invoke remote methods. """
         for name in self._methods:
@@ -166,6 +179,7 @@ def %s(self):
         super(ComponentProxy, self).post_load()
         self._client = Client(self._host, self._port)
         self._client.start(self._typname, self._objname)
+        self._values = {}
         self._restore(self)
 
     def _restore(self, container):
@@ -175,7 +189,7 @@ def %s(self):
         for name, trait in container._alltraits().items():
             typ = trait.trait_type
             if isinstance(typ, ProxyMixin):
-                typ.restore(self._client)
+                typ.restore(self._client, self._values)
 
         for name, obj in container.items():
             if is_instance(obj, Container):
@@ -195,12 +209,14 @@ def %s(self):
     def execute(self):
         """ Execute remote component. """
         self._flush_proxies()
+        self._values.clear()
         self._client.execute(self._objname)
         self._update_proxies()
 
     def _invoke_method(self, name):
         """ Invoke remote method. """
         self._flush_proxies()
+        self._values.clear()
         result = self._client.invoke('%s.%s' % (self._objname, name))
         self._update_proxies()
         return result
@@ -220,6 +236,51 @@ def %s(self):
                     obj.update()
 
 
+class _Properties(object):
+    """
+    Access to the properties of remote variable `rpath` via `client`.
+    Properties already read via 'listValues' are taken from `sub_props`
+    and `valstr` rather than requested from the server.
+
+    client: :class:`client.Client`
+        The client to use to access the remote variable.
+
+    rpath: string
+        Path to the remote variable.
+
+    sub_props: dict
+        Maps property name to value string.
+
+    valstr: string
+        Value of the variable.
+    """
+
+    def __init__(self, client, rpath, sub_props=None, valstr=None):
+        self._client = client
+        self._rpath = rpath
+        self._props = dict(sub_props or {})
+        if valstr is not None:
+            self._props['value'] = valstr
+
+    def get(self, name):
+        """
+        Return value string of property `name` ('value' for the variable's
+        value).
+
+        name: string
+            Name of property.
+        """
+        try:
+            return self._props[name]
+        except KeyError:
+            if name == 'value':
+                valstr = self._client.get(self._rpath)
+            else:
+                valstr = self._client.get('%s.%s' % (self._rpath, name))
+            self._props[name] = valstr
+            return valstr
+
+
 class ProxyMixin(object):
     """
     Common methods for variable proxies.
@@ -230,17 +291,28 @@ class ProxyMixin(object):
 
     rpath: string
         Path to the remote variable.
+
+    props: :class:`_Properties`
+        Remote properties, created from `client` and `rpath` if None.
+
+    Output values are read from the server once per execution when `cache`
+    has been set to the owning component's value cache, which the component
+    clears before each execution.
     """
 
-    def __init__(self, client, rpath):
+    def __init__(self, client, rpath, props=None):
         self._client = client
         self._rpath = rpath
-        self._valstr = client.get(rpath)  # Needed for later restore.
+        self.cache = None
+        if props is None:
+            props = _Properties(client, rpath)
+        self._valstr = props.get('value')  # Needed for later restore.
 
     def __getstate__(self):
         """ Return dict representing this proxy's state. """
         state = self.__dict__.copy()
         del state['_client']
+        state['cache'] = None
         return state
 
     def __setstate__(self, state):
@@ -248,14 +320,18 @@ class ProxyMixin(object):
         state['_client'] = None
         self.__dict__ = state
 
-    def restore(self, client):
+    def restore(self, client, cache=None):
         """
         Restore remote state.
 
         client: :class:`client.Client`
             The client to use to access the remote variable.
+
+        cache: dict
+            Value cache of owning component.
         """
         self._client = client
+        self.cache = cache
         if self.iotype == 'in':
             self._client.set(self._rpath, self._valstr)
 
@@ -264,7 +340,23 @@ class ProxyMixin(object):
         if self._client is None:  # Happens during component.__setstate__
             return self._valstr
         else:
-            return self._client.get(self._rpath)
+            return self._rget(self._rpath)
+
+    def _rget(self, path):
+        """
+        Get remote value of `path` as a string, using the cache for outputs.
+
+        path: string
+            Path to remote variable or property.
+        """
+        if self.iotype == 'out' and self.cache is not None:
+            try:
+                return self.cache[path]
+            except KeyError:
+                valstr = self._client.get(path)
+                self.cache[path] = valstr
+                return valstr
+        return self._client.get(path)
 
     def rset(self, valstr):
         """
@@ -294,29 +386,34 @@ class ArrayProxy(ProxyMixin, Array):
 
     typ: Python type
         Type for each element.
+
+    props: :class:`_Properties`
+        Remote properties, created from `client` and `rpath` if None.
     """
 
-    def __init__(self, iotype, client, rpath, typ):
-        ProxyMixin.__init__(self, client, rpath)
+    def __init__(self, iotype, client, rpath, typ, props=None):
+        if props is None:
+            props = _Properties(client, rpath)
+        ProxyMixin.__init__(self, client, rpath, props)
         self._type = typ
 
         default = self._parse(self._valstr)
-        desc = client.get(rpath+'.description')
+        desc = props.get('description')
 
         if typ == float:
-            as_units = client.get(rpath+'.units')
+            as_units = props.get('units')
             if as_units:
                 om_units = get_translation(as_units)
             else:
                 om_units = None
 
         if typ != str:
-            if client.get(rpath+'.hasUpperBound') == 'true':
-                high = typ(client.get(rpath+'.upperBound'))
+            if props.get('hasUpperBound') == 'true':
+                high = typ(props.get('upperBound'))
             else:
                 high = None
-            if client.get(rpath+'.hasLowerBound') == 'true':
-                low = typ(client.get(rpath+'.lowerBound'))
+            if props.get('hasLowerBound') == 'true':
+                low = typ(props.get('lowerBound'))
             else:
                 low = None
 
@@ -404,29 +501,34 @@ class ListProxy(ProxyMixin, List):
 
     typ: Python type
         Type for each element.
+
+    props: :class:`_Properties`
+        Remote properties, created from `client` and `rpath` if None.
     """
 
-    def __init__(self, iotype, client, rpath, typ):
-        ProxyMixin.__init__(self, client, rpath)
+    def __init__(self, iotype, client, rpath, typ, props=None):
+        if props is None:
+            props = _Properties(client, rpath)
+        ProxyMixin.__init__(self, client, rpath, props)
         self._type = typ
 
         default = [typ(val.strip(' "')) for val in self._valstr.split(',')]
-        desc = client.get(rpath+'.description')
+        desc = props.get('description')
 
         if typ == float:
-            as_units = client.get(rpath+'.units')
+            as_units = props.get('units')
             if as_units:
                 om_units = get_translation(as_units)
             else:
                 om_units = None
 
         if typ != str:
-            if client.get(rpath+'.hasUpperBound') == 'true':
-                high = typ(client.get(rpath+'.upperBound'))
+            if props.get('hasUpperBound') == 'true':
+                high = typ(props.get('upperBound'))
             else:
                 high = None
-            if client.get(rpath+'.hasLowerBound') == 'true':
-                low = typ(client.get(rpath+'.lowerBound'))
+            if props.get('hasLowerBound') == 'true':
+                low = typ(props.get('lowerBound'))
             else:
                 low = None
 
@@ -489,13 +591,18 @@ class BoolProxy(ProxyMixin, Bool):
 
     rpath: string
         Path to the remote variable.
+
+    props: :class:`_Properties`
+        Remote properties, created from `client` and `rpath` if None.
     """
 
-    def __init__(self, iotype, client, rpath):
-        ProxyMixin.__init__(self, client, rpath)
+    def __init__(self, iotype, client, rpath, props=None):
+        if props is None:
+            props = _Properties(client, rpath)
+        ProxyMixin.__init__(self, client, rpath, props)
 
         default = self._valstr == 'true'
-        desc = client.get(rpath+'.description')
+        desc = props.get('description')
 
         Bool.__init__(self, default_value=default, iotype=iotype, desc=desc)
 
@@ -547,16 +654,21 @@ class EnumProxy(ProxyMixin, Enum):
 
     valstrs: list[string]
         Enumeration values as strings.
+
+    props: :class:`_Properties`
+        Remote properties, created from `client` and `rpath` if None.
     """
 
-    def __init__(self, iotype, client, rpath, typ, valstrs):
-        ProxyMixin.__init__(self, client, rpath)
+    def __init__(self, iotype, client, rpath, typ, valstrs, props=None):
+        if props is None:
+            props = _Properties(client, rpath)
+        ProxyMixin.__init__(self, client, rpath, props)
 
         om_units = None
         if typ == 'PHXDouble':
             self._from_string = float
             self._to_string = _float2str
-            as_units = client.get(rpath+'.units')
+            as_units = props.get('units')
             if as_units:
                 om_units = get_translation(as_units)
         elif typ == 'PHXLong':
@@ -569,14 +681,14 @@ class EnumProxy(ProxyMixin, Enum):
             raise NotImplementedError('EnumProxy for %r' % typ)
 
         default = self._from_string(self._valstr)
-        desc = client.get(rpath+'.description')
+        desc = props.get('description')
 
         enum_values = []
         for valstr in valstrs.split(','):
             enum_values.append(self._from_string(valstr.strip(' "')))
 
         enum_aliases = []
-        aliases = self._client.get(rpath+'.enumAliases')
+        aliases = props.get('enumAliases')
         if aliases:
             for alias in aliases.split(','):
                 enum_aliases.append(alias.strip(' "'))
@@ -637,14 +749,19 @@ class FileProxy(ProxyMixin, File):
 
     component: :class:`ComponentProxy`
         Parent component of remote variable.
+
+    props: :class:`_Properties`
+        Remote properties, created from `client` and `rpath` if None.
     """
 
-    def __init__(self, iotype, client, rpath, component):
-        ProxyMixin.__init__(self, client, rpath)
+    def __init__(self, iotype, client, rpath, component, props=None):
+        if props is None:
+            props = _Properties(client, rpath)
+        ProxyMixin.__init__(self, client, rpath, props)
         self._component = component
         self._path = 'AS-%s.dat' % rpath  # Local filename for remote data.
 
-        desc = client.get(rpath+'.description')
+        desc = props.get('description')
         metadata = {}
         if iotype == 'out':
             metadata['path'] = self._path
@@ -668,7 +785,7 @@ class FileProxy(ProxyMixin, File):
         if self._client is None:  # Happens during component.__setstate__
             return None
 
-        binary = self._client.get(self._rpath+'.isBinary') == 'true'
+        binary = self._rget(self._rpath+'.isBinary') == 'true'
         valstr = self.rget()
         mode = 'wb' if binary else 'w'
         with self._component.dir_context:
@@ -709,24 +826,29 @@ class FloatProxy(ProxyMixin, Float):
 
     rpath: string
         Path to the remote variable.
+
+    props: :class:`_Properties`
+        Remote properties, created from `client` and `rpath` if None.
     """
 
-    def __init__(self, iotype, client, rpath):
-        ProxyMixin.__init__(self, client, rpath)
+    def __init__(self, iotype, client, rpath, props=None):
+        if props is None:
+            props = _Properties(client, rpath)
+        ProxyMixin.__init__(self, client, rpath, props)
 
         default = float(self._valstr)
-        desc = client.get(rpath+'.description')
-        as_units = client.get(rpath+'.units')
+        desc = props.get('description')
+        as_units = props.get('units')
         if as_units:
             om_units = get_translation(as_units)
         else:
             om_units = None
-        if client.get(rpath+'.hasUpperBound') == 'true':
-            high = float(client.get(rpath+'.upperBound'))
+        if props.get('hasUpperBound') == 'true':
+            high = float(props.get('upperBound'))
         else:
             high = None
-        if client.get(rpath+'.hasLowerBound') == 'true':
-            low = float(client.get(rpath+'.lowerBound'))
+        if props.get('hasLowerBound') == 'true':
+            low = float(props.get('lowerBound'))
         else:
             low = None
 
@@ -773,19 +895,24 @@ class IntProxy(ProxyMixin, Int):
 
     rpath: string
         Path to the remote variable.
+
+    props: :class:`_Properties`
+        Remote properties, created from `client` and `rpath` if None.
     """
 
-    def __init__(self, iotype, client, rpath):
-        ProxyMixin.__init__(self, client, rpath)
+    def __init__(self, iotype, client, rpath, props=None):
+        if props is None:
+            props = _Properties(client, rpath)
+        ProxyMixin.__init__(self, client, rpath, props)
 
         default = int(self._valstr)
-        desc = client.get(rpath+'.description')
-        if client.get(rpath+'.hasUpperBound') == 'true':
-            high = int(client.get(rpath+'.upperBound'))
+        desc = props.get('description')
+        if props.get('hasUpperBound') == 'true':
+            high = int(props.get('upperBound'))
         else:
             high = None
-        if client.get(rpath+'.hasLowerBound') == 'true':
-            low = int(client.get(rpath+'.lowerBound'))
+        if props.get('hasLowerBound') == 'true':
+            low = int(props.get('lowerBound'))
         else:
             low = None
 
@@ -832,13 +959,18 @@ class StrProxy(ProxyMixin, Str):
 
     rpath: string
         Path to the remote variable.
+
+    props: :class:`_Properties`
+        Remote properties, created from `client` and `rpath` if None.
     """
 
-    def __init__(self, iotype, client, rpath):
-        ProxyMixin.__init__(self, client, rpath)
+    def __init__(self, iotype, client, rpath, props=None):
+        if props is None:
+            props = _Properties(client, rpath)
+        ProxyMixin.__init__(self, client, rpath, props)
 
         default = self._valstr
-        desc = client.get(rpath+'.description')
+        desc = props.get('description')
 
         Str.__init__(self, default_value=default, iotype=iotype, desc=desc)
 
@@ -886,11 +1018,13 @@ class VarTreeMixin(object):
         Path to the remote variable.
     """
 
-    def __init__(self, iotype, client, rpath):
+    def __init__(self, iotype, client, rpath, props=None):
+        if props is None:
+            props = _Properties(client, rpath)
         self._iotype = iotype
         self._client = client
         self._rpath = rpath
-        self._valstr = client.get(rpath)  # Needed for later restore.
+        self._valstr = props.get('value')  # Needed for later restore.
         self._dirty = False  # Set True after something is modified,
 
     def __getstate__(self):
@@ -961,14 +1095,18 @@ class ObjProxy(VarTreeMixin, VariableTree):
 
     rpath: string
         Path to the remote variable.
+
+    props: :class:`_Properties`
+        Remote properties, created from `client` and `rpath` if None.
     """
 
-    def __init__(self, iotype, client, rpath):
-        VarTreeMixin.__init__(self, iotype, client, rpath)
-        desc = client.get(rpath+'.description')
+    def __init__(self, iotype, client, rpath, props=None):
+        if props is None:
+            props = _Properties(client, rpath)
+        VarTreeMixin.__init__(self, iotype, client, rpath, props)
+        desc = props.get('description')
         VariableTree.__init__(self, doc=desc, iotype=iotype)
-        xml = client.get(rpath)
-        populate_from_xml(self, xml)
+        populate_from_xml(self, self._valstr)
         self._dirty = False
 
 
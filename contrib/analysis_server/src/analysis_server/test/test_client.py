@@ -256,6 +256,32 @@ version: 7.0, build: 42968"""
         result = self.client.list_properties('comp')
         self.assertEqual(result, expected)
 
+    def test_list_values(self):
+        self.client.start('ASTestComp', 'comp')
+        result = self.client.list_values('comp')
+        names = [(name, typ, access) for name, typ, access, val, sub in result]
+        self.assertEqual(names, self.client.list_properties('comp'))
+
+        info = dict([(name, (val, sub)) for name, typ, access, val, sub
+                                                      in result])
+        val, sub = info['y']
+        self.assertEqual(val, '3')
+        self.assertEqual(sub['description'], 'Y input')
+        self.assertEqual(sub['hasLowerBound'], 'true')
+        self.assertEqual(sub['lowerBound'], '-10.0')
+        self.assertEqual(sub['units'], 'ft')
+        val, sub = info['obj_input']
+        self.assertEqual(val, self.client.get('comp.obj_input'))
+        val, sub = info['sub_group']
+        self.assertEqual(sub, {})
+
+        result = self.client.list_values('comp.sub_group')
+        names = [(name, typ, access) for name, typ, access, val, sub in result]
+        self.assertEqual(names, self.client.list_properties('comp.sub_group'))
+        for name, typ, access, val, sub in result:
+            if typ != 'PHXGroup':
+                self.assertEqual(val, self.client.get('comp.sub_group.'+name))
+
     def test_monitor(self):
         self.client.start('ASTestComp', 'comp')
         result, monitor_id = self.client.start_monitor('comp.ASTestComp_loader.py')
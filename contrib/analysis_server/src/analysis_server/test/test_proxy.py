@@ -171,6 +171,47 @@ class TestCase(unittest.TestCase):
             os.remove('AS-the_obj.out_file.dat')
             comp.pre_delete()
 
+    def test_output_cache(self):
+        logging.debug('')
+        logging.debug('test_output_cache')
+        comp = set_as_top(self.factory.create('ASTestComp'))
+        try:
+            requests = []
+            orig_get = comp._client.get
+            def counting_get(path):
+                requests.append(path)
+                return orig_get(path)
+            comp._client.get = counting_get
+
+            path = 'output'
+            with comp.dir_context:
+                with open(path, 'w') as out:
+                    out.write('Hello world!')
+            comp.set('in_file', FileRef(path, comp))
+            with comp.dir_context:
+                os.remove(path)
+            comp.set('x', 6)
+            comp.set('y', 7)
+            comp.run()
+            for i in range(3):
+                self.assertEqual(comp.get('z'), 42.)
+            self.assertEqual(requests.count('the_obj.z'), 1)
+
+            # Inputs are still read from the server.
+            comp.get('x')
+            comp.get('x')
+            self.assertEqual(requests.count('the_obj.x'), 2)
+
+            # Next execution invalidates.
+            comp.set('x', 2)
+            comp.run()
+            self.assertEqual(comp.get('z'), 14.)
+            self.assertEqual(requests.count('the_obj.z'), 2)
+        finally:
+            comp.pre_delete()
+            if os.path.exists('AS-the_obj.out_file.dat'):
+                os.remove('AS-the_obj.out_file.dat')
+
     def test_model(self):
         logging.debug('')
         logging.debug('test_model')
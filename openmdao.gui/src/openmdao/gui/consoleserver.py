@@ -1,4 +1,5 @@
 import cmd
+import copy
 import jsonpickle
 import logging
 import os.path
@@ -13,6 +14,7 @@ from openmdao.main.api import Assembly, Component, Driver, logger, \
 from openmdao.main.project import project_from_archive, Project, parse_archive_name, \
                                   ProjFinder, _clear_insts, _match_insts
 from openmdao.main.publisher import publish
+from openmdao.main.component import ConfigGeneration
 from openmdao.main.mp_support import has_interface, is_instance
 from openmdao.main.interfaces import IContainer, IComponent, IAssembly
 from openmdao.main.factorymanager import register_class_factory, remove_class_factory
@@ -43,6 +45,77 @@ def modifies_model(target):
     return wrapper
 
 
+_LINK_KEYS = ('connections', 'parameters', 'constraints', 'objectives')
+
+
+def _dataflow_delta(old, new):
+    ''' return the changes between two global dataflow documents:
+            components: new list of component names, if it changed
+            added:      entries for new (or replaced) components
+            valid:      name -> validity for components whose validity changed
+            <link key>: dictionary of 'added' and 'removed' links
+    '''
+    delta = {}
+    old_comps = dict([(comp['name'], comp) for comp in old['components']])
+    names = [comp['name'] for comp in new['components']]
+    if names != [comp['name'] for comp in old['components']]:
+        delta['components'] = names
+    added = []
+    valid = {}
+    for comp in new['components']:
+        old_comp = old_comps.get(comp['name'])
+        if old_comp is None or old_comp['python_id'] != comp['python_id'] \
+           or old_comp['type'] != comp['type']:
+            added.append(comp)
+        elif old_comp['valid'] != comp['valid']:
+            valid[comp['name']] = comp['valid']
+    if added:
+        delta['added'] = added
+    if valid:
+        delta['valid'] = valid
+    for key in _LINK_KEYS:
+        old_links = set([tuple(link) for link in old[key]])
+        new_links = set([tuple(link) for link in new[key]])
+        if old_links != new_links:
+            delta[key] = {
+                'added':   [list(link) for link in new[key]
+                                       if tuple(link) not in old_links],
+                'removed': [list(link) for link in old[key]
+                                       if tuple(link) not in new_links]
+            }
+    return delta
+
+
+def _workflow_delta(old, new):
+    ''' return the validity changes between two workflow documents, or None
+        if their structure differs
+    '''
+    old_valids = {}
+    new_valids = {}
+    if _strip_valid(old, old_valids) != _strip_valid(new, new_valids):
+        return None
+    valid = dict([(path, flag) for path, flag in new_valids.items()
+                               if old_valids.get(path) != flag])
+    return {'valid': valid} if valid else {}
+
+
+def _strip_valid(flow, valids):
+    ''' return a copy of workflow document flow without validity flags,
+        which are recorded in valids by pathname
+    '''
+    if isinstance(flow, list):
+        return [_strip_valid(entry, valids) for entry in flow]
+    entry = {}
+    for key, val in flow.items():
+        if key == 'valid':
+            valids[flow['pathname']] = val
+        elif key in ('driver', 'workflow'):
+            entry[key] = _strip_valid(val, valids)
+        else:
+            entry[key] = val
+    return entry
+
+
 class ConsoleServer(cmd.Cmd):
     ''' Object which knows how to load a model and provides a command line
         interface and various methods to access and modify that model.
@@ -62,6 +135,8 @@ class ConsoleServer(cmd.Cmd):
         self.exc_info = None
         self.publish_updates = publish_updates
         self._publish_comps = {}
+        self._flows = {}            # (kind, pathname) -> (stamp, flow, valids)
+        self._published_flows = {}  # kind -> (seq, last published flow)
 
         self._log_directory = os.getcwd()
         self._log_handler = None
@@ -102,8 +177,8 @@ class ConsoleServer(cmd.Cmd):
         '''
         try:
             publish('components', self.get_components())
-            publish('', {'Dataflow': self.get_dataflow('')})
-            publish('', {'Workflow': self.get_workflow('')})
+            self._publish_flow('Dataflow', _dataflow_delta)
+            self._publish_flow('Workflow', _workflow_delta)
         except Exception as err:
             self._error(err, sys.exc_info())
         else:
@@ -116,6 +191,28 @@ class ConsoleServer(cmd.Cmd):
                 else:
                     publish(pathname, comp.get_attributes(io_only=False))
 
+    def _publish_flow(self, kind, delta_func):
+        ''' publish the global dataflow or workflow. If a previous version
+            was published and the structure is largely unchanged, only the
+            changes are published, as a '<kind>Delta' message whose 'base'
+            is the sequence number of the version it applies to.
+        '''
+        flow = self._get_flow(kind, '')
+        published = self._published_flows.get(kind)
+        if published is None:
+            seq, delta = 0, None
+        else:
+            seq, old = published
+            delta = delta_func(old, flow)
+            if delta is not None and not delta:
+                return  # nothing changed
+        seq += 1
+        if delta is None:
+            publish('', {kind: jsonpickle.encode(flow), 'seq': seq})
+        else:
+            publish('', {kind+'Delta': delta, 'base': seq-1, 'seq': seq})
+        self._published_flows[kind] = (seq, copy.deepcopy(flow))
+
     def send_pub_msg(self, msg, topic):
         ''' publish the given message with the given topic
         '''
@@ -411,19 +508,52 @@ class ConsoleServer(cmd.Cmd):
                 self._error(err, sys.exc_info())
         return jsonpickle.encode(conns)
 
-    def get_dataflow(self, pathname):
-        ''' get the structure of the specified assembly, or of the global
-            namespace if no pathname is specified, consisting of the list of
-            components and the connections between them (i.e. the dataflow)
+    def _flow_stamp(self):
+        ''' return a stamp which changes whenever the structure of the model
+            (and hence of any dataflow or workflow document) may have changed
+        '''
+        return (ConfigGeneration.get(),
+                tuple([(k, id(v)) for k, v in self.proj.items()]))
+
+    def _get_flow(self, kind, pathname):
+        ''' get the dataflow or workflow document for pathname, rebuilding
+            it only if the model configuration has changed since it was last
+            built, otherwise just refreshing its validity flags
+        '''
+        key = (kind, pathname)
+        stamp = self._flow_stamp()
+        cached = self._flows.get(key)
+        if cached is not None and cached[0] == stamp:
+            flow, valids = cached[1:]
+            for entry, obj in valids:
+                entry['valid'] = obj.is_valid()
+        else:
+            if kind == 'Dataflow':
+                flow, valids = self._build_dataflow(pathname)
+            else:
+                flow, valids = self._build_workflow(pathname)
+            if valids is None:  # error, don't cache
+                self._flows.pop(key, None)
+            else:
+                self._flows[key] = (stamp, flow, valids)
+        return flow
+
+    def _build_dataflow(self, pathname):
+        ''' build the dataflow document for pathname, returns the document
+            and a list of (component entry, component) pairs
         '''
         dataflow = {}
+        valids = []
         if pathname and len(pathname) > 0:
             try:
                 asm, root = self.get_container(pathname)
                 if has_interface(asm, IAssembly):
                     dataflow = asm.get_dataflow()
+                    for comp in dataflow['components']:
+                        valids.append((comp, asm.get(comp['name'])))
             except Exception, err:
                 self._error(err, sys.exc_info())
+                valids = None
         else:
             components = []
             for k, v in self.proj.items():
@@ -437,15 +567,27 @@ class ConsoleServer(cmd.Cmd):
                                        'interfaces': inames,
                                        'python_id': id(v)
                                       })
+                    valids.append((components[-1], v))
             dataflow['components'] = components
             dataflow['connections'] = []
             dataflow['parameters'] = []
             dataflow['constraints'] = []
             dataflow['objectives'] = []
-        return jsonpickle.encode(dataflow)
+        return dataflow, valids
 
-    def get_workflow(self, pathname):
+    def get_dataflow(self, pathname):
+        ''' get the structure of the specified assembly, or of the global
+            namespace if no pathname is specified, consisting of the list of
+            components and the connections between them (i.e. the dataflow)
+        '''
+        return jsonpickle.encode(self._get_flow('Dataflow', pathname))
+
+    def _build_workflow(self, pathname):
+        ''' build the workflow document for pathname, returns the document
+            and a list of (workflow entry, component) pairs
+        '''
         flows = []
+        valids = []
         if pathname:
             drvr, root = self.get_container(pathname)
             # allow for request on the parent assembly
@@ -457,6 +599,7 @@ class ConsoleServer(cmd.Cmd):
                     flow = drvr.get_workflow()
                 except Exception, err:
                     self._error(err, sys.exc_info())
+                    return flows, None
                 flows.append(flow)
         else:
             for k, v in self.proj.items():
@@ -486,7 +629,24 @@ class ConsoleServer(cmd.Cmd):
                                 'valid':    comp.is_valid()
                               })
                     flows.append(flow)
-        return jsonpickle.encode(flows)
+        for flow in flows:
+            self._workflow_objects(flow, valids)
+        return flows, valids
+
+    def _workflow_objects(self, flow, valids):
+        ''' append (entry, component) pairs for the workflow entry and all
+            entries nested within it to valids
+        '''
+        comp, root = self.get_container(flow['pathname'], report=False)
+        if comp is not None:
+            valids.append((flow, comp))
+        if 'driver' in flow:
+            self._workflow_objects(flow['driver'], valids)
+        for entry in flow.get('workflow', []):
+            self._workflow_objects(entry, valids)
+
+    def get_workflow(self, pathname):
+        return jsonpickle.encode(self._get_flow('Workflow', pathname))
 
     def get_attributes(self, pathname):
         attr = {}
@@ -611,6 +771,7 @@ class ConsoleServer(cmd.Cmd):
             remove_class_factory(self.projdirfactory)
         if self.files:
             self.files.cleanup()
+        self._flows = {}
 
     def get_files(self):
         ''' get a nested dictionary of files
@@ -14,6 +14,61 @@ openmdao.DataflowFrame = function(id,model,pathname) {
 
     self.pathname = false;
 
+    // last dataflow received and its sequence number (for applying deltas)
+    var dataflow = null,
+        dataflow_seq = null;
+
+    /** apply changes published as a DataflowDelta to dataflow data */
+    function applyDelta(delta) {
+        var comps = {};
+        jQuery.each(dataflow.components, function(idx, comp) {
+            comps[comp.name] = comp;
+        });
+        if (delta.hasOwnProperty('added')) {
+            jQuery.each(delta.added, function(idx, comp) {
+                comps[comp.name] = comp;
+            });
+        }
+        if (delta.hasOwnProperty('components')) {
+            dataflow.components = jQuery.map(delta.components, function(name) {
+                return comps[name];
+            });
+        }
+        else if (delta.hasOwnProperty('added')) {
+            dataflow.components = jQuery.map(dataflow.components, function(comp) {
+                return comps[comp.name];
+            });
+        }
+        if (delta.hasOwnProperty('valid')) {
+            jQuery.each(delta.valid, function(name, valid) {
+                if (comps.hasOwnProperty(name)) {
+                    comps[name].valid = valid;
+                }
+            });
+        }
+        jQuery.each(['connections', 'parameters', 'constraints', 'objectives'],
+                    function(idx, key) {
+            if (delta.hasOwnProperty(key)) {
+                var removed = {},
+                    present = {};
+                jQuery.each(delta[key].removed, function(idx, link) {
+                    removed[link.join(' ')] = true;
+                });
+                dataflow[key] = jQuery.grep(dataflow[key], function(link) {
+                    return !removed.hasOwnProperty(link.join(' '));
+                });
+                jQuery.each(dataflow[key], function(idx, link) {
+                    present[link.join(' ')] = true;
+                });
+                jQuery.each(delta[key].added, function(idx, link) {
+                    if (!present.hasOwnProperty(link.join(' '))) {
+                        dataflow[key].push(link);
+                    }
+                });
+            }
+        });
+    }
+
     function handleMessage(message) {
         if (message.length !== 2 || message[0] !== self.pathname) {
             debug.warn('Invalid dataflow data for:',self.pathname,message);
@@ -21,12 +76,33 @@ openmdao.DataflowFrame = function(id,model,pathname) {
         }
         else {
             if (message[1].hasOwnProperty('Dataflow')) {
-                var dataflow = message[1].Dataflow;
+                dataflow = message[1].Dataflow;
                 if (typeof dataflow === 'string') {
                     dataflow = jQuery.parseJSON(dataflow);
                 }
+                dataflow_seq = message[1].hasOwnProperty('seq') ? message[1].seq : null;
                 pane.loadData(dataflow);
             }
+            else if (message[1].hasOwnProperty('DataflowDelta')) {
+                if (dataflow !== null && message[1].base === dataflow_seq) {
+                    applyDelta(message[1].DataflowDelta);
+                    dataflow_seq = message[1].seq;
+                    pane.loadData(dataflow);
+                }
+                else {
+                    // missed an update, get the current dataflow
+                    var seq = message[1].seq;
+                    model.getDataflow(self.pathname, function(json) {
+                            dataflow = json;
+                            dataflow_seq = seq;
+                            pane.loadData(dataflow);
+                        },
+                        function(jqXHR, textStatus, errorThrown) {
+                            debug.error('Error getting dataflow for',self.pathname,jqXHR);
+                        }
+                    );
+                }
+            }
         }
     }
 
@@ -47,6 +123,7 @@ openmdao.DataflowFrame = function(id,model,pathname) {
                 model.removeListener(self.pathname, handleMessage);
             }
             self.pathname = path;
+            dataflow = dataflow_seq = null;
             self.setTitle('Dataflow: '+path);
             pane.showDataflow(path);
             model.addListener(path,handleMessage);
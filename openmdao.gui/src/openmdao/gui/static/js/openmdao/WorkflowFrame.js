@@ -14,6 +14,28 @@ openmdao.WorkflowFrame = function(id,model,pathname) {
 
     self.pathname = false;
 
+    // last workflow received and its sequence number (for applying deltas)
+    var workflow = null,
+        workflow_seq = null;
+
+    /** apply validity changes published as a WorkflowDelta to workflow data */
+    function setValid(flows, valid) {
+        if (!jQuery.isArray(flows)) {
+            flows = [flows];
+        }
+        jQuery.each(flows, function(idx, flow) {
+            if (valid.hasOwnProperty(flow.pathname)) {
+                flow.valid = valid[flow.pathname];
+            }
+            if (flow.hasOwnProperty('driver')) {
+                setValid(flow.driver, valid);
+            }
+            if (flow.hasOwnProperty('workflow')) {
+                setValid(flow.workflow, valid);
+            }
+        });
+    }
+
     function handleMessage(message) {
         if (message.length !== 2 || message[0] !== self.pathname) {
             debug.warn('Invalid component data for:',self.pathname,message);
@@ -21,12 +43,33 @@ openmdao.WorkflowFrame = function(id,model,pathname) {
         }
         else {
             if (message[1].hasOwnProperty('Workflow')) {
-                var workflow = message[1].Workflow;
+                workflow = message[1].Workflow;
                 if (typeof workflow === 'string') {
                     workflow = jQuery.parseJSON(workflow);
                 }
+                workflow_seq = message[1].hasOwnProperty('seq') ? message[1].seq : null;
                 pane.loadData(workflow);
             }
+            else if (message[1].hasOwnProperty('WorkflowDelta')) {
+                if (workflow !== null && message[1].base === workflow_seq) {
+                    setValid(workflow, message[1].WorkflowDelta.valid);
+                    workflow_seq = message[1].seq;
+                    pane.loadData(workflow);
+                }
+                else {
+                    // missed an update, get the current workflow
+                    var seq = message[1].seq;
+                    model.getWorkflow(self.pathname, function(json) {
+                            workflow = json;
+                            workflow_seq = seq;
+                            pane.loadData(workflow);
+                        },
+                        function(jqXHR, textStatus, errorThrown) {
+                            debug.error('Error getting workflow for',self.pathname,jqXHR);
+                        }
+                    );
+                }
+            }
         }
     }
 
@@ -47,6 +90,7 @@ openmdao.WorkflowFrame = function(id,model,pathname) {
                 model.removeListener(self.pathname, handleMessage);
             }
             self.pathname = path;
+            workflow = workflow_seq = null;
             self.setTitle('Workflow: '+path);
             pane.showWorkflow(path);
             model.addListener(path,handleMessage);
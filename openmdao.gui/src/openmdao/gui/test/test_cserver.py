@@ -5,7 +5,8 @@ import json
 import time
 import tempfile
 
-from openmdao.gui.consoleserver import ConsoleServer
+from openmdao.gui.consoleserver import ConsoleServer, _dataflow_delta, \
+                                       _workflow_delta
 from openmdao.main.publisher import Publisher
 from openmdao.main.project import project_from_archive
 
@@ -225,6 +226,53 @@ class ConsoleServerTestCase(unittest.TestCase):
         self.assertEqual(workflow[0]['pathname'], 'prob.p')
         self.assertEqual(workflow[0]['type'], 'paraboloid.Paraboloid')
 
+        # cached dataflow is rebuilt when the configuration changes
+        self.cserver.add_component('p2', 'paraboloid.Paraboloid', 'prob')
+        dataflow = json.loads(self.cserver.get_dataflow('prob'))
+        self.assertEqual(len(dataflow['components']), 3)
+        self.cserver.onecmd('prob.connect("p.f_xy", "p2.x")')
+        dataflow = json.loads(self.cserver.get_dataflow('prob'))
+        self.assertEqual(dataflow['connections'], [['p.f_xy', 'p2.x']])
+        self.cserver.onecmd('prob.driver.workflow.add("p2")')
+        driver_flow = json.loads(self.cserver.get_workflow('prob.driver'))[0]
+        self.assertEqual(len(driver_flow['workflow']), 2)
+
+    def test_flow_deltas(self):
+        comp_a = {'name': 'a', 'pathname': 'a', 'type': 'A', 'valid': True,
+                  'interfaces': [], 'python_id': 1}
+        comp_b = {'name': 'b', 'pathname': 'b', 'type': 'B', 'valid': True,
+                  'interfaces': [], 'python_id': 2}
+        old = {'components': [comp_a], 'connections': [['a.x', 'a.y']],
+               'parameters': [], 'constraints': [], 'objectives': []}
+        self.assertEqual(_dataflow_delta(old, old), {})
+
+        new = {'components': [dict(comp_a, valid=False), comp_b],
+               'connections': [['a.y', 'b.x']],
+               'parameters': [], 'constraints': [], 'objectives': []}
+        self.assertEqual(_dataflow_delta(old, new),
+                         {'components': ['a', 'b'],
+                          'added': [comp_b],
+                          'valid': {'a': False},
+                          'connections': {'added': [['a.y', 'b.x']],
+                                          'removed': [['a.x', 'a.y']]}})
+
+        # replaced component
+        new = dict(old, components=[dict(comp_a, python_id=3)])
+        self.assertEqual(_dataflow_delta(old, new),
+                         {'added': new['components']})
+
+        old = [{'pathname': 'top.driver', 'type': 'D', 'valid': True,
+                'workflow': [{'pathname': 'top.c', 'type': 'C',
+                              'valid': True}]}]
+        new = [{'pathname': 'top.driver', 'type': 'D', 'valid': False,
+                'workflow': [{'pathname': 'top.c', 'type': 'C',
+                              'valid': False}]}]
+        self.assertEqual(_workflow_delta(old, old), {})
+        self.assertEqual(_workflow_delta(old, new),
+                         {'valid': {'top.driver': False, 'top.c': False}})
+        new[0]['workflow'] = []
+        self.assertEqual(_workflow_delta(old, new), None)
+
     def test_execfile(self):
         ''' execfile an input file (with a __main__) and make sure you
             can save the project without any errors
@@ -13,6 +13,8 @@ from tornado import httpserver, web, websocket
 
 import jsonpickle
 
+from openmdao.main.publisher import decode_message
+
 debug = True
 
 
@@ -63,13 +65,14 @@ class ZMQStreamHandler(websocket.WebSocketHandler):
             message = make_unicode(message)  # tornado websocket wants unicode
             self.write_message(message)
 
-        elif len(message) == 2:
+        elif len(message) in (2, 3):
             topic = message[0]
-            content = message[1]
 
             # package topic and content into a single json object
             try:
-                content = jsonpickle.decode(content)
+                topic, content = decode_message(message)
+                if hasattr(content, 'tolist'):  # binary numpy array
+                    content = content.tolist()
                 message = jsonpickle.encode([topic, content])
             except Exception as err:
                 exc_type, exc_value, exc_traceback = sys.exc_info()
@@ -1,10 +1,16 @@
 
+import numpy
+
 from openmdao.main.case import Case
 from openmdao.main.interfaces import implements, ICaseRecorder, ICaseIterator
 
 class CaseArray(object):
     """A CaseRecorder/CaseIterator containing Cases having the same set of
     input/output strings but different data. Cases are not necessarily unique.
+
+    Case data is kept both as rows and as per-variable columns, with a
+    name-to-column index and a hash index over rows, so that retrieving all
+    values of a variable and testing membership don't require a scan.
     """
     
     implements(ICaseIterator, ICaseRecorder)
@@ -32,10 +38,11 @@ class CaseArray(object):
         """
         self._parent_uuid = parent_uuid
         if names is None:
-            self._names = []
+            self._set_names([])
         else:
-            self._names = names[:]
+            self._set_names(names[:])
         self._values = []
+        self._reset_index()
         if isinstance(obj, dict):
             self._add_dict_cases(obj)
         elif isinstance(obj, Case):
@@ -48,9 +55,98 @@ class CaseArray(object):
     def copy(self):
         ca = CaseArray(parent_uuid=self._parent_uuid, names=self._names)
         ca._values = self._values[:]
+        ca._counts = None if self._counts is None else self._counts.copy()
         ca._split_idx = self._split_idx
         return ca
-        
+
+    def __getstate__(self):
+        """Don't pickle the indices, they're rebuilt on load."""
+        state = self.__dict__.copy()
+        for name in ('_name_idx', '_columns', '_arrays', '_counts'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._set_names(self._names)
+        self._rebuild_index()
+
+    def _set_names(self, names):
+        """Set the variable names and their column index."""
+        self._names = names
+        self._name_idx = dict((name, i) for i, name in enumerate(names))
+        self._columns = None
+
+    def _reset_index(self):
+        """Reset row and column indices for empty contents."""
+        self._columns = None  # Built on demand.
+        self._arrays = {}
+        self._counts = {}     # Row -> number of occurrences.
+
+    def _rebuild_index(self):
+        """Rebuild row and column indices from :attr:`_values`."""
+        values = self._values
+        self._reset_index()
+        self._values = []
+        for vals in values:
+            self._append(vals)
+
+    def _removed(self, vals):
+        """Update indices after the row `vals` was removed."""
+        self._columns = None
+        if self._arrays:
+            self._arrays = {}
+        counts = self._counts
+        if counts is not None:
+            key = tuple(vals)
+            count = counts[key] - 1
+            if count:
+                counts[key] = count
+            else:
+                del counts[key]
+
+    def _append(self, vals):
+        """Append a row of values and update indices."""
+        self._values.append(vals)
+        if self._columns is not None:
+            for column, val in zip(self._columns, vals):
+                column.append(val)
+        if self._arrays:
+            self._arrays = {}
+        counts = self._counts
+        if counts is not None:
+            try:
+                key = tuple(vals)
+                counts[key] = counts.get(key, 0) + 1
+            except TypeError:  # Unhashable value, fall back to scanning.
+                self._counts = None
+
+    def _get_column(self, name):
+        """Return the (internal) list of values for `name`."""
+        try:
+            idx = self._name_idx[name]
+        except KeyError:
+            raise KeyError("CaseSet has no input or outputs named %s" % name)
+        if self._columns is None:
+            if self._values:
+                self._columns = [list(column) for column in zip(*self._values)]
+            else:
+                self._columns = [[] for name in self._names]
+        return self._columns[idx]
+
+    def get_array(self, name):
+        """Return a read-only :class:`numpy.ndarray` of all of the recorded
+        values for `name`. The array is cached until the contents of this
+        container change.
+        """
+        try:
+            return self._arrays[name]
+        except KeyError:
+            arr = numpy.array(self._get_column(name))
+            arr.flags.writeable = False
+            self._arrays[name] = arr
+            return arr
+
     def remove(self, case):
         """Remove the given Case from this CaseArray."""
         try:
@@ -58,6 +154,7 @@ class CaseArray(object):
         except KeyError:
             raise KeyError("Case to be removed is not a member of this CaseArray")
         self._values.remove(values)
+        self._removed(values)
 
     def _add_dict_cases(self, dct):
         length = -1
@@ -66,7 +163,7 @@ class CaseArray(object):
                 if name not in dct:
                     raise KeyError("'%s' is not a member of the dict" % name)
         else:
-            self._names = dct.keys()
+            self._set_names(dct.keys())
         self._split_idx = len(self._names) # treat all names as inputs
         biglist = []
         for key in self._names:
@@ -80,6 +177,7 @@ class CaseArray(object):
                                  "from number of other values (%d) in CaseSet" % length)
             biglist.append(val)
         self._values = []
+        self._reset_index()
         if length > 0:
             idxs = range(len(self._names))
             for i in range(length):
@@ -105,7 +203,7 @@ class CaseArray(object):
             names.extend(case.keys(iotype='out'))
             tmp.extend(case.values(iotype='out'))
 
-        self._names = names
+        self._set_names(names)
         self._add_values(tmp)
         
     def record(self, case):
@@ -133,11 +231,7 @@ class CaseArray(object):
         case.
         """
         if isinstance(key, basestring): # return all of the values for the given name
-            try: 
-                idx = self._names.index(key)
-            except ValueError as err: 
-                raise KeyError("CaseSet has no input or outputs named %s"%key )
-            return [lst[idx] for lst in self._values]
+            return list(self._get_column(key))
         else:  # key is the case numbe
             return self._case_from_values(self._values[key])
         
@@ -160,7 +254,7 @@ class CaseArray(object):
             raise KeyError("input or output is missing from case: %s" % str(err))
         
     def _add_values(self, vals):
-        self._values.append(vals)
+        self._append(vals)
 
     def __len__(self):
         return len(self._values)
@@ -172,6 +266,11 @@ class CaseArray(object):
             values = self._get_case_data(case)
         except KeyError:
             return False
+        if self._counts is not None:
+            try:
+                return tuple(values) in self._counts
+            except TypeError:
+                pass
         for val in self._values:
             if val == values:
                 return True
@@ -182,6 +281,7 @@ class CaseArray(object):
         variables intact.
         """
         self._values = []
+        self._reset_index()
 
     def update(self, *case_containers):
         """Add Cases from other CaseSets or CaseArrays to this one."""
@@ -190,7 +290,9 @@ class CaseArray(object):
                 self.record(case)
                 
     def pop(self, idx=-1):
-        return self._case_from_values(self._values.pop(idx))
+        values = self._values.pop(idx)
+        self._removed(values)
+        return self._case_from_values(values)
                 
     def _check_compatability(self, case_container):
         if self._names != case_container._names:
@@ -235,11 +337,15 @@ class CaseSet(CaseArray):
         cs._split_idx = self._split_idx
         return cs
         
+    def _reset_index(self):
+        super(CaseSet, self)._reset_index()
+        self._counts = None  # _tupset serves as the row index.
+
     def _add_values(self, vals):
         tup = tuple(vals)
         if tup not in self._tupset:
             self._tupset.add(tup)
-            self._values.append(tup)
+            self._append(tup)
 
     def __contains__(self, case):
         if not isinstance(case, Case):
@@ -252,7 +358,7 @@ class CaseSet(CaseArray):
     
     def _make_case_set(self, tupset):
         cs = CaseSet(parent_uuid=self._parent_uuid)
-        cs._names = self._names[:]
+        cs._set_names(self._names[:])
         cs._values = list(tupset)
         cs._tupset = tupset
         cs._split_idx = self._split_idx
@@ -321,6 +427,7 @@ class CaseSet(CaseArray):
 
     def pop(self, idx=-1):
         vals = self._values.pop(idx)
+        self._removed(vals)
         self._tupset.remove(vals)
         return self._case_from_values(vals)
                 
@@ -331,6 +438,7 @@ class CaseSet(CaseArray):
             raise KeyError("Case to be removed is not a member of this CaseSet")
         self._tupset.remove(values)
         self._values.remove(values)
+        self._removed(values)
 
     def __eq__(self, caseset):
         self._check_compatability(caseset)
@@ -94,6 +94,7 @@ class DBCaseIterator(object):
             varcur.execute(combined % cid)
             inputs = []
             outputs = []
+            timing = {}
             for var_id, vname, case_id, sense, value in varcur:
                 if not isinstance(value, (float,int,str)):
                     try:
@@ -103,12 +104,17 @@ class DBCaseIterator(object):
                                               (vname, cname, str(err)))
                 if sense=='i':
                     inputs.append((vname, value))
+                elif sense=='t':
+                    timing[vname] = value
                 else:
                     outputs.append((vname, value))
             if len(inputs) > 0 or len(outputs) > 0:
-                yield Case(inputs=inputs, outputs=outputs,
-                           retries=retries,msg=msg,label=label,
-                           case_uuid=text_id, parent_uuid=parent)
+                case = Case(inputs=inputs, outputs=outputs,
+                            retries=retries,msg=msg,label=label,
+                            case_uuid=text_id, parent_uuid=parent)
+                if timing:
+                    case.timing = timing
+                yield case
 
     def get_attributes(self, io_only=True):
         """ We need a custom get_attributes because we aren't using Traits to
@@ -143,6 +149,7 @@ class DBCaseIterator(object):
 class DBCaseRecorder(object):
     """Records Cases to a relational DB (sqlite). Values other than floats,
     ints or strings are pickled and are opaque to SQL queries.
+    A case's `timing` entries are stored as variables with a sense of 't'.
     """
     
     implements(ICaseRecorder)
@@ -193,11 +200,20 @@ class DBCaseRecorder(object):
     
     def record(self, case):
         """Record the given Case."""
+        self.record_many([case])
+
+    def record_many(self, cases):
+        """Record the given Cases, committing once at the end."""
         if self._connection is None:
             raise RuntimeError('Attempt to record on closed recorder')
 
         cur = self._connection.cursor()
-        
+        for case in cases:
+            self._insert(cur, case)
+        self._connection.commit()
+
+    def _insert(self, cur, case):
+        """Insert `case` into the tables using cursor `cur`."""
         cur.execute("""insert into cases(id,uuid,parent,label,msg,retries,model_id,timeEnter) 
                            values (?,?,?,?,?,?,?,DATETIME('NOW'))""", 
                                      (None, case.uuid, case.parent_uuid, case.label,
@@ -221,7 +237,10 @@ class DBCaseRecorder(object):
                 v = (None, name, case_id, 'o', sqlite3.Binary(dumps(value,HIGHEST_PROTOCOL)))
             cur.execute("insert into casevars(var_id,name,case_id,sense,value) values(?,?,?,?,?)", 
                         v)
-        self._connection.commit()
+        if case.timing:
+            for name,value in sorted(case.timing.items()):
+                cur.execute("insert into casevars(var_id,name,case_id,sense,value) values(?,?,?,?,?)", 
+                            (None, name, case_id, 't', value))
     
     def close(self):
         """Commit and close DB connection if not using ``:memory:``."""
@@ -270,7 +289,7 @@ def list_db_vars(dbname):
     """
     connection = sqlite3.connect(dbname)
     varcur = connection.cursor()
-    varcur.execute("SELECT name from casevars")
+    varcur.execute("SELECT name from casevars WHERE sense!='t'")
     varnames = set([v for v in varcur])
     return varnames
 
@@ -318,7 +337,7 @@ def case_db_to_dict(dbname, varnames, case_sql='', var_sql='', include_errors=Fa
     casecur = connection.cursor()
     casecur.execute(' '.join(sql))
     
-    sql = ["SELECT name, value from casevars WHERE case_id=%s"]
+    sql = ["SELECT name, value from casevars WHERE case_id=%s AND sense!='t'"]
     vars_added = False
     for i,name in enumerate(vardict.keys()):
         if i==0:
@@ -42,6 +42,10 @@ class ListCaseRecorder(object):
         """Store the case in our internal list."""
         self.cases.append(case)
 
+    def record_many(self, cases):
+        """Store `cases` in our internal list."""
+        self.cases.extend(cases)
+
     def close(self):
         """Does nothing."""
         return
@@ -1,3 +1,4 @@
+import cPickle
 import unittest
 
 from openmdao.main.api import Case
@@ -76,6 +77,47 @@ class CaseArrayTestCase(unittest.TestCase):
         self.assertTrue(self.case1_dup in ca)
         self.assertFalse(self.case2 in ca)
         self.assertFalse(None in ca)
+
+    def test_remove(self):
+        ca = CaseArray()
+        ca.record(self.case1)
+        ca.record(self.case2)
+        ca.record(self.case1_dup)
+        ca.remove(self.case1)
+        self.assertEqual(2, len(ca))
+        self.assertTrue(self.case1 in ca)
+        ca.remove(self.case1)
+        self.assertFalse(self.case1 in ca)
+        self.assertRaises(ValueError, ca.remove, self.case1)
+        self.assertEqual(ca['comp1.b'], [9])
+        
+    def test_columns(self):
+        ca = CaseArray({'x': [1., 2., 3.], 'y': [4., 5., 6.]})
+        self.assertEqual(ca['x'], [1., 2., 3.])
+        arr = ca.get_array('y')
+        self.assertEqual(list(arr), [4., 5., 6.])
+        self.assertTrue(ca.get_array('y') is arr)
+        self.assertRaises(ValueError, arr.__setitem__, 0, 7.)
+        self.assertRaises(KeyError, ca.__getitem__, 'z')
+
+        ca.record(Case(inputs=[('x', 7.), ('y', 8.)]))
+        self.assertEqual(ca['x'], [1., 2., 3., 7.])
+        self.assertEqual(list(ca.get_array('y')), [4., 5., 6., 8.])
+        ca.pop(0)
+        self.assertEqual(ca['x'], [2., 3., 7.])
+        self.assertEqual(list(ca.get_array('y')), [5., 6., 8.])
+        ca.clear()
+        self.assertEqual(ca['x'], [])
+
+    def test_pickle(self):
+        ca = CaseArray()
+        ca.record(self.case1)
+        ca.record(self.case2)
+        ca['comp1.b']
+        ca2 = cPickle.loads(cPickle.dumps(ca, -1))
+        self.assertEqual(ca2['comp1.b'], [8, 9])
+        self.assertTrue(self.case1 in ca2)
+        self.assertFalse('_columns' in ca.__getstate__())
         
 
 class CaseSetTestCase(unittest.TestCase):
@@ -238,6 +280,20 @@ class CaseSetTestCase(unittest.TestCase):
         self.assertTrue(self.case1_dup in cs)
         self.assertFalse(self.case2 in cs)
         self.assertFalse(None in cs)
+
+    def test_columns(self):
+        cs = CaseSet()
+        for case in self.caselist:
+            cs.record(case)
+        self.assertEqual(cs['comp1.b'], [8, 9, 10, 11, 12, 13, 14])
+        self.assertEqual(list(cs.get_array('comp1.b')),
+                         [8, 9, 10, 11, 12, 13, 14])
+        cs.remove(self.case2)
+        self.assertEqual(cs['comp1.b'], [8, 10, 11, 12, 13, 14])
+        self.assertFalse(self.case2 in cs)
+        other = cs.copy()
+        other.pop()
+        self.assertEqual(sorted((cs - other)['comp1.b']), [14])
         
     def test_update_empty(self):
         c1 = Case(inputs=[('x',10),], outputs=[('y',10)])
@@ -105,6 +105,27 @@ class DBCaseRecorderTestCase(unittest.TestCase):
             self.assertEqual(case['comp1.y'], i*2.)
             self.assertEqual(case['comp1.z'], i*1.5)
             
+    def test_record_many(self):
+        recorder = DBCaseRecorder()
+        cases = [Case(inputs=[('comp1.x', i)], outputs=[('comp1.z', i*1.5)],
+                      label='case%s'%i) for i in range(10)]
+        recorder.record_many(cases)
+        for i,case in enumerate(recorder.get_iterator()):
+            self.assertEqual(case.label, 'case%s'%i)
+            self.assertEqual(case['comp1.z'], i*1.5)
+        self.assertEqual(i, 9)
+
+    def test_timing(self):
+        recorder = DBCaseRecorder()
+        case = Case(inputs=[('comp1.x', 1)], outputs=[('comp1.z', 1.5)])
+        case.timing = dict(queue=0.5, execute=2.)
+        recorder.record(case)
+        recorder.record(Case(inputs=[('comp1.x', 2)]))
+        cases = list(recorder.get_iterator())
+        self.assertEqual(cases[0].timing, dict(queue=0.5, execute=2.))
+        self.assertEqual(cases[0].items(), case.items())
+        self.assertEqual(cases[1].timing, None)
+
     def test_query(self):
         recorder = DBCaseRecorder()
         for i in range(10):
@@ -2,7 +2,8 @@
 
 import logging
 try:
-    from numpy import exp, abs, pi
+    from numpy import exp, abs, pi, asarray, broadcast_arrays, maximum, \
+                      sqrt, vectorize, where
 except ImportError as err:
     logging.warn("In %s: %r" % (__file__, err))
 _check = ['numpy']
@@ -15,6 +16,14 @@ except ImportError as err:
     except ImportError as err:
         logging.warn("In %s: %r" % (__file__, err))
         _check.append('scipy')
+try:
+    # array version of erf, used by the batch functions below
+    from scipy.special import erf as _array_erf
+except ImportError:
+    try:
+        _array_erf = vectorize(erf, otypes=[float])
+    except NameError:
+        pass
 
 from openmdao.main.datatypes.api import Slot, Str, Float
 from openmdao.lib.casehandlers.api import CaseSet
@@ -24,6 +33,69 @@ from openmdao.util.decorators import stub_if_missing_deps
 
 from openmdao.main.uncertain_distributions import NormalDistribution
 
+
+def norm_cdf(z):
+    """Standard normal cumulative distribution function, evaluated
+    element-wise on an array."""
+    return 0.5 + 0.5*_array_erf(asarray(z, dtype=float)/sqrt(2.))
+
+def norm_pdf(z):
+    """Standard normal probability density function, evaluated
+    element-wise on an array."""
+    z = asarray(z, dtype=float)
+    return exp(-0.5*z*z)/sqrt(2.*pi)
+
+def _batch_args(target, mu, sigma):
+    target, mu, sigma = broadcast_arrays(asarray(target, dtype=float),
+                                         asarray(mu, dtype=float),
+                                         asarray(sigma, dtype=float))
+    ok = sigma > 0.
+    return target, mu, where(ok, sigma, 1.), ok
+
+def probability_of_improvement(target, mu, sigma):
+    """Returns the probability that a normally distributed prediction
+    improves on (is less than) `target`.
+    
+    target: float or array
+        Current best value of the criteria.
+        
+    mu: float or array
+        Predicted mean at each candidate point.
+        
+    sigma: float or array
+        Predicted standard deviation at each candidate point.
+    
+    The arguments are broadcast against each other, so thousands of
+    candidate points can be evaluated in one call. Points with zero sigma
+    have a PI of 1.0 if `mu` is below `target` and 0.0 otherwise.
+    """
+    target, mu, sigma, ok = _batch_args(target, mu, sigma)
+    pi = where(ok, norm_cdf((target-mu)/sigma), (mu < target).astype(float))
+    return pi[()]  # Scalar if all arguments were scalars.
+
+def expected_improvement(target, mu, sigma):
+    """Returns the expected amount by which a normally distributed
+    prediction improves on (is less than) `target`.
+    
+    target: float or array
+        Current best value of the criteria.
+        
+    mu: float or array
+        Predicted mean at each candidate point.
+        
+    sigma: float or array
+        Predicted standard deviation at each candidate point.
+    
+    The arguments are broadcast against each other, so thousands of
+    candidate points can be evaluated in one call. Points with zero sigma
+    have an EI of ``max(target-mu, 0)``.
+    """
+    target, mu, sigma, ok = _batch_args(target, mu, sigma)
+    diff = target-mu
+    z = diff/sigma
+    ei = where(ok, diff*norm_cdf(z) + sigma*norm_pdf(z), maximum(diff, 0.))
+    return ei[()]  # Scalar if all arguments were scalars.
+
 @stub_if_missing_deps(*_check)
 class ExpectedImprovement(Component):
     best_case = Slot(CaseSet, iotype="in",
@@ -3,19 +3,11 @@
 import logging
 
 try:
-    from numpy import exp, pi, array, isnan, diag, random
+    from numpy import array, asarray, isnan, random, zeros, sqrt, \
+                      concatenate, inf, errstate, newaxis, diag
 except ImportError as err:
     logging.warn("In %s: %r" % (__file__, err))
 _check=['numpy']
-try:
-    from math import erf
-except ImportError as err:
-    logging.warn("In %s: %r" % (__file__, err))
-    try:
-        from scipy.special import erf
-    except ImportError as err:
-        logging.warn("In %s: %r" % (__file__, err))
-        _check.append('scipy')
 
 from openmdao.lib.datatypes.api import Slot, Enum, Float, Array, Event, Int
 
@@ -24,6 +16,189 @@ from openmdao.util.decorators import stub_if_missing_deps
 
 from openmdao.lib.casehandlers.api import CaseSet
 from openmdao.main.uncertain_distributions import NormalDistribution
+from openmdao.lib.components.expected_improvement import norm_cdf, norm_pdf, \
+                                                         _check as _ei_check
+_check.extend([dep for dep in _ei_check if dep not in _check])
+
+def _batch_args(y_star, mu, sigma):
+    """Returns the front as an (M, k) array and mu and sigma as (N, k)
+    arrays."""
+    y_star = asarray(y_star, dtype=float)
+    mu = asarray(mu, dtype=float)
+    sigma = asarray(sigma, dtype=float)
+    ncols = y_star.shape[-1]
+    return (y_star.reshape(-1, ncols), mu.reshape(-1, ncols),
+            sigma.reshape(-1, ncols))
+
+def _phis(y_star, mu, sigma, col):
+    """Returns (N, M) arrays of the normal cdf and pdf of each front
+    coordinate `col` relative to the distribution at each candidate point.
+    """
+    z = (y_star[newaxis, :, col]-mu[:, col, newaxis])/sigma[:, col, newaxis]
+    return norm_cdf(z), norm_pdf(z)
+
+def pi_2obj(y_star, mu, sigma):
+    """Calculates the bi-objective probability of improvement over a
+    Pareto front for a batch of candidate points.
+    
+    y_star: array (M, 2)
+        Pareto front, sorted on the first objective.
+        
+    mu: array (N, 2)
+        Predicted means of the two responses at each candidate point.
+        
+    sigma: array (N, 2)
+        Predicted standard deviations of the two responses at each
+        candidate point.
+        
+    Returns an array of N probabilities.
+    """
+    y_star, mu, sigma = _batch_args(y_star, mu, sigma)
+    with errstate(divide='ignore', invalid='ignore'):
+        cdf0 = _phis(y_star, mu, sigma, 0)[0]
+        cdf1 = _phis(y_star, mu, sigma, 1)[0]
+    
+        pi1 = cdf0[:, 0]
+        pi2 = ((cdf0[:, 1:]-cdf0[:, :-1])*cdf1[:, 1:]).sum(axis=1)
+        pi3 = (1.-cdf0[:, -1])*cdf1[:, -1]
+    return pi1 + pi2 + pi3
+
+def ei_2obj(y_star, mu, sigma, pi=None):
+    """Calculates the bi-objective expected improvement over a Pareto front
+    for a batch of candidate points. The improvement is measured as the
+    distance from the centroid of the improvement region to the closest
+    point of the front.
+    
+    y_star: array (M, 2)
+        Pareto front, sorted on the first objective.
+        
+    mu: array (N, 2)
+        Predicted means of the two responses at each candidate point.
+        
+    sigma: array (N, 2)
+        Predicted standard deviations of the two responses at each
+        candidate point.
+        
+    pi: array (N,) (optional)
+        Probabilities of improvement, as returned by :func:`pi_2obj`.
+        They are calculated if not given.
+        
+    Returns an array of N expected improvements.
+    """
+    y_star, mu, sigma = _batch_args(y_star, mu, sigma)
+    if pi is None:
+        pi = pi_2obj(y_star, mu, sigma)
+    pi = asarray(pi, dtype=float)
+    
+    with errstate(divide='ignore', invalid='ignore'):
+        cdf0, pdf0 = _phis(y_star, mu, sigma, 0)
+        cdf1, pdf1 = _phis(y_star, mu, sigma, 1)
+        
+        # partial first moments of each response below each front coordinate
+        g0 = mu[:, 0, newaxis]*cdf0 - sigma[:, 0, newaxis]*pdf0
+        g1 = mu[:, 1, newaxis]*cdf1 - sigma[:, 1, newaxis]*pdf1
+    
+        ybar1 = (g0[:, 0] + ((g0[:, 1:]-g0[:, :-1])*cdf1[:, 1:]).sum(axis=1)
+                 + g0[:, -1]*cdf1[:, -1])/pi
+        ybar2 = (g1[:, 0] + ((g1[:, 1:]-g1[:, :-1])*cdf0[:, 1:]).sum(axis=1)
+                 + g1[:, -1]*cdf0[:, -1])/pi
+    
+        dists = sqrt((ybar1[:, newaxis]-y_star[newaxis, :, 0])**2 +
+                     (ybar2[:, newaxis]-y_star[newaxis, :, 1])**2)
+        ei = pi*dists.min(axis=1)
+    ei[isnan(ei)] = 0.
+    return ei
+
+def hypervolume_ei_2obj(y_star, mu, sigma, ref_point):
+    """Calculates the exact expected improvement of the hypervolume
+    dominated by a bi-objective Pareto front (minimization) for a batch of
+    candidate points with independent normally distributed responses.
+    
+    y_star: array (M, 2)
+        Pareto front. It doesn't need to be sorted.
+        
+    mu: array (N, 2)
+        Predicted means of the two responses at each candidate point.
+        
+    sigma: array (N, 2)
+        Predicted standard deviations of the two responses at each
+        candidate point. All must be greater than zero.
+        
+    ref_point: array (2,)
+        Reference point bounding the hypervolume. Points of the front that
+        don't dominate it are ignored.
+        
+    Returns an array of N expected hypervolume improvements.
+    """
+    y_star, mu, sigma = _batch_args(y_star, mu, sigma)
+    ref = asarray(ref_point, dtype=float)
+    
+    y_star = y_star[(y_star < ref).all(axis=1)]
+    y_star = y_star[y_star[:, 0].argsort()]
+    
+    # The non-dominated region is split into vertical strips
+    # [a[i], a[i+1]) x (-inf, b[i]), where a are the first coordinates of the
+    # front bracketed by -inf and ref[0], and b are the second coordinates
+    # preceded by ref[1].
+    a = concatenate(([-inf], y_star[:, 0], [ref[0]]))
+    b = concatenate(([ref[1]], y_star[:, 1]))
+    
+    m0, s0 = mu[:, 0, newaxis], sigma[:, 0, newaxis]
+    m1, s1 = mu[:, 1, newaxis], sigma[:, 1, newaxis]
+    
+    z_lo = (a[newaxis, :-1]-m0)/s0
+    z_hi = (a[newaxis, 1:]-m0)/s0
+    cdf_lo, pdf_lo = norm_cdf(z_lo), norm_pdf(z_lo)
+    cdf_hi, pdf_hi = norm_cdf(z_hi), norm_pdf(z_hi)
+    
+    # E[(a[i+1] - max(y1, a[i]))+]
+    width = zeros(a.shape[0]-1)
+    width[1:] = a[2:]-a[1:-1]
+    upper = a[newaxis, 1:]-m0
+    e1 = (width*cdf_lo + s0*(pdf_hi-pdf_lo) + upper*(cdf_hi-cdf_lo))
+    
+    # E[(b[i] - y2)+]
+    z_b = (b[newaxis, :]-m1)/s1
+    e2 = (b[newaxis, :]-m1)*norm_cdf(z_b) + s1*norm_pdf(z_b)
+    
+    return (e1*e2).sum(axis=1)
+
+def pi_nobj(y_star, mu, sigma, n=1000, rand=None):
+    """Estimates the probability of improvement over a Pareto front with any
+    number of objectives by Monte Carlo sampling, for a batch of candidate
+    points. A sample improves on the front if no point of the front is
+    strictly better in every objective.
+    
+    y_star: array (M, k)
+        Pareto front.
+        
+    mu: array (N, k)
+        Predicted means of the responses at each candidate point.
+        
+    sigma: array (N, k)
+        Predicted standard deviations of the responses at each candidate
+        point.
+        
+    n: int
+        Number of samples per candidate point.
+        
+    rand: numpy.random.RandomState (optional)
+        Source of the samples. The global numpy generator is used if not
+        given.
+        
+    Returns an array of N probabilities.
+    """
+    y_star, mu, sigma = _batch_args(y_star, mu, sigma)
+    if rand is None:
+        rand = random
+    pi = zeros(mu.shape[0])
+    for i in range(mu.shape[0]):
+        samples = rand.multivariate_normal(mu[i], diag(sigma[i]**2), n)
+        dominated = zeros(n, dtype=bool)
+        for par_point in y_star:
+            dominated |= (par_point < samples).all(axis=1)
+        pi[i] = 1. - dominated.sum()/float(n)
+    return pi
 
 
 @stub_if_missing_deps(*_check)
@@ -78,89 +253,16 @@ class MultiObjExpectedImprovement(Component):
         """Calculates the multi-objective probability of improvement
         for a new point with two responses. Takes as input a
         pareto frontier, mean and sigma of new point."""
-
-        y_star = self.y_star
-
-        PI1 = (0.5+0.5*erf((1/(2**0.5))*((y_star[0][0]-mu[0])/sigma[0])))
-        PI3 = (1-(0.5+0.5*erf((1/(2**0.5))*((y_star[-1][0]-mu[0])/sigma[0]))))\
-        *(0.5+0.5*erf((1/(2**0.5))*((y_star[-1][1]-mu[1])/sigma[1])))
-
-        PI2 = 0
-        if len(y_star)>1:
-            for i in range(len(y_star) - 1):
-                PI2=PI2+((0.5+0.5*erf((1/(2**0.5))*((y_star[i+1][0]-mu[0])/sigma[0])))\
-                -(0.5+0.5*erf((1/(2**0.5))*((y_star[i][0]-mu[0])/sigma[0]))))\
-                *(0.5+0.5*erf((1/(2**0.5))*((y_star[i+1][1]-mu[1])/sigma[1])))
-        mcpi = PI1 + PI2 + PI3
-        return mcpi
+        return pi_2obj(self.y_star, [mu], [sigma])[0]
 
     def _2obj_EI(self, mu, sigma):
         """Calculates the multi-criteria expected improvement
         for a new point with two responses. Takes as input a
         pareto frontier, mean and sigma of new point."""
-
-        y_star = self.y_star
-        ybar11 = mu[0]*(0.5+0.5*erf((1/(2**0.5))*((y_star[0][0]-mu[0])/sigma[0])))\
-        -sigma[0]*(1/((2*pi)**0.5))*exp(-0.5*((y_star[0][0]-mu[0])**2/sigma[0]**2))
-        ybar13 = (mu[0]*(0.5+0.5*erf((1/(2**0.5))*((y_star[-1][0]-mu[0])/sigma[0])))\
-        -sigma[0]*(1/((2*pi)**0.5))*exp(-0.5*((y_star[-1][0]-mu[0])**2/sigma[0]**2)))\
-        *(0.5+0.5*erf((1/(2**0.5))*((y_star[-1][1]-mu[1])/sigma[1])))
-
-        ybar12 = 0
-        if len(y_star) > 1:
-            for i in range(len(y_star) - 1):
-                ybar12 = ybar12+((mu[0]*(0.5+0.5*erf((1/(2**0.5))*((y_star[i+1][0]-mu[0])/sigma[0])))\
-                -sigma[0]*(1/((2*pi)**0.5))*exp(-0.5*((y_star[i+1][0]-mu[0])**2/sigma[0]**2)))\
-                -(mu[0]*(0.5+0.5*erf((1/(2**0.5))*((y_star[i][0]-mu[0])/sigma[0])))\
-                -sigma[0]*(1/((2*pi)**0.5))*exp(-0.5*((y_star[i][0]-mu[0])**2/sigma[0]**2))))\
-                *(0.5+0.5*erf((1/(2**0.5))*((y_star[i+1][1]-mu[1])/sigma[1])))
-
-        ybar1 = (ybar11+ybar12+ybar13)/self.PI
-
-        ybar21 = mu[1]*(0.5+0.5*erf((1/(2**0.5))*((y_star[0][1]-mu[1])/sigma[1])))\
-        -sigma[1]*(1/((2*pi)**0.5))*exp(-0.5*((y_star[0][1]-mu[1])**2/sigma[1]**2))
-        ybar23 = (mu[1]*(0.5+0.5*erf((1/(2**0.5))*((y_star[-1][1]-mu[1])/sigma[1])))\
-        -sigma[1]*(1/((2*pi)**0.5))*exp(-0.5*((y_star[-1][1]-mu[1])**2/sigma[1]**2)))\
-        *(0.5+0.5*erf((1/(2**0.5))*((y_star[-1][0]-mu[0])/sigma[0])))
-
-        ybar22 = 0
-        if len(y_star)>1:
-            for i in range(len(y_star) - 1):
-                ybar22 = ybar22+((mu[1]*(0.5+0.5*erf((1/(2**0.5))*((y_star[i+1][1]-mu[1])/sigma[1])))\
-                -sigma[1]*(1/((2*pi)**0.5))*exp(-0.5*((y_star[i+1][1]-mu[1])**2/sigma[1]**2)))\
-                -(mu[1]*(0.5+0.5*erf((1/(2**0.5))*((y_star[i][1]-mu[1])/sigma[1])))\
-                -sigma[1]*(1/((2*pi)**0.5))*exp(-0.5*((y_star[i][1]-mu[1])**2/sigma[1]**2))))\
-                *(0.5+0.5*erf((1/(2**0.5))*((y_star[i+1][0]-mu[0])/sigma[0])))
-
-        ybar2 = (ybar21+ybar22+ybar23)/self.PI
-        dists = [((ybar1-point[0])**2+(ybar2-point[1])**2)**0.5 for point in y_star]
-        mcei = self.PI*min(dists)
-        if isnan(mcei):
-            mcei = 0
-        return mcei
-
-    def _dom(self, a, b):
-        """determines if a completely dominates b
-       returns True is if does
-    """
-        comp = [c1 < c2 for c1, c2 in zip(a, b)]
-        if sum(comp) == len(self.criteria):
-            return True
-        return False
+        return ei_2obj(self.y_star, [mu], [sigma], [self.PI])[0]
 
     def _nobj_PI(self, mu, sigma):
-        cov = diag(array(sigma)**2)
-        rands = random.multivariate_normal(mu, cov, self.n)
-        num = 0  # number of cases that dominate the current Pareto set
-
-        for random_sample in rands:
-            for par_point in self.y_star:
-                #par_point = [p[2] for p in par_point.outputs]
-                if self._dom(par_point, random_sample):
-                    num = num + 1
-                    break
-        pi = (self.n-num)/float(self.n)
-        return pi
+        return pi_nobj(self.y_star, [mu], [sigma], self.n)[0]
 
     def execute(self):
         """ Calculates the expected improvement or
@@ -59,6 +59,9 @@ class ExternalCode(ComponentWithDerivatives):
         self.stdout = None
         self.stderr = "error.out"
 
+        # Timing of the last remote execution (see _execute_remote()).
+        self.remote_timing = {}
+
         self._process = None
         self._server = None
 
@@ -93,7 +96,10 @@ class ExternalCode(ComponentWithDerivatives):
 
         If `resources` have been specified, an appropriate server
         is allocated and the command is run on that server.
-        Otherwise the command is run locally.
+        Otherwise the command is run locally. After a remote run,
+        `remote_timing` holds the time in seconds spent sending inputs
+        ('send'), queued ('queue'), running ('run'), and retrieving
+        results ('retrieve').
 
         When running remotely, the following resources are set:
 
@@ -341,10 +347,12 @@ class ExternalCode(ComponentWithDerivatives):
             if self.stdin and self.stdin != self.DEV_NULL:
                 patterns.append(self.stdin)
                 textfiles.append(self.stdin)
+            start_time = time.time()
             if patterns:
                 self._send_inputs(patterns, textfiles)
             else:
                 self._logger.debug('No input files')
+            timing = dict(send=time.time()-start_time)
 
             # Run command.
             self._logger.info('executing %s...', self.command)
@@ -354,6 +362,7 @@ class ExternalCode(ComponentWithDerivatives):
             et = time.time() - start_time
             if et >= 60:  #pragma no cover
                 self._logger.info('elapsed time: %.1f sec.', et)
+            timing.update(self._server.command_timing())
 
             # Retrieve results.
             patterns = []
@@ -373,7 +382,14 @@ class ExternalCode(ComponentWithDerivatives):
             if self.stderr != self.STDOUT:
                 patterns.append(rdesc['error_path'])
                 textfiles.append(rdesc['error_path'])
+            start_time = time.time()
             self._retrieve_results(patterns, textfiles)
+            timing['retrieve'] = time.time() - start_time
+            self.remote_timing = timing
+            self._logger.debug('remote timing: send %.3f, queue %.3f,'
+                               ' run %.3f, retrieve %.3f', timing['send'],
+                               timing.get('queue', 0.), timing.get('run', 0.),
+                               timing['retrieve'])
 
             # Echo stdout if not redirected.
             if not self.stdout:
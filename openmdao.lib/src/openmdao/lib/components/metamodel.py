@@ -170,40 +170,7 @@ class MetaModel(Component):
                 return
                 
             #print '%s predicting' % self.get_pathname()
-            if self._new_train_data:
-                if len(self._training_input_history) < 2:
-                    self.raise_exception("ERROR: need at least 2 training points!",
-                                         RuntimeError)
-
-                # figure out if we have any constant training inputs
-                tcases = self._training_input_history
-                in_hist = tcases[0][:]
-                # start off assuming every input is constant
-                idxlist = range(len(in_hist))
-                self._const_inputs = dict(zip(idxlist, in_hist))
-                for i in idxlist:
-                    val = in_hist[i]
-                    for case in range(1, len(tcases)):
-                        if val != tcases[case][i]:
-                            del self._const_inputs[i]
-                            break
-
-                if len(self._const_inputs) == len(in_hist):
-                    self.raise_exception("ERROR: all training inputs are constant.")
-                elif len(self._const_inputs) > 0:
-                    # some inputs are constant, so we have to remove them from the training set
-                    training_input_history = []
-                    for inputs in self._training_input_history:
-                        training_input_history.append([val for i, val in enumerate(inputs)
-                                                       if i not in self._const_inputs])
-                else:
-                    training_input_history = self._training_input_history
-                for name, output_history in self._training_data.items():
-                    surrogate = self._get_surrogate(name)
-                    if surrogate is not None:
-                        surrogate.train(training_input_history, output_history)
-
-                self._new_train_data = False
+            self._train_surrogates()
 
             inputs = []
             for i, name in enumerate(self.surrogate_input_names()):
@@ -224,6 +191,99 @@ class MetaModel(Component):
                 else:
                     setattr(self, name, surrogate.predict(inputs))
 
+    def _train_surrogates(self):
+        """Train the surrogates if there is new training data."""
+        if self._new_train_data:
+            if len(self._training_input_history) < 2:
+                self.raise_exception("ERROR: need at least 2 training points!",
+                                     RuntimeError)
+
+            # figure out if we have any constant training inputs
+            tcases = self._training_input_history
+            in_hist = tcases[0][:]
+            # start off assuming every input is constant
+            idxlist = range(len(in_hist))
+            self._const_inputs = dict(zip(idxlist, in_hist))
+            for i in idxlist:
+                val = in_hist[i]
+                for case in range(1, len(tcases)):
+                    if val != tcases[case][i]:
+                        del self._const_inputs[i]
+                        break
+
+            if len(self._const_inputs) == len(in_hist):
+                self.raise_exception("ERROR: all training inputs are constant.")
+            elif len(self._const_inputs) > 0:
+                # some inputs are constant, so we have to remove them from the training set
+                training_input_history = []
+                for inputs in self._training_input_history:
+                    training_input_history.append([val for i, val in enumerate(inputs)
+                                                   if i not in self._const_inputs])
+            else:
+                training_input_history = self._training_input_history
+            for name, output_history in self._training_data.items():
+                surrogate = self._get_surrogate(name)
+                if surrogate is not None:
+                    surrogate.train(training_input_history, output_history)
+
+            self._new_train_data = False
+
+    def execute_batch(self, inputs):
+        """Predict outputs for a batch of points in one call, without the
+        per-point overhead of setting inputs and running. Surrogates having
+        a ``predict_batch`` method evaluate all of the points at once.
+        Returns a dictionary mapping output names to lists of values.
+
+        inputs: dict
+            Maps input names to lists of values, one per point. Inputs not
+            given keep their current value.
+        """
+        if self._train or not self._training_input_history or \
+           (self.default_surrogate is None and not self._surrogate_overrides):
+            self.raise_exception('batch evaluation requires trained'
+                                 ' surrogates', RuntimeError)
+        input_names = self.surrogate_input_names()
+        npoints = None
+        for name, vals in inputs.items():
+            if name not in input_names:
+                self.raise_exception("'%s' is not a surrogate input" % name,
+                                     KeyError)
+            if npoints is None:
+                npoints = len(vals)
+            elif len(vals) != npoints:
+                self.raise_exception('batch inputs differ in length',
+                                     ValueError)
+        if npoints is None:
+            self.raise_exception('no batch inputs specified', ValueError)
+
+        self._train_surrogates()
+
+        columns = []
+        for i, name in enumerate(input_names):
+            vals = inputs.get(name)
+            if vals is None:
+                vals = [getattr(self, name)] * npoints
+            cval = self._const_inputs.get(i, _missing)
+            if cval is _missing:
+                columns.append(vals)
+            else:
+                for val in vals:
+                    if val != cval:
+                        self.raise_exception("ERROR: training input '%s' was a constant value of (%s) but the value has changed to (%s)." %
+                                             (name, cval, val), ValueError)
+        points = [list(row) for row in zip(*columns)]
+
+        outputs = {}
+        for name in self._training_data:
+            surrogate = self._get_surrogate(name)
+            if surrogate is None:
+                outputs[name] = [getattr(self.model, name)] * npoints
+            elif hasattr(surrogate, 'predict_batch'):
+                outputs[name] = list(surrogate.predict_batch(points))
+            else:
+                outputs[name] = [surrogate.predict(point) for point in points]
+        return outputs
+
     def _post_run(self):
         self._train = False
         super(MetaModel, self)._post_run()
@@ -2,7 +2,10 @@
 
 import unittest
 
-from openmdao.lib.components.expected_improvement import ExpectedImprovement
+from numpy import array, maximum, random
+
+from openmdao.lib.components.expected_improvement import ExpectedImprovement, \
+     expected_improvement, probability_of_improvement
 from openmdao.lib.casehandlers.api import CaseSet, ListCaseIterator
 from openmdao.main.uncertain_distributions import NormalDistribution
 from openmdao.main.case import Case
@@ -38,6 +41,40 @@ class ExpectedImprovementTests(unittest.TestCase):
         self.assertEqual(0,ei.EI)
         self.assertEqual(0,ei.PI)
         
+    def test_batch(self):
+        mu = array([0., 1., 2., 1.5])
+        sigma = array([1., 1., 0.5, 0.])
+        pi = probability_of_improvement(1., mu, sigma)
+        ei = expected_improvement(1., mu, sigma)
+        self.assertEqual(pi.shape, (4,))
+        self.assertAlmostEqual(pi[0], 0.841345, 5)
+        self.assertAlmostEqual(pi[1], 0.5, 6)
+        self.assertAlmostEqual(pi[2], 0.022750, 5)
+        self.assertEqual(pi[3], 0.)
+        self.assertAlmostEqual(ei[0], 1.083315, 5)
+        self.assertAlmostEqual(ei[1], 0.398942, 5)
+        self.assertAlmostEqual(ei[2], 0.004245, 5)
+        self.assertEqual(ei[3], 0.)
+        
+        # scalar arguments give scalar results
+        self.assertAlmostEqual(probability_of_improvement(1., 0., 1.),
+                               0.841345, 5)
+        self.assertAlmostEqual(expected_improvement(1., 0., 1.), 1.083315, 5)
+        self.assertEqual(probability_of_improvement(1., 1.5, 0.), 0.)
+        
+        # zero sigma below the target gives the deterministic improvement
+        self.assertEqual(expected_improvement(1., 0.25, 0.), 0.75)
+        self.assertEqual(expected_improvement(1., 0.25, 0.5).shape, ())
+        
+    def test_batch_monte_carlo(self):
+        random.seed(10)
+        mu = random.normal(size=5)
+        sigma = random.uniform(0.1, 1., size=5)
+        samples = mu + sigma*random.normal(size=(100000, 5))
+        ei = expected_improvement(0.2, mu, sigma)
+        for i in range(5):
+            self.assertAlmostEqual(ei[i], maximum(0.2-samples[:, i], 0.).mean(), 2)
+        
 if __name__ == "__main__":
     unittest.main()
 
@@ -1,8 +1,9 @@
 # pylint: disable-msg=C0111,C0103
 
 import unittest
-from numpy import array
-from openmdao.lib.components.expected_improvement_multiobj import MultiObjExpectedImprovement
+from numpy import array, random
+from openmdao.lib.components.expected_improvement_multiobj import MultiObjExpectedImprovement, \
+     pi_2obj, ei_2obj, pi_nobj, hypervolume_ei_2obj
 from openmdao.lib.casehandlers.api import CaseSet, ListCaseIterator
 from openmdao.main.uncertain_distributions import NormalDistribution
 from openmdao.main.case import Case
@@ -93,6 +94,58 @@ class MultiObjExpectedImprovementTests(unittest.TestCase):
             self.assertEqual(str(err),": no cases in the provided case_set"
                                 " had output matching the provided criteria, ['y1' 'y3']")
 
+    def test_batch_2obj(self):
+        y_star = array([[0., 3.], [1., 2.], [2., 0.5], [3., 0.]])
+        mu = array([[1., 0.], [0.5, 2.5], [4., 4.]])
+        sigma = array([[1., 1.], [0.5, 0.2], [1., 1.]])
+        pi = pi_2obj(y_star, mu, sigma)
+        ei = ei_2obj(y_star, mu, sigma, pi)
+        
+        ei_comp = MultiObjExpectedImprovement(2)
+        ei_comp.calc_switch = "EI"
+        ei_comp.y_star = y_star
+        for i in range(3):
+            self.assertAlmostEqual(pi[i], ei_comp._2obj_PI(mu[i], sigma[i]), 10)
+            ei_comp.PI = pi[i]
+            self.assertAlmostEqual(ei[i], ei_comp._2obj_EI(mu[i], sigma[i]), 10)
+            
+    def test_batch_nobj(self):
+        random.seed(10)
+        pi = pi_nobj([[1., 1., 1.]], [[1., 1., 1.], [-10., 1., 1.]], 
+                     [[1., 1., 1.], [1., 1., 1.]], n=2000)
+        self.assertAlmostEqual(pi[0], 0.875, 1)
+        self.assertEqual(pi[1], 1.0)
+        
+    def test_hypervolume_ei(self):
+        # nearly deterministic point: EI is the hypervolume improvement
+        hvei = hypervolume_ei_2obj([[1., 1.]], [[0., 0.], [1.5, 1.5], [3., 0.]],
+                                   [[1e-8, 1e-8]]*3, [2., 2.])
+        self.assertAlmostEqual(hvei[0], 3., 6)
+        self.assertAlmostEqual(hvei[1], 0., 6)
+        self.assertAlmostEqual(hvei[2], 0., 6)
+        
+        # compare with a Monte Carlo estimate
+        random.seed(10)
+        y_star = array([[0., 3.], [1., 2.], [2., 0.5], [3., 0.]])
+        ref = array([4., 4.])
+        mu = array([1.5, 1.])
+        sigma = array([0.7, 0.5])
+        hvei = hypervolume_ei_2obj(y_star, mu, sigma, ref)
+        
+        def hv(front):
+            front = front[front[:, 0].argsort()]
+            vol, lowest = 0., ref[1]
+            for point in front:
+                if point[1] < lowest:
+                    vol += (ref[0]-point[0])*(lowest-point[1])
+                    lowest = point[1]
+            return vol
+        
+        base = hv(y_star)
+        samples = mu + sigma*random.normal(size=(20000, 2))
+        mc = sum([hv(array(list(y_star)+[s]))-base for s in samples])/len(samples)
+        self.assertAlmostEqual(hvei[0]/mc, 1.0, 1)
+        
 if __name__ == "__main__":
     unittest.main()
 
@@ -426,7 +426,52 @@ class MetaModelTestCase(unittest.TestCase):
         
         self.assertTrue(isinstance(metamodel.d,NormalDistribution))
         self.assertTrue(isinstance(metamodel.c,float))
-        
+
+    def test_execute_batch(self):
+        metamodel = MetaModel()
+        metamodel.name = 'meta'
+        metamodel.model = Simple()
+        metamodel.sur_d = KrigingSurrogate()
+        metamodel.sur_c = LogisticRegression()  # No predict_batch().
+        metamodel.recorder = DumbRecorder()
+
+        try:
+            metamodel.execute_batch({'a': [1.]})
+        except RuntimeError as err:
+            self.assertTrue(str(err).endswith(
+                            'batch evaluation requires trained surrogates'))
+        else:
+            self.fail('RuntimeError expected')
+
+        for a, b in [(1., 2.), (3., 4.), (1.5, 7.)]:
+            metamodel.a = a
+            metamodel.b = b
+            metamodel.train_next = True
+            metamodel.run()
+
+        points = [(1.2, 2.2), (2.5, 4.5), (0.5, 6.)]
+        results = metamodel.execute_batch({'a': [a for a, b in points],
+                                           'b': [b for a, b in points]})
+        for i, (a, b) in enumerate(points):
+            metamodel.a = a
+            metamodel.b = b
+            metamodel.run()
+            assert_rel_error(self, results['c'][i], metamodel.c, 1e-6)
+            assert_rel_error(self, results['d'][i].mu, metamodel.d.mu, 1e-6)
+
+        # Inputs not given keep their current value.
+        results = metamodel.execute_batch({'a': [1.2]})
+        metamodel.a = 1.2
+        metamodel.run()
+        assert_rel_error(self, results['d'][0].mu, metamodel.d.mu, 1e-6)
+
+        try:
+            metamodel.execute_batch({'a': [1.], 'b': [1., 2.]})
+        except ValueError as err:
+            self.assertTrue(str(err).endswith('batch inputs differ in length'))
+        else:
+            self.fail('ValueError expected')
+
     def test_includes(self):
         metamodel = MyMetaModel()
         metamodel.default_surrogate = KrigingSurrogate()
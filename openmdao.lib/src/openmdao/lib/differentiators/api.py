@@ -1,8 +1,10 @@
 """Pseudo package providing a central place to access all of the
 OpenMDAO differentiators in the standard library."""
 
-from openmdao.lib.differentiators.finite_difference import FiniteDifference
-from openmdao.lib.differentiators.chain_rule import ChainRule
-from openmdao.lib.differentiators.analytic import Analytic
-
+from openmdao.util.lazyimport import lazy_import
 
+lazy_import(__name__, [
+    ('openmdao.lib.differentiators.finite_difference', ('FiniteDifference',)),
+    ('openmdao.lib.differentiators.chain_rule', ('ChainRule',)),
+    ('openmdao.lib.differentiators.analytic', ('Analytic',)),
+])
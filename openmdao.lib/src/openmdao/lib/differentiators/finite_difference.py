@@ -382,34 +382,19 @@ class FiniteDifference(Container):
 
         dvals = [float(val) for val in data_param.values()]
         
-        self._parent.set_parameters(dvals)
-
-        # Run the model
-        super(type(self._parent), self._parent).run_iteration()
+        # Run the model (unless the driver has already evaluated this point)
+        objectives, constraints = self._parent.run_point(dvals)
         
-        data = {}
-
         # Get Objectives
-        for key, item in self._parent.get_objectives().iteritems():
-            data[key] = item.evaluate(self._parent.parent)
-
-        # Get Inequality Constraints
-        if self.ineqconst_names:
-            for key, item in self._parent.get_ineq_constraints().iteritems():
-                val = item.evaluate(self._parent.parent)
-                if '>' in val[2]:
-                    data[key] = val[1]-val[0]
-                else:
-                    data[key] = val[0]-val[1]
-        
-        # Get Equality Constraints
-        if self.eqconst_names:
-            for key, item in self._parent.get_eq_constraints().iteritems():
-                val = item.evaluate(self._parent.parent)
-                if '>' in val[2]:
-                    data[key] = val[1]-val[0]
-                else:
-                    data[key] = val[0]-val[1]
+        data = dict(objectives)
+
+        # Get Inequality and Equality Constraints
+        for key in self.ineqconst_names + self.eqconst_names:
+            val = constraints[key]
+            if '>' in val[2]:
+                data[key] = val[1]-val[0]
+            else:
+                data[key] = val[0]-val[1]
         
         return data
                     
@@ -6,17 +6,21 @@
 """Pseudo package providing a central place to access all of the
 OpenMDAO drivers in the standard library."""
 
-# Drivers
-from openmdao.lib.drivers.cobyladriver import COBYLAdriver
-from openmdao.lib.drivers.conmindriver import CONMINdriver
-from openmdao.lib.drivers.newsumtdriver import NEWSUMTdriver
-from openmdao.lib.drivers.slsqpdriver import SLSQPdriver
-from openmdao.lib.drivers.caseiterdriver import CaseIteratorDriver
-from openmdao.lib.drivers.genetic import Genetic
-from openmdao.lib.drivers.iterate import FixedPointIterator, IterateUntil
-from openmdao.lib.drivers.broydensolver import BroydenSolver
-from openmdao.lib.drivers.doedriver import DOEdriver, NeighborhoodDOEdriver
-from openmdao.lib.drivers.sensitivity import SensitivityDriver
-from openmdao.lib.drivers.distributioncasedriver import DistributionCaseDriver
-from openmdao.lib.drivers.simplecid import SimpleCaseIterDriver
+from openmdao.util.lazyimport import lazy_import
 
+# Drivers
+lazy_import(__name__, [
+    ('openmdao.lib.drivers.cobyladriver', ('COBYLAdriver',)),
+    ('openmdao.lib.drivers.conmindriver', ('CONMINdriver',)),
+    ('openmdao.lib.drivers.newsumtdriver', ('NEWSUMTdriver',)),
+    ('openmdao.lib.drivers.slsqpdriver', ('SLSQPdriver',)),
+    ('openmdao.lib.drivers.caseiterdriver', ('CaseIteratorDriver',)),
+    ('openmdao.lib.drivers.genetic', ('Genetic',)),
+    ('openmdao.lib.drivers.iterate', ('FixedPointIterator', 'IterateUntil')),
+    ('openmdao.lib.drivers.broydensolver', ('BroydenSolver',)),
+    ('openmdao.lib.drivers.doedriver', ('DOEdriver', 'NeighborhoodDOEdriver')),
+    ('openmdao.lib.drivers.sensitivity', ('SensitivityDriver',)),
+    ('openmdao.lib.drivers.distributioncasedriver', ('DistributionCaseDriver',)),
+    ('openmdao.lib.drivers.simplecid', ('SimpleCaseIterDriver',)),
+    ('openmdao.lib.drivers.patternsearch', ('AsyncPatternSearch',)),
+])
@@ -9,14 +9,16 @@ import Queue
 import sys
 import thread
 import threading
+import time
 import traceback
 
 from openmdao.main.datatypes.api import Bool, Dict, Enum, Int, Slot
 
-from openmdao.main.api import Driver
+from openmdao.main.api import Case, Driver
 from openmdao.main.exceptions import RunStopped, TracedError, traceback_str
-from openmdao.main.expreval import ExprEvaluator
 from openmdao.main.interfaces import ICaseIterator, ICaseRecorder, ICaseFilter
+from openmdao.main.objserverfactory import register_model_template, \
+                                          unregister_model_template
 from openmdao.main.rbac import get_credentials, set_credentials
 from openmdao.main.resource import ResourceAllocationManager as RAM
 from openmdao.main.resource import LocalAllocator
@@ -27,21 +29,156 @@ from openmdao.main.hasparameters import HasParameters
 
 from openmdao.lib.casehandlers.api import ListCaseRecorder
 
-_EMPTY     = 'empty'
-_LOADING   = 'loading'
-_EXECUTING = 'executing'
+# Replies from server threads.
+_STARTED = 'started'
+_DONE    = 'done'
+_STOPPED = 'stopped'
+
+# Weight of new observations in running cost estimates.
+_SMOOTHING = 0.3
+
+# A straggler is re-run if its expected remaining time is at least this
+# multiple of the expected time on an idle server.
+_SPECULATION_RATIO = 1.5
+
 
 class _ServerError(Exception):
     """ Raised when a server thread has problems. """
     pass
 
 
+class _Job(object):
+    """
+    A case to be evaluated, with its timing record. `timing` has entries for
+    the time spent waiting for a server ('queue'), loading the model
+    ('load'), setting inputs, executing, and getting outputs ('execute'),
+    and waiting from then until the case is passed to the recorders
+    ('record').
+    """
+
+    def __init__(self, case, seqno, rerun=False, cost=None):
+        self.case = case
+        self.seqno = seqno
+        self.rerun = rerun
+        self.cost = cost           # Relative cost hint.
+        self.queued = time.time()
+        self.begun = None          # Time server started on it.
+        self.timing = dict(queue=0., load=0., execute=0., record=0.)
+        self.exc = None            # Set if execution failed.
+        self.load_failed = False
+        self.started = False       # Set by server thread.
+        self.cancelled = False     # Set by driver thread.
+        self.done = False
+        self.worker = None         # Worker assigned to.
+        self.twin = None           # Other job evaluating the same case.
+        self.original = None       # Case copied, if speculative.
+        self.superseded = False    # Set if twin's result was used.
+
+    def requeue(self):
+        """ Return a new job for this case, keeping its queue time. """
+        job = _Job(self.case, self.seqno, self.rerun, self.cost)
+        job.queued = self.queued
+        job.original = self.original
+        return job
+
+    def speculate(self):
+        """
+        Return a job evaluating a copy of this job's case. The copy is
+        recorded if it finishes first, since the original may still be
+        updated by this job.
+        """
+        case = self.case
+        dup = Case(inputs=case.items(iotype='in'),
+                   outputs=case.keys(iotype='out'), label=case.label,
+                   case_uuid=case.uuid, max_retries=case.max_retries,
+                   retries=case.retries)
+        job = _Job(dup, self.seqno, rerun=True, cost=self.cost)
+        job.original = case
+        return job
+
+
+class _CostModel(object):
+    """
+    Running estimates of case execution time. A server's `slowness` is the
+    ratio of its execution times to those of a nominal server, and `unit`
+    is the time a nominal server takes per unit of case cost (cases
+    without a cost hint have unit cost).
+    """
+
+    def __init__(self):
+        self.unit = None
+
+    def estimate(self, job, worker):
+        """ Return expected execution time of `job` on `worker`, or None. """
+        if self.unit is None:
+            return None
+        return self.unit * (job.cost or 1.) * worker.slowness
+
+    def update(self, job, worker, elapsed):
+        """ Update estimates from `job` taking `elapsed` on `worker`. """
+        cost = job.cost or 1.
+        if self.unit is None:
+            self.unit = elapsed / cost
+            return
+        if self.unit > 0.:
+            ratio = elapsed / (self.unit * cost)
+            worker.slowness += _SMOOTHING * (ratio - worker.slowness)
+        self.unit += _SMOOTHING * (elapsed / (cost * worker.slowness)
+                                   - self.unit)
+
+
+class _Worker(object):
+    """ State of a server and the thread servicing it. """
+
+    def __init__(self, name):
+        self.name = name
+        self.request_q = Queue.Queue()
+        self.lock = threading.Lock()  # Protects job started/cancelled.
+        self.server = None
+        self.info = None
+        self.top = None         # Model top level in server.
+        self.loaded = False     # True if a freshly loaded model is ready.
+        self.started = False    # True once startup reply received.
+        self.retired = False    # True if no more jobs should be assigned.
+        self.stopped = False    # True if thread exited early.
+        self.assigned = []      # Jobs not yet replied to, in order.
+        self.load_failures = 0
+        self.n_cases = 0
+        self.busy = 0.          # Time spent loading and executing.
+        self.slowness = 1.      # Relative execution time (see _CostModel).
+        self.load_time = 0.     # Running estimate of model load time.
+
+
 class CaseIterDriverBase(Driver):
     """
     A base class for Drivers that run sets of cases in a manner similar
     to the ROSE framework. Concurrent evaluation is supported, with the various
     evaluations executed across servers obtained from the
     :class:`ResourceAllocationManager`.
+
+    During concurrent evaluation each server is serviced by a thread which
+    loads the model, sets inputs, executes, and gets outputs for a case
+    before replying. The next case is assigned as soon as a server replies,
+    and a busy server is given one more case to start on when it is done,
+    which is taken back if another server becomes idle first.
+
+    Running estimates of each server's speed are kept so that idle servers
+    are given cases fastest first. If :meth:`get_case_cost` provides cost
+    hints, up to `lookahead` cases are read ahead and the most costly
+    started first. When no cases are left, an idle server may re-run a
+    case which is expected to finish sooner there than on the server
+    running it (if `speculative` is set). The first successful result is
+    used.
+
+    The case iterator may return None when its next case depends on results
+    not yet recorded (as with an optimizer). Servers are kept allocated and
+    the iterator is tried again as each case is recorded. Such an iterator
+    must end rather than return None when no cases are in progress.
+
+    Each recorded case has a `timing` dictionary (see :class:`_Job`), which
+    recorders such as :class:`DBCaseRecorder` store with the case, and
+    throughput statistics for the run are available from
+    :meth:`get_run_stats`.
     """
 
     sequential = Bool(True, iotype='in',
@@ -65,35 +202,61 @@ class CaseIterDriverBase(Driver):
                                         ' requirements will be included in the'
                                         ' generated egg.')
 
+    lookahead = Int(20, low=1, iotype='in',
+                    desc='Number of cases read ahead when cases have cost'
+                         ' hints, so the most costly can be started first.')
+
+    speculative = Bool(True, iotype='in',
+                       desc='If True, idle servers may re-run cases which'
+                            ' are running much slower elsewhere.')
+
     def __init__(self, *args, **kwargs):
         super(CaseIterDriverBase, self).__init__(*args, **kwargs)
-        self._iter = None  # Set to None when iterator is empty.
-        self._seqno = 0    # Used to set itername for case.
+        self._iter = None  # (seqno, case) iterator, None when empty.
         self._replicants = 0
         self._abort_exc = None  # Set if error_policy == ABORT.
 
         self._egg_file = None
         self._egg_required_distributions = None
         self._egg_orphan_modules = None
+        self._template = None  # Used instead of egg with forked servers.
 
         self._reply_q = None  # Replies from server threads.
-        self._server_lock = None  # Lock for server data.
-
-        # Various per-server data keyed by server name.
-        self._servers = {}
-        self._top_levels = {}
-        self._server_info = {}
-        self._queues = {}
-        self._in_use = {}
-        self._server_states = {}
-        self._server_cases = {}
-        self._exceptions = {}
-        self._load_failures = {}
- 
-        self._todo = []   # Cases grabbed during server startup.
-        self._rerun = []  # Cases that failed and should be retried.
+        self._workers = []
+
+        self._todo = []   # Jobs grabbed but not yet assigned.
+        self._rerun = []  # Jobs for cases that failed and should be retried.
+        self._ahead = []  # Jobs read ahead from the iterator.
+        self._costs = _CostModel()
         self._generation = 0  # Used to keep worker names unique.
 
+        self._recorded = set()  # Sequence numbers of recorded cases.
+        self._restart_pending = False  # Set if restored during a run.
+
+        self._stats = None  # Accumulated during a run.
+        self._run_stats = {}
+
+    def __getstate__(self):
+        """Return dict representing this driver's state. If a run is in
+        progress, only the set of cases recorded so far is saved, and the run
+        is continued by the next :meth:`resume` or :meth:`step`.
+        """
+        state = super(CaseIterDriverBase, self).__getstate__()
+        state['_restart_pending'] = self._iter is not None or \
+                                    bool(self._ahead) or \
+                                    self._restart_pending
+        state['_iter'] = None
+        state['_egg_file'] = None
+        state['_template'] = None
+        state['_reply_q'] = None
+        state['_workers'] = []
+        state['_todo'] = []
+        state['_rerun'] = []
+        state['_ahead'] = []
+        state['_costs'] = _CostModel()
+        state['_stats'] = None
+        return state
+
     def execute(self):
         """
         Runs all cases and records results in `recorder`.
@@ -113,13 +276,18 @@ class CaseIterDriverBase(Driver):
         """
         self._stop = False
         self._abort_exc = None
-        if self._iter is None:
-            self.raise_exception('Run already complete', RuntimeError)
+        if self._iter is None and not self._ahead:
+            if self._restart_pending:
+                self._restart()
+            else:
+                self.raise_exception('Run already complete', RuntimeError)
 
+        self._stats = dict(start=time.time(), cases=0, busy=0., servers=1,
+                           speculated=0, speculative_wins=0)
         try:
             if self.sequential:
                 self._logger.info('Start sequential evaluation.')
-                while self._iter is not None:
+                while self._iter is not None or self._ahead:
                     if self._stop:
                         break
                     try:
@@ -130,6 +298,7 @@ class CaseIterDriverBase(Driver):
                 self._logger.info('Start concurrent evaluation.')
                 self._start()
         finally:
+            self._finish_stats()
             self._cleanup(remove_egg)
 
         if self._stop:
@@ -143,29 +312,70 @@ class CaseIterDriverBase(Driver):
         """ Evaluate the next case. """
         self._stop = False
         self._abort_exc = None
-        if self._iter is None:
-            self.setup()
+        if self._iter is None and not self._ahead:
+            if self._restart_pending:
+                self._restart()
+            else:
+                self.setup()
 
-        try:
-            case = self._iter.next()
-        except StopIteration:
+        job = self._read_case()
+        if job is None:
             if not self._rerun:
-                self._iter = None
-                self._seqno = 0
-                raise
+                raise StopIteration()
+        else:
+            self._todo.append(job)
 
-        self._seqno += 1
-        self._todo.append((case, self._seqno))
-        self._server_cases[None] = None
-        self._server_states[None] = _EMPTY
-        while self._server_ready(None, stepping=True):
-            pass
+        # Run the case (and any retries) locally.
+        while True:
+            job = self._next_job(stepping=True)
+            if job is None:
+                break
+            self._run_job(None, job)
+            self._job_done(None, job)
 
     def stop(self):
         """ Stop evaluating cases. """
         # Necessary to avoid default driver handling of stop signal.
         self._stop = True
 
+    def get_case_cost(self, case):
+        """
+        Return a hint of the relative cost of evaluating `case`, or None if
+        unknown. The default returns None.
+        """
+        return None
+
+    def get_run_stats(self):
+        """
+        Return a dictionary of throughput statistics for the most recent
+        run: number of cases recorded ('cases'), elapsed time ('elapsed'),
+        cases per second ('rate'), number of servers used ('servers'),
+        the fraction of server time spent loading and executing cases
+        ('utilization'), number of speculative re-runs ('speculated'), and
+        how many of those finished first ('speculative_wins').
+        """
+        return self._run_stats.copy()
+
+    def _finish_stats(self):
+        """ Compute run statistics from accumulated data. """
+        stats = self._stats
+        if stats is None:
+            return
+        self._stats = None
+        elapsed = time.time() - stats['start']
+        servers = stats['servers']
+        self._run_stats = dict(
+            cases=stats['cases'], elapsed=elapsed, servers=servers,
+            speculated=stats['speculated'],
+            speculative_wins=stats['speculative_wins'],
+            rate=stats['cases'] / elapsed if elapsed > 0 else 0.,
+            utilization=stats['busy'] / (servers * elapsed)
+                        if servers and elapsed > 0 else 0.)
+        self._logger.info('%d cases in %.2f seconds (%.2f/sec),'
+                          ' %d servers %.0f%% utilized',
+                          stats['cases'], elapsed, self._run_stats['rate'],
+                          servers, self._run_stats['utilization'] * 100)
+
     def setup(self, replicate=True):
         """
         Setup to begin new run.
@@ -177,40 +387,87 @@ class CaseIterDriverBase(Driver):
         self._cleanup(remove_egg=replicate)
 
         if not self.sequential:
-            if replicate or self._egg_file is None:
-                # Save model to egg.
-                # Must do this before creating any locks or queues.
-                self._replicants += 1
-                version = 'replicant.%d' % (self._replicants)
-
-                # If only local host will be used, we can skip determining
-                # distributions required by the egg.
-                allocators = RAM.list_allocators()
-                need_reqs = False
+            if replicate or (self._egg_file is None and self._template is None):
+                self._replicate()
+
+        self._iter = self._number_cases(self.get_case_iterator())
+        self._recorded = set()
+        self._restart_pending = False
+        self._costs = _CostModel()
+
+    def _replicate(self):
+        """ Save model to egg (or template) for concurrent evaluation. """
+        # Must do this before creating any locks or queues.
+        self._replicants += 1
+        version = 'replicant.%d' % (self._replicants)
+
+        # If only local host will be used, we can skip determining
+        # distributions required by the egg.  If all local allocators
+        # fork their servers from this process, we can skip the egg.
+        allocators = RAM.list_allocators()
+        need_reqs = False
+        use_fork = bool(allocators)
+        for allocator in allocators:
+            if isinstance(allocator, LocalAllocator):
+                if not allocator.fork_models:
+                    use_fork = False
+            else:
+                use_fork = False
                 if not self.ignore_egg_requirements:
-                    for allocator in allocators:
-                        if not isinstance(allocator, LocalAllocator):
-                            need_reqs = True
-                            break
-
-                driver = self.parent.driver
-                self.parent.add('driver', Driver()) # this driver will execute the workflow once
-                self.parent.driver.workflow = self.workflow
-                try:
-                    #egg_info = self.model.save_to_egg(self.model.name, version)
-                    # FIXME: what name should we give to the egg?
-                    egg_info = self.parent.save_to_egg(self.name, version,
-                                                    need_requirements=need_reqs)
-                finally:
-                    self.parent.driver = driver
-
-                self._egg_file = egg_info[0]
-                self._egg_required_distributions = egg_info[1]
-                self._egg_orphan_modules = [name for name, path in egg_info[2]]
-
-        self._iter = self.get_case_iterator()
-        self._seqno = 0
-        
+                    need_reqs = True
+
+        driver = self.parent.driver
+        self.parent.add('driver', Driver()) # this driver will execute the workflow once
+        self.parent.driver.workflow = self.workflow
+        try:
+            if use_fork:
+                self._template = '%s.%s' % (self.get_pathname(),
+                                            version)
+                register_model_template(self._template, self.parent)
+            else:
+                #egg_info = self.model.save_to_egg(self.model.name, version)
+                # FIXME: what name should we give to the egg?
+                egg_info = self.parent.save_to_egg(self.name, version,
+                                                need_requirements=need_reqs)
+        finally:
+            self.parent.driver = driver
+
+        if use_fork:
+            self._egg_required_distributions = []
+            self._egg_orphan_modules = []
+        else:
+            self._egg_file = egg_info[0]
+            self._egg_required_distributions = egg_info[1]
+            self._egg_orphan_modules = [name for name, path in egg_info[2]]
+
+    def _restart(self):
+        """
+        Continue a run restored from a checkpoint, skipping the cases which
+        were recorded before the checkpoint was saved.
+        """
+        self._cleanup(remove_egg=True)
+        if not self.sequential:
+            self._replicate()
+        self._iter = self._number_cases(self.get_case_iterator(),
+                                        skip=self._recorded)
+        self._restart_pending = False
+
+    @staticmethod
+    def _number_cases(cases, skip=()):
+        """
+        Yield ``(seqno, case)`` for each case from `cases` whose sequence
+        number (used to set the case's itername) isn't in `skip`.
+        None is passed through, since it just means no case is available yet.
+        """
+        seqno = 0
+        for case in cases:
+            if case is None:
+                yield None
+                continue
+            seqno += 1
+            if seqno not in skip:
+                yield (seqno, case)
+
     def get_case_iterator(self):
         """Returns a new iterator over the Case set."""
         raise NotImplementedError('get_case_iterator')
@@ -233,38 +490,25 @@ class CaseIterDriverBase(Driver):
             msg = 'No servers supporting required resources %s' % resources
             self.raise_exception(msg, RuntimeError)
 
-        # Kick off initial wave of cases.
-        self._server_lock = threading.Lock()
+        # Start a server thread per case, up to max_servers.
         self._reply_q = Queue.Queue()
         self._generation += 1
-        n_servers = 0
-        while n_servers < max_servers:
-            if not self._more_to_go():
-                break
-
-            # Get next case. Limits servers started if max_servers > cases.
-            try:
-                case = self._iter.next()
-            except StopIteration:
-                if not self._rerun:
-                    self._iter = None
-                    self._seqno = 0
+        while len(self._workers) < max_servers:
+            # Limits servers started if max_servers > cases.
+            if len(self._todo) <= len(self._workers):
+                job = self._next_job(todo=False)
+                if job is not None:
+                    self._todo.append(job)
+                elif self._iter is None:
                     break
+                # Otherwise more cases will be available later.
 
-            self._seqno += 1
-            self._todo.append((case, self._seqno))
-
-            # Start server worker thread.
-            n_servers += 1
-            name = '%s_%d_%d' % (self.name, self._generation, n_servers)
+            name = '%s_%d_%d' % (self.name, self._generation,
+                                 len(self._workers)+1)
             self._logger.debug('starting worker for %r', name)
-            self._servers[name] = None
-            self._in_use[name] = True
-            self._server_cases[name] = None
-            self._server_states[name] = _EMPTY
-            self._load_failures[name] = 0
+            worker = _Worker(name)
             server_thread = threading.Thread(target=self._service_loop,
-                                             args=(name, resources,
+                                             args=(worker, resources,
                                                    credentials, self._reply_q))
             server_thread.daemon = True
             try:
@@ -272,95 +516,198 @@ class CaseIterDriverBase(Driver):
             except thread.error:
                 self._logger.warning('worker thread startup failed for %r',
                                      name)
-                self._in_use[name] = False
                 break
+            self._workers.append(worker)
 
-            if sys.platform != 'win32':
-                # Process any pending events.
-                while self._busy():
-                    try:
-                        name, result, exc = self._reply_q.get(True, 0.01)
-                    except Queue.Empty:
-                        break  # Timeout.
-                    else:
-                        # Difficult to force startup failure.
-                        if self._servers[name] is None:  #pragma nocover
-                            self._logger.debug('server startup failed for %r',
-                                               name)
-                            self._in_use[name] = False
-                        else:
-                            self._in_use[name] = self._server_ready(name)
-
-        if sys.platform == 'win32':  #pragma no cover
-            # Don't start server processing until all servers are started,
-            # otherwise we have egg removal issues.
-            for name in self._in_use.keys():
-                name, result, exc = self._reply_q.get()
-                if self._servers[name] is None:
-                    self._logger.debug('server startup failed for %r', name)
-                    self._in_use[name] = False
-
-            # Kick-off started servers.
-            for name in self._in_use.keys():
-                if self._in_use[name]:
-                    self._in_use[name] = self._server_ready(name)
-
-        # Continue until no servers are busy.
+        # Process replies until no server is busy.
+        self._stats['servers'] = 0
         while self._busy():
-            if self._more_to_go():
-                timeout = None
-            else:
-                # Don't wait indefinitely for a server we don't need.
-                # This has happened with a server that got 'lost'
-                # in RAM.allocate()
-                timeout = 60
-            try:
-                name, result, exc = self._reply_q.get(timeout=timeout)
-            # Hard to force worker to hang, which is handled here.
-            except Queue.Empty:  #pragma no cover
-                msgs = []
-                for name, in_use in self._in_use.items():
-                    if in_use:
-                        try:
-                            server = self._servers[name]
-                            info = self._server_info[name]
-                        except KeyError:
-                            msgs.append('%r: no startup reply' % name)
-                            self._in_use[name] = False
-                        else:
-                            state = self._server_states[name]
-                            if state not in (_LOADING, _EXECUTING):
-                                msgs.append('%r: %r %s %s'
-                                            % (name, self._servers[name],
-                                               state, self._server_info[name]))
-                                self._in_use[name] = False
-                if msgs:
-                    self._logger.error('Timeout waiting with nothing left to do:')
-                    for msg in msgs:
-                        self._logger.error('    %s', msg)
-            else:
-                self._in_use[name] = self._server_ready(name)
+            kind, worker, job = self._reply_q.get()
+            if kind == _STARTED:
+                worker.started = True
+                # Difficult to force startup failure.
+                if worker.server is None:  #pragma nocover
+                    self._logger.debug('server startup failed for %r',
+                                       worker.name)
+                    worker.retired = True
+                else:
+                    self._stats['servers'] += 1
+            elif kind == _DONE:
+                worker.assigned.remove(job)
+                self._job_done(worker, job)
+            # Server thread failed (should never happen).
+            else:  #pragma no cover
+                worker.stopped = True
+                worker.retired = True
+                self._todo[0:0] = [job.requeue() for job in worker.assigned]
+                worker.assigned = []
+            self._dispatch()
 
         # Shut-down (started) servers.
         self._logger.debug('Shut-down (started) servers')
-        for queue in self._queues.values():
-            queue.put(None)
-        for i in range(len(self._queues)):
+        waiting = set()
+        for worker in self._workers:
+            worker.request_q.put(None)
+            if worker.assigned:  # Running a superseded job.
+                self._logger.debug('not waiting for %r', worker.name)
+            elif worker.started and worker.server is not None and \
+                 not worker.stopped:
+                waiting.add(worker)
+        while waiting:
             try:
-                name, status, exc = self._reply_q.get(True, 60)
+                kind, worker, job = self._reply_q.get(True, 60)
             # Hard to force worker to hang, which is handled here.
             except Queue.Empty:  #pragma no cover
-                pass
+                break
             else:
-                if name in self._queues:  # 'Stale' worker can reply *late*.
-                    del self._queues[name]
+                if kind == _STOPPED:
+                    waiting.discard(worker)
         # Hard to force worker to hang, which is handled here.
-        for name in self._queues.keys():  #pragma no cover
-            self._logger.warning('Timeout waiting for %r to shut-down.', name)
+        for worker in waiting:  #pragma no cover
+            self._logger.warning('Timeout waiting for %r to shut-down.',
+                                 worker.name)
 
     def _busy(self):
         """ Return True while at least one server is in use. """
-        return any(self._in_use.values())
+        more_to_go = self._more_to_go()
+        for worker in self._workers:
+            for job in worker.assigned:
+                if not job.superseded:
+                    return True
+            if more_to_go and not worker.started and not worker.retired:
+                return True
+        return False
+
+    def _dispatch(self):
+        """
+        Assign jobs to idle servers, then give busy servers a job to
+        start on when done. If no jobs are left for an idle server,
+        take back a job another server hasn't started.
+        """
+        if self._stop:
+            for worker in self._workers:
+                self._reclaim(worker)
+            return
+
+        workers = [worker for worker in self._workers
+                          if worker.started and not worker.retired]
+        workers.sort(key=lambda worker: worker.slowness)  # Fastest first.
+        if sys.platform == 'win32':  #pragma no cover
+            # Don't start server processing until all servers are started,
+            # otherwise we have egg removal issues.
+            if len(workers) < len([worker for worker in self._workers
+                                          if not worker.retired]):
+                return
+
+        for depth in (0, 1):
+            for worker in workers:
+                if len(worker.assigned) != depth:
+                    continue
+                job = self._next_job()
+                if job is None:
+                    if depth == 0:
+                        job = self._steal_job() or self._speculate(worker)
+                    if job is None:
+                        if depth == 0:
+                            continue  # Maybe a straggler for next server.
+                        return
+                self._assign(worker, job)
+
+    def _assign(self, worker, job):
+        """ Send `job` to `worker`. """
+        self._logger.debug('    assign case %d to %r', job.seqno, worker.name)
+        self._prepare_case(job)
+        job.worker = worker
+        worker.assigned.append(job)
+        worker.request_q.put(job)
+
+    def _reclaim(self, worker, first=False):
+        """
+        Take back jobs `worker` hasn't started (only the last one if
+        `first`). Returns the reclaimed jobs.
+        """
+        jobs = []
+        for job in list(reversed(worker.assigned)):
+            speculative = job.original is not None
+            if not self._cancel(job):
+                break
+            if not job.superseded and not speculative:
+                jobs.insert(0, job)
+                if first:
+                    break
+        return [job.requeue() for job in jobs]
+
+    def _cancel(self, job):
+        """ Take back `job` if it hasn't started. Returns True if taken. """
+        worker = job.worker
+        with worker.lock:
+            if not job.started:
+                job.cancelled = True
+        if job.cancelled:
+            worker.assigned.remove(job)
+            if job.twin is not None:
+                job.twin.twin = None
+                job.twin = None
+        return job.cancelled
+
+    def _steal_job(self):
+        """ Return a job assigned to a busy server which hasn't started. """
+        for worker in self._workers:
+            if len(worker.assigned) > 1:
+                jobs = self._reclaim(worker, first=True)
+                if jobs:
+                    self._logger.debug('    took case %d from %r',
+                                       jobs[0].seqno, worker.name)
+                    return jobs[0]
+        return None
+
+    def _speculate(self, idle):
+        """
+        Return a job re-running a case on another server which is expected
+        to finish sooner on `idle`, or None.
+        """
+        if not self.speculative:
+            return None
+        now = time.time()
+        load_time = idle.load_time if self.reload_model or not idle.loaded \
+                                   else 0.
+        straggler = None
+        longest = 0.
+        for worker in self._workers:
+            if worker is idle:
+                continue
+            for job in worker.assigned:
+                if not job.started or job.begun is None or job.superseded \
+                   or job.twin is not None or job.original is not None:
+                    continue
+                there = self._costs.estimate(job, worker)
+                here = self._costs.estimate(job, idle)
+                if there is None:
+                    return None  # Nothing known yet.
+                elapsed = now - job.begun
+                remaining = there - elapsed
+                if remaining <= 0.:
+                    remaining = elapsed  # Overdue, assume as long again.
+                if remaining >= _SPECULATION_RATIO * (here + load_time) and \
+                   remaining > longest:
+                    straggler = job
+                    longest = remaining
+        if straggler is None:
+            return None
+
+        job = straggler.speculate()
+        job.twin = straggler
+        straggler.twin = job
+        self._logger.debug('    re-running case %d from %r, %.1f sec left',
+                           straggler.seqno, straggler.worker.name, longest)
+        if self._stats is not None:
+            self._stats['speculated'] += 1
+        return job
+
+    def _retire(self, worker):
+        """ Stop assigning jobs to `worker`, requeue its pending jobs. """
+        worker.retired = True
+        self._todo[0:0] = self._reclaim(worker)
 
     def _cleanup(self, remove_egg=True):
         """
@@ -369,109 +716,19 @@ class CaseIterDriverBase(Driver):
               for workers which haven't shut down by now.
         """
         self._reply_q = None
-        self._server_lock = None
-
-        self._servers = {}
-        self._top_levels = {}
-        self._server_info = {}
-        self._queues = {}
-        self._in_use = {}
-        self._server_states = {}
-        self._server_cases = {}
-        self._exceptions = {}
-        self._load_failures = {}
+        self._workers = []
 
         self._todo = []
         self._rerun = []
+        self._ahead = []
 
         if self._egg_file and os.path.exists(self._egg_file):
             os.remove(self._egg_file)
             self._egg_file = None
 
-    def _server_ready(self, server, stepping=False):
-        """
-        Responds to asynchronous callbacks during :meth:`execute` to run cases
-        retrieved from `self._iter`.  Results are processed by `recorder`.
-        If `stepping`, then we don't grab any new cases.
-        Returns True if this server is still in use.
-        """
-        state = self._server_states[server]
-        self._logger.debug('server %r state %s', server, state)
-        in_use = True
-
-        if state == _EMPTY:
-            if server is None or server in self._queues:
-                if self._more_to_go(stepping):
-                    self._logger.debug('    load_model')
-                    self._load_model(server)
-                    self._server_states[server] = _LOADING
-                else:
-                    self._logger.debug('    no more cases')
-                    in_use = False
-            # Difficult to force startup failure.
-            else:  #pragma nocover
-                in_use = False  # Never started.
-
-        elif state == _LOADING:
-            exc = self._model_status(server)
-            if exc is None:
-                in_use = self._start_next_case(server, stepping)
-            else:
-                self._logger.debug('    exception while loading: %r', exc)
-                if self.error_policy == 'ABORT':
-                    if self._abort_exc is None:
-                        self._abort_exc = exc
-                    self._stop = True
-                    self._server_states[server] = _EMPTY
-                    in_use = False
-                else:
-                    self._load_failures[server] += 1
-                    if self._load_failures[server] < 3:
-                        in_use = self._start_processing(server, stepping)
-                    else:
-                        self._logger.debug('    too many load failures')
-                        self._server_states[server] = _EMPTY
-                        in_use = False
-
-        elif state == _EXECUTING:
-            case, seqno = self._server_cases[server]
-            self._server_cases[server] = None
-            exc = self._model_status(server)
-            if exc is None:
-                # Grab the data from the model.
-                scope = self.parent if server is None else self._top_levels[server]
-                try:
-                    case.update_outputs(scope)
-                except Exception as exc:
-                    msg = 'Exception getting case outputs: %s' % exc
-                    self._logger.debug('    %s', msg)
-                    case.msg = '%s: %s' % (self.get_pathname(), msg)
-            else:
-                self._logger.debug('    exception while executing: %r', exc)
-                case.msg = str(exc)
-
-            if case.msg is not None and self.error_policy == 'ABORT':
-                if self._abort_exc is None:
-                    self._abort_exc = exc
-                self._stop = True
-
-            # Record the data.
-            self._record_case(case, seqno)
-
-            # Set up for next case.
-            in_use = self._start_processing(server, stepping, reload=True)
-
-        # Just being defensive, should never happen.
-        else:  #pragma no cover
-            msg = 'unexpected state %r for server %r' % (state, server)
-            self._logger.error(msg)
-            if self.error_policy == 'ABORT':
-                if self._abort_exc is None:
-                    self._abort_exc = RuntimeError(msg)
-                self._stop = True
-            in_use = False
-
-        return in_use
+        if remove_egg and self._template is not None:
+            unregister_model_template(self._template)
+            self._template = None
 
     def _more_to_go(self, stepping=False):
         """ Return True if there's more work to do. """
@@ -479,68 +736,59 @@ class CaseIterDriverBase(Driver):
             return False
         if self._todo or self._rerun:
             return True
-        if not stepping and self._iter is not None:
+        if not stepping and (self._iter is not None or self._ahead):
             return True
         return False
 
-    def _start_processing(self, server, stepping, reload=False):
+    def _next_job(self, stepping=False, todo=True):
         """
-        If there's something to do, start processing by either loading
-        the model, or going straight to running it.
+        Return the next job to run, or None. Jobs grabbed during startup
+        come first (unless not `todo`), then retries, then new cases from
+        `self._iter` (unless `stepping`).
         """
-        if self._more_to_go(stepping):
-            if reload:
-                if self.reload_model:
-                    self._logger.debug('    reload')
-                    self._load_model(server)
-                    self._server_states[server] = _LOADING
-                    in_use = True
-                else:
-                    in_use = self._start_next_case(server)
-            else:
-                self._logger.debug('    load')
-                self._load_model(server)
-                self._server_states[server] = _LOADING
-                in_use = True
-        else:
-            self._logger.debug('    no more cases')
-            self._server_states[server] = _EMPTY
-            in_use = False
-        return in_use
-
-    def _start_next_case(self, server, stepping=False):
-        """ Look for the next case and start it. """
-        if self._todo:
-            self._logger.debug('    run startup case')
-            case, seqno = self._todo.pop(0)
-            in_use = self._run_case(case, seqno, server)
-        elif self._rerun:
-            self._logger.debug('    rerun case')
-            case, seqno = self._rerun.pop(0)
-            in_use = self._run_case(case, seqno, server, rerun=True)
-        elif self._iter is None:
-            self._logger.debug('    no more cases')
-            in_use = False
-        elif stepping:
-            in_use = False
-        else:
+        if self._stop:
+            return None
+        if todo and self._todo:
+            return self._todo.pop(0)
+        if self._rerun:
+            return self._rerun.pop(0)
+        if stepping:
+            return None
+        return self._read_case()
+
+    def _read_case(self):
+        """
+        Return a job for the next case from `self._iter`, or None.
+        If cases have cost hints, up to `lookahead` cases are read and
+        the job for the most costly is returned. The iterator may return
+        None if no case is available until more results are recorded.
+        """
+        while self._iter is not None and len(self._ahead) < self.lookahead:
             try:
-                case = self._iter.next()
+                item = self._iter.next()
             except StopIteration:
                 self._logger.debug('    no more cases')
                 self._iter = None
-                self._seqno = 0
-                in_use = False
-            else:
-                self._logger.debug('    run next case')
-                self._seqno += 1
-                in_use = self._run_case(case, self._seqno, server)
-                
-        return in_use
-
-    def _run_case(self, case, seqno, server, rerun=False):
-        """ Setup and start a case. Returns True if started. """
-        if not rerun:
+                break
+            if item is None:
+                break  # Nothing available yet.
+            seqno, case = item
+            job = _Job(case, seqno, cost=self.get_case_cost(case))
+            self._ahead.append(job)
+            if job.cost is None:
+                break  # No hint, no point reading further.
+        if not self._ahead:
+            return None
+        best = 0
+        for i, job in enumerate(self._ahead):
+            if (job.cost or 0.) > (self._ahead[best].cost or 0.):
+                best = i
+        return self._ahead.pop(best)
+
+    def _prepare_case(self, job):
+        """ Setup case before it is run. """
+        case = job.case
+        if not job.rerun:
             if not case.max_retries:
                 case.max_retries = self.max_retries
             case.retries = 0
@@ -550,175 +798,255 @@ class CaseIterDriverBase(Driver):
         # Additional user-requested variables
         # These must be added here so that the outputs are in the cases
         # before they are in the server list.
-        for printvar in self.printvars:
-
-            if  '*' in printvar:
-                printvars = self._get_all_varpaths(printvar)
-            else:
-                printvars = [printvar]
+        if self.printvars:
+            for var, iotype, getter in self._get_printvars(check_iotype=False):
+                case.add_output(var, getter())
 
-            for var in printvars:
-                val = ExprEvaluator(var, scope=self.parent).evaluate()
-                case.add_output(var, val)
+    def _run_job(self, worker, job):
+        """
+        Load the model if necessary, then set inputs, execute, and get
+        outputs for `job`. `worker` is None to run in the local model.
+        Execution errors are saved in `job.exc`, and all errors are reported
+        in ``job.case.msg``. For a server this runs in the server's thread.
+        """
+        timing = job.timing
+        start = job.begun = time.time()
+        timing['queue'] = start - job.queued
 
+        if worker is None:
+            self._prepare_case(job)
+            scope = self.parent
+        else:
+            if not worker.loaded:
+                exc = self._remote_load_model(worker)
+                now = time.time()
+                timing['load'] = now - start
+                start = now
+                if exc is not None:
+                    job.exc = exc
+                    job.load_failed = True
+                    return
+                worker.loaded = True
+            scope = worker.top
+
+        case = job.case
         try:
-            for event in self.get_events(): 
-                try: 
-                    self._model_set(server, event, None, True)
+            for event in self.get_events():
+                try:
+                    scope.set(event, True)
                 except Exception as exc:
                     msg = 'Exception setting %r: %s' % (event, exc)
                     self._logger.debug('    %s', msg)
                     self.raise_exception(msg, _ServerError)
             try:
-                scope = self.parent if server is None else self._top_levels[server]
                 case.apply_inputs(scope)
             except Exception as exc:
                 msg = 'Exception setting case inputs: %s' % exc
                 self._logger.debug('    %s', msg)
                 self.raise_exception(msg, _ServerError)
-            self._server_cases[server] = (case, seqno)
-            self._model_execute(server)
-            self._server_states[server] = _EXECUTING
         except _ServerError as exc:
             case.msg = str(exc)
-            self._record_case(case, seqno)
-            return self._start_processing(server, stepping=False)
+            if worker is not None:
+                worker.loaded = False  # Model may be partially updated.
+            timing['execute'] = time.time() - start
+            return
+
+        try:
+            if worker is None:
+                self.workflow.run(case_id=case.uuid)
+            else:
+                scope.set_itername(self.get_itername(), job.seqno)
+                scope.run(case_id=case.uuid)
+        except Exception as exc:
+            job.exc = TracedError(exc, traceback.format_exc())
+            case.msg = str(job.exc)
+            if worker is None:
+                self._logger.critical('Caught exception: %r' % exc)
+            else:
+                self._logger.error('Caught exception from server %r,'
+                                   ' PID %d on %s: %r', worker.info['name'],
+                                   worker.info['pid'], worker.info['host'],
+                                   exc)
         else:
-            return True
+            # Grab the data from the model.
+            try:
+                case.update_outputs(scope)
+            except Exception as exc:
+                msg = 'Exception getting case outputs: %s' % exc
+                self._logger.debug('    %s', msg)
+                case.msg = '%s: %s' % (self.get_pathname(), msg)
+                job.exc = exc
+
+        if worker is not None and self.reload_model:
+            worker.loaded = False
+        timing['execute'] = time.time() - start
+
+    def _job_done(self, worker, job):
+        """ Process a completed job. """
+        job.done = True
+        timing = job.timing
+        if self._stats is not None:
+            self._stats['busy'] += timing['load'] + timing['execute']
+        if worker is not None:
+            worker.busy += timing['load'] + timing['execute']
+            if timing['load']:
+                worker.load_time += \
+                    _SMOOTHING * (timing['load'] - worker.load_time) \
+                    if worker.load_time else timing['load']
+            # A superseded straggler still tells us how slow its server is.
+            if not job.load_failed and job.case.msg is None:
+                self._costs.update(job, worker, timing['execute'])
+
+        if job.superseded:
+            self._logger.debug('    discarding duplicate result for case %d',
+                               job.seqno)
+            return
+
+        twin = job.twin
+        if twin is not None:
+            job.twin = twin.twin = None
+            if job.load_failed or job.case.msg is not None:
+                # Let twin provide the result.
+                job.superseded = True
+                twin.original = None
+                return
+            twin.superseded = True
+            self._cancel(twin)
+            if job.original is not None and self._stats is not None:
+                self._stats['speculative_wins'] += 1
+
+        if job.load_failed:
+            self._logger.debug('    exception while loading: %r', job.exc)
+            if self.error_policy == 'ABORT':
+                if self._abort_exc is None:
+                    self._abort_exc = job.exc
+                self._stop = True
+                self._retire(worker)
+            else:
+                self._todo.insert(0, job.requeue())
+                worker.load_failures += 1
+                if worker.load_failures >= 3:
+                    self._logger.debug('    too many load failures')
+                    self._retire(worker)
+            return
+
+        case = job.case
+        if worker is not None:
+            worker.n_cases += 1
+
+        if case.msg is not None:
+            self._logger.debug('    case %d failed: %s', job.seqno, case.msg)
+            if job.exc is not None and self.error_policy == 'ABORT':
+                if self._abort_exc is None:
+                    self._abort_exc = job.exc
+                self._stop = True
+
+        # Record the data.
+        finished = job.begun + timing['load'] + timing['execute']
+        timing['record'] = max(time.time() - finished, 0.)
+        case.timing = timing
+        self._record_case(case, job.seqno)
 
     def _record_case(self, case, seqno):
         """ If successful, record the case. Otherwise possibly retry. """
         if case.msg and case.retries < case.max_retries:
             case.msg = None
             case.retries += 1
-            self._rerun.append((case, seqno))
+            self._rerun.append(_Job(case, seqno, rerun=True))
         else:
-            
             for recorder in self.recorders:
                 recorder.record(case)
+            self._recorded.add(seqno)
+            if self._stats is not None:
+                self._stats['cases'] += 1
 
-    def _service_loop(self, name, resource_desc, credentials, reply_q):
+    def _service_loop(self, worker, resource_desc, credentials, reply_q):
         """ Each server has an associated thread executing this. """
         set_credentials(credentials)
 
         server, server_info = RAM.allocate(resource_desc)
         # Just being defensive, this should never happen.
         if server is None:  #pragma no cover
-            self._logger.error('Server allocation for %r failed :-(', name)
-            reply_q.put((name, False, None))
+            self._logger.error('Server allocation for %r failed :-(',
+                               worker.name)
+            reply_q.put((_STARTED, worker, None))
             return
         else:
             # Clear egg re-use indicator.
             server_info['egg_file'] = None
-            self._logger.debug('%r using %r', name, server_info['name'])
+            self._logger.debug('%r using %r', worker.name, server_info['name'])
             if self._logger.level == logging.NOTSET:
                 # By default avoid lots of protocol messages.
                 server.set_log_level(logging.DEBUG)
             else:
                 server.set_log_level(self._logger.level)
 
-        request_q = Queue.Queue()
-
         try:
-            with self._server_lock:
-                self._servers[name] = server
-                self._server_info[name] = server_info
-                self._queues[name] = request_q
-
-            reply_q.put((name, True, None))  # ACK startup.
+            worker.server = server
+            worker.info = server_info
+            reply_q.put((_STARTED, worker, None))  # ACK startup.
 
             while True:
-                request = request_q.get()
-                if request is None:
+                job = worker.request_q.get()
+                if job is None:
                     break
+                with worker.lock:
+                    if job.cancelled:
+                        continue
+                    job.started = True
                 try:
-                    result = request[0](request[1])
-                except Exception as req_exc:
-                    self._logger.error('%r: %s caused %r', name,
-                                       request[0], req_exc)
-                    result = None
-                else:
-                    req_exc = None
-                reply_q.put((name, result, req_exc))
+                    self._run_job(worker, job)
+                except Exception as exc:  #pragma no cover
+                    self._logger.error('%r: job %d caused %r', worker.name,
+                                       job.seqno, exc)
+                    job.exc = TracedError(exc, traceback.format_exc())
+                    job.case.msg = str(job.exc)
+                    worker.loaded = False
+                reply_q.put((_DONE, worker, job))
         except Exception as exc:  # pragma no cover
             # This can easily happen if we take a long time to allocate and
             # we get 'cleaned-up' before we get started.
-            if self._server_lock is not None:
-                self._logger.error('%r: %r', name, exc)
+            self._logger.error('%r: %r', worker.name, exc)
         finally:
-            self._logger.debug('%r releasing server', name)
+            self._logger.debug('%r releasing server', worker.name)
             RAM.release(server)
-            reply_q.put((name, True, None))  # ACK shutdown.
+            reply_q.put((_STOPPED, worker, None))  # ACK shutdown.
 
-    def _load_model(self, server):
-        """ Load a model into a server. """
-        self._exceptions[server] = None
-        if server is not None:
-            self._queues[server].put((self._remote_load_model, server))
+    def _remote_load_model(self, worker):
+        """ Load model into remote server. Returns exception or None. """
+        if self._template is not None:
+            try:
+                worker.top = worker.server.load_template(self._template)
+            except Exception as exc:
+                self._logger.error('server.load_template of %r failed: %r',
+                                   self._template, exc)
+                worker.top = None
+                return TracedError(exc, traceback.format_exc())
+            return None
 
-    def _remote_load_model(self, server):
-        """ Load model into remote server. """
-        egg_file = self._server_info[server].get('egg_file', None)
+        egg_file = worker.info.get('egg_file', None)
         if egg_file is None or egg_file is not self._egg_file:
             # Only transfer if changed.
             try:
                 filexfer(None, self._egg_file,
-                         self._servers[server], self._egg_file, 'b')
+                         worker.server, self._egg_file, 'b')
             # Difficult to force model file transfer error.
             except Exception as exc:  #pragma nocover
                 self._logger.error('server %r filexfer of %r failed: %r',
-                                   server, self._egg_file, exc)
-                self._top_levels[server] = None
-                self._exceptions[server] = TracedError(exc, traceback.format_exc())
-                return
+                                   worker.name, self._egg_file, exc)
+                worker.top = None
+                return TracedError(exc, traceback.format_exc())
             else:
-                self._server_info[server]['egg_file'] = self._egg_file
+                worker.info['egg_file'] = self._egg_file
         try:
-            tlo = self._servers[server].load_model(self._egg_file)
+            worker.top = worker.server.load_model(self._egg_file)
         # Difficult to force load error.
         except Exception as exc:  #pragma nocover
             self._logger.error('server.load_model of %r failed: %r',
                                self._egg_file, exc)
-            self._top_levels[server] = None
-            self._exceptions[server] = TracedError(exc, traceback.format_exc())
-        else:
-            self._top_levels[server] = tlo
-
-    def _model_set(self, server, name, index, value):
-        """ Set value in server's model. """
-        if server is None:
-            self.parent.set(name, value, index)
-        else:
-            self._top_levels[server].set(name, value, index)
-
-    def _model_execute(self, server):
-        """ Execute model in server. """
-        self._exceptions[server] = None
-        if server is None:
-            try:
-                self.workflow.run(case_id=self._server_cases[server][0].uuid)
-            except Exception as exc:
-                self._exceptions[server] = TracedError(exc, traceback.format_exc())
-                self._logger.critical('Caught exception: %r' % exc)
-        else:
-            self._queues[server].put((self._remote_model_execute, server))
-
-    def _remote_model_execute(self, server):
-        """ Execute model in remote server. """
-        case, seqno = self._server_cases[server]
-        try:
-            self._top_levels[server].set_itername(self.get_itername(), seqno)
-            self._top_levels[server].run(case_id=case.uuid)
-        except Exception as exc:
-            self._exceptions[server] = TracedError(exc, traceback.format_exc())
-            self._logger.error('Caught exception from server %r, PID %d on %s: %r',
-                               self._server_info[server]['name'],
-                               self._server_info[server]['pid'],
-                               self._server_info[server]['host'], exc)
-
-    def _model_status(self, server):
-        """ Return execute status from model. """
-        return self._exceptions[server]
+            worker.top = None
+            return TracedError(exc, traceback.format_exc())
+        return None
 
 
 class CaseIteratorDriver(CaseIterDriverBase):
@@ -747,6 +1075,14 @@ class CaseIteratorDriver(CaseIterDriverBase):
         else:
             self.raise_exception("iterator has not been set", ValueError)
 
+    def get_case_cost(self, case):
+        """
+        Return the cost hint for `case` from the iterator's optional
+        ``get_cost(case)`` method, or None.
+        """
+        get_cost = getattr(self.iterator, 'get_cost', None)
+        return None if get_cost is None else get_cost(case)
+
     def _select_cases(self):
         """ Select cases to be evaluated. """
         for i, case in enumerate(iter(self.iterator)):
@@ -137,9 +137,8 @@ class COBYLAdriver(Driver):
         
         Note: n, m, f, and g are unused inputs."""
         
-        self.set_parameters(xnew)
-        super(COBYLAdriver, self).run_iteration()
-        f = self.eval_objective()
+        objectives, constraints = self.run_point(xnew)
+        f = objectives.values()[0]
         
         if isnan(f):
             msg = "Numerical overflow in the objective"
@@ -147,24 +146,23 @@ class COBYLAdriver(Driver):
             
         # Constraints (COBYLA defines positive as satisfied)
         con_list = []
-        for v in self.get_ineq_constraints().values():
-            val = v.evaluate(self.parent)
+        for val in constraints.values():
             if '>' in val[2]:
                 con_list.append(val[0]-val[1])
             else:
                 con_list.append(val[1]-val[0])
                 
         # Side Constraints
-        for param in self.get_parameters().values():
-            val = param.evaluate(self.parent)
-        
+        for param, val in zip(self.get_parameters().values(), xnew):
             con_list.append(val - param.low)
             con_list.append(param.high - val)
                 
         g = array(con_list)
         
         # Write out some relevant information to the recorder
-        self.record_case()
+        # (a point satisfied from eval_cache has already been recorded)
+        if not self._eval_hit:
+            self.record_case()
             
         return f, g
         
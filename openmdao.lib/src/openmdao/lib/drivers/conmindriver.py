@@ -379,21 +379,26 @@ class CONMINdriver(DriverUsesDerivatives):
                 self.ffd_order = 1
                 super(CONMINdriver, self).run_iteration()
                 self.ffd_order = 0
+
+                obj = self.eval_objective()
+                cons = [v.evaluate(self.parent)
+                        for v in self.get_ineq_constraints().values()]
             else:
-                # update the parameters in the model
+                # Run the model for this step (unless it has already been
+                # evaluated at this point)
                 dvals = [float(val) for val in self.design_vals[:-2]]
-                self.set_parameters(dvals)
-        
-                # Run the model for this step
-                super(CONMINdriver, self).run_iteration()
+                objectives, constraints = self.run_point(dvals)
                 self.baseline_point = True
+
+                obj = objectives.values()[0]
+                cons = [constraints[name]
+                        for name in self.get_ineq_constraints()]
         
             # calculate objective
-            self.cnmn1.obj = self.eval_objective()
+            self.cnmn1.obj = obj
 
             # update constraint value array
-            for i, v in enumerate(self.get_ineq_constraints().values()):
-                val = v.evaluate(self.parent)
+            for i, val in enumerate(cons):
                 if '>' in val[2]:
                     self.constraint_vals[i] = val[1]-val[0]
                 else:
@@ -6,11 +6,13 @@
 """
 
 import csv
+import time
 
 # pylint: disable-msg=E0611,F0401
 from openmdao.lib.datatypes.api import Bool, List, Slot, Float, Str
 
 from openmdao.main.case import Case
+from openmdao.main.exceptions import traceback_str
 from openmdao.main.interfaces import IDOEgenerator, ICaseFilter, implements, \
                                      IHasParameters
 from openmdao.lib.drivers.caseiterdriver import CaseIterDriverBase
@@ -42,15 +44,106 @@ class DOEdriver(CaseIterDriverBase):
     case_filter = Slot(ICaseFilter, iotype='in',
                        desc='Selects cases to be run.')
 
+    batch = Bool(False, iotype='in',
+                 desc='If True, evaluate all cases with one call to the'
+                      ' execute_batch() method of the only component in'
+                      ' the workflow.')
+
     def execute(self):
         """Generate and evaluate cases."""
         self._csv_file = None
         try:
-            super(DOEdriver, self).execute()
+            if self.batch:
+                self._execute_batch()
+            else:
+                super(DOEdriver, self).execute()
         finally:
             if self._csv_file is not None:
                 self._csv_file.close()
 
+    def _execute_batch(self):
+        """
+        Evaluate all cases with one call to the ``execute_batch(inputs)``
+        method of the workflow's component, bypassing per-case input
+        setting, execution, and output retrieval. `inputs` maps input names
+        to lists of values and the method returns a dictionary mapping
+        output names to lists of values. Cases are then recorded together,
+        using a recorder's ``record_many(cases)`` method if it has one.
+        """
+        comps = self.workflow.get_components()
+        if len(comps) != 1 or not hasattr(comps[0], 'execute_batch'):
+            self.raise_exception('batch evaluation requires a workflow'
+                                 ' containing one component with an'
+                                 ' execute_batch() method', RuntimeError)
+        if self.get_events():
+            self.raise_exception('batch evaluation does not support events',
+                                 RuntimeError)
+        comp = comps[0]
+        prefix = comp.name + '.'
+
+        def local_name(path):
+            """ Return name of `path` within `comp`. """
+            name = path[len(prefix):]
+            if not path.startswith(prefix) or not name or \
+               '.' in name or '[' in name:
+                self.raise_exception("batch evaluation can't access '%s'"
+                                     % path, RuntimeError)
+            return name
+
+        self._stats = dict(start=time.time(), cases=0, busy=0., servers=1,
+                           speculated=0, speculative_wins=0)
+        try:
+            cases = list(self.get_case_iterator())
+            inputs = {}
+            for case in cases:
+                for path, value in case.items(iotype='in'):
+                    inputs.setdefault(local_name(path), []).append(value)
+            outputs = [(path, local_name(path)) for path in self.case_outputs]
+            for name, values in inputs.items():
+                if len(values) != len(cases):
+                    self.raise_exception("input '%s%s' isn't set by all cases"
+                                         % (prefix, name), RuntimeError)
+
+            start = time.time()
+            msg = None
+            try:
+                results = comp.execute_batch(inputs) if cases else {}
+            except Exception as exc:
+                if self.error_policy == 'ABORT':
+                    self.raise_exception('Run aborted: %s' % traceback_str(exc),
+                                         RuntimeError)
+                msg = '%s: %s' % (comp.get_pathname(), exc)
+                results = {}
+            elapsed = time.time() - start
+            self._stats['busy'] = elapsed
+
+            printvars = self._get_printvars() if self.printvars else []
+            timing = dict(queue=0., load=0., record=0.,
+                          execute=elapsed / len(cases) if cases else 0.)
+            for i, case in enumerate(cases):
+                case.msg = msg
+                for path, name in outputs:
+                    values = results.get(name)
+                    if values is not None:
+                        case.add_output(path, values[i])
+                    elif case.msg is None:
+                        case.msg = "%s: execute_batch() didn't return '%s'" \
+                                   % (comp.get_pathname(), name)
+                for var, iotype, getter in printvars:
+                    case.add_output(var, getter())
+                case.timing = timing.copy()
+
+            for recorder in self.recorders:
+                record_many = getattr(recorder, 'record_many', None)
+                if record_many is None:
+                    for case in cases:
+                        recorder.record(case)
+                else:
+                    record_many(cases)
+            self._stats['cases'] = len(cases)
+        finally:
+            self._finish_stats()
+
     def get_case_iterator(self):
         """Returns a new iterator over the Case set."""
         return self._get_cases()
@@ -170,8 +170,7 @@ class Genetic(Driver):
         self.record_case()
         
     def _run_model(self, chromosome):
-        self.set_parameters([val for val in chromosome])
-        self.run_iteration()
-        return self.eval_objective()
+        objectives, constraints = self.run_point([val for val in chromosome])
+        return objectives.values()[0]
     
     
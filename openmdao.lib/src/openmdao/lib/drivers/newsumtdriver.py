@@ -127,21 +127,27 @@ def user_function(info, x, obj, dobj, ddobj, g, dg, n2, n3, n4, imode, driver):
             driver.ffd_order = 1
             super(NEWSUMTdriver, driver).run_iteration()
             driver.ffd_order = 0
+            objectives = constraints = None
         else:
 
-            # Optimization step
-            driver.set_parameters(x)
-            super(NEWSUMTdriver, driver).run_iteration()
+            # Optimization step (unless this point has already been run)
+            objectives, constraints = driver.run_point(x)
             driver.baseline_point = True
 
         # evaluate objectives
         if info == 1:
-            obj = driver.eval_objective()
+            if objectives is None:
+                obj = driver.eval_objective()
+            else:
+                obj = objectives.values()[0]
         
         # evaluate constraint functions
         if info == 2:
-            for i, v in enumerate(driver.get_ineq_constraints().values()):
-                val = v.evaluate(driver.parent)
+            for i, (name, v) in enumerate(driver.get_ineq_constraints().items()):
+                if constraints is None:
+                    val = v.evaluate(driver.parent)
+                else:
+                    val = constraints[name]
                 if '>' in val[2]:
                     g[i] = val[0]-val[1]
                 else:
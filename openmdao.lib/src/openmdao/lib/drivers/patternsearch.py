@@ -0,0 +1,226 @@
+"""
+.. _`patternsearch.py`:
+
+``patternsearch.py`` -- Asynchronous parallel pattern search optimizer.
+
+"""
+
+from openmdao.main.datatypes.api import Enum, Float, Int
+
+from openmdao.main.case import Case
+from openmdao.main.hasparameters import HasParameters
+from openmdao.main.hasobjective import HasObjective
+from openmdao.main.interfaces import IHasParameters, IHasObjective, \
+                                     implements, IOptimizer
+from openmdao.lib.drivers.caseiterdriver import CaseIterDriverBase
+from openmdao.util.decorators import add_delegate
+
+
+@add_delegate(HasParameters, HasObjective)
+class AsyncPatternSearch(CaseIterDriverBase):
+    """
+    Minimizes the objective over the parameter bounds using asynchronous
+    parallel pattern search. Trial points are taken along each coordinate
+    direction (positive and negative) from the best point found so far,
+    and a new trial point is submitted as soon as any server finishes, so
+    servers aren't left idle waiting for the slowest evaluation of an
+    iteration. Any improvement becomes the new base point. A direction
+    which fails to improve on the base point has its step size reduced by
+    `contraction`. The search ends when all step sizes are below
+    `min_step`, or after `max_evals` evaluations.
+
+    Step sizes are relative to the parameter ranges. By default
+    `error_policy` is RETRY, and evaluations which still fail are treated as
+    not improving. Concurrent evaluation uses the same servers
+    and scheduling as :class:`CaseIteratorDriver`, and the fraction of server
+    time spent evaluating is reported in `utilization`.
+    """
+
+    implements(IHasParameters, IHasObjective, IOptimizer)
+
+    # pylint: disable-msg=E1101
+    initial_step = Float(0.1, low=0., high=1., exclude_low=True,
+                         iotype='in',
+                         desc='Initial step size, as a fraction of each'
+                              ' parameter range.')
+
+    min_step = Float(1e-4, low=0., exclude_low=True, iotype='in',
+                     desc='Search stops when all step sizes are smaller'
+                          ' than this.')
+
+    contraction = Float(0.5, low=0., high=1., exclude_low=True,
+                        exclude_high=True, iotype='in',
+                        desc='Factor applied to the step size of a'
+                             ' direction which fails to improve.')
+
+    error_policy = Enum('RETRY', values=('ABORT', 'RETRY'), iotype='in',
+                        desc='If ABORT, any error stops the search.'
+                             ' Otherwise failed evaluations are retried,'
+                             ' then treated as not improving.')
+
+    max_evals = Int(1000, low=1, iotype='in',
+                    desc='Maximum number of objective evaluations.')
+
+    best_objective = Float(iotype='out',
+                           desc='Best objective value found.')
+
+    evaluations = Int(0, iotype='out',
+                      desc='Number of objective evaluations.')
+
+    utilization = Float(0., iotype='out',
+                        desc='Fraction of server time spent evaluating.')
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncPatternSearch, self).__init__(*args, **kwargs)
+        self._init_search()
+
+    def _init_search(self):
+        """ Reset search state. """
+        self._objective = None  # Text of objective expression.
+        self._base = None       # Scaled parameter values of best point.
+        self._base_obj = None   # Objective at `_base`, None if unknown.
+        self._base_id = 0       # Incremented when `_base` moves.
+        self._steps = []        # Step size per direction.
+        self._pending = {}      # Case uuid -> (direction, step, base_id, x).
+        self._initial = None    # Case uuid of initial point.
+        self._deferred = []     # Results waiting for initial point.
+
+    def execute(self):
+        """ Perform the search, leaving the model at the best point. """
+        params = self.get_parameters().values()
+        for param in params:
+            if param.high <= param.low:
+                self.raise_exception('parameter %r has an empty range'
+                                     % param.target, ValueError)
+        if len(self.get_objectives()) != 1:
+            self.raise_exception('a single objective is required',
+                                 RuntimeError)
+        self.evaluations = 0
+        try:
+            super(AsyncPatternSearch, self).execute()
+        finally:
+            self.utilization = self.get_run_stats().get('utilization', 0.)
+
+        if self._base is not None:
+            if self._base_obj is not None:
+                self.best_objective = self._base_obj
+            self.run_point(self._unscale(params, self._base))
+        self._init_search()
+
+    def get_case_iterator(self):
+        """Returns a new iterator over the Case set."""
+        return self._get_cases()
+
+    def _get_cases(self):
+        """
+        Generate trial points. None is returned while no new point is
+        available until more results are recorded.
+        """
+        self._init_search()
+        params = self.get_parameters().values()
+        self._objective = self.get_objectives().values()[0].text
+        scope = self.parent
+        x0 = []
+        for param in params:
+            val = param.evaluate(scope) if param.start is None else param.start
+            val = (val - param.low) / (param.high - param.low)
+            x0.append(min(max(val, 0.), 1.))
+        self._base = x0
+        self._steps = [self.initial_step] * (2 * len(params))
+
+        case = self._make_case(params, x0, None, 0.)
+        self._initial = case.uuid
+        yield case
+        while True:
+            if self.evaluations + len(self._pending) >= self.max_evals:
+                if not self._pending:
+                    return
+                yield None
+                continue
+            trial = self._next_trial()
+            if trial is None:
+                if not self._pending:
+                    return  # Converged.
+                yield None
+            else:
+                yield self._make_case(params, *trial)
+
+    def _next_trial(self):
+        """
+        Return ``(x, direction, step)`` for the direction with the largest
+        available step from the base point, or None. Steps already being
+        tried from the base point are contracted.
+        """
+        base = self._base
+        pending = {}
+        for direction, step, base_id, x in self._pending.values():
+            if direction is not None and base_id == self._base_id:
+                pending[direction] = min(step, pending.get(direction, step))
+
+        best = None
+        for direction, step in enumerate(self._steps):
+            if direction in pending:
+                step = min(step, pending[direction] * self.contraction)
+            if step < self.min_step or (best is not None and step <= best[2]):
+                continue
+            index, sign = divmod(direction, 2)
+            val = base[index] + (step if sign == 0 else -step)
+            val = min(max(val, 0.), 1.)
+            if val == base[index]:
+                continue  # On bound.
+            x = list(base)
+            x[index] = val
+            best = (x, direction, step)
+        return best
+
+    def _make_case(self, params, x, direction, step):
+        """ Return case for evaluating scaled point `x`. """
+        case = self.set_parameters(self._unscale(params, x),
+                                   Case(parent_uuid=self._case_id))
+        for varname in self.get_events():
+            case.add_input(varname, True)
+        case.add_outputs([self._objective])
+        self._pending[case.uuid] = (direction, step, self._base_id, x)
+        return case
+
+    def _unscale(self, params, x):
+        """ Return parameter values for scaled point `x`. """
+        return [param.low + (param.high - param.low) * val
+                for param, val in zip(params, x)]
+
+    def _record_case(self, case, seqno):
+        """ Record the case, then update the search with its result. """
+        super(AsyncPatternSearch, self)._record_case(case, seqno)
+        if seqno not in self._recorded or case.uuid not in self._pending:
+            return  # Will be retried.
+
+        self.evaluations += 1
+        direction, step, base_id, x = self._pending.pop(case.uuid)
+        obj = None
+        if case.msg is None:
+            try:
+                obj = float(case.get_output(self._objective))
+            except (KeyError, TypeError, ValueError):
+                pass
+        if direction is None:  # Initial point.
+            self._base_obj = obj
+            deferred, self._deferred = self._deferred, []
+            for result in deferred:
+                self._update(*result)
+        elif self._initial in self._pending:
+            self._deferred.append((direction, step, base_id, x, obj))
+        else:
+            self._update(direction, step, base_id, x, obj)
+
+    def _update(self, direction, step, base_id, x, obj):
+        """ Update the search with result `obj` at scaled point `x`. """
+        if obj is not None and (self._base_obj is None or
+                                obj < self._base_obj):
+            self._logger.debug('    new best %g', obj)
+            self._base = x
+            self._base_obj = obj
+            self._base_id += 1
+            self._steps = [step] * len(self._steps)
+        elif base_id == self._base_id:
+            self._steps[direction] = min(self._steps[direction],
+                                         step * self.contraction)
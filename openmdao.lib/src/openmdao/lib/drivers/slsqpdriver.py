@@ -175,9 +175,8 @@ class SLSQPdriver(DriverUsesDerivatives):
         evaluations.
         
         Note: m, me, la, n, f, and g are unused inputs."""
-        self.set_parameters(xnew)
-        super(SLSQPdriver, self).run_iteration()      
-        f = self.eval_objective()
+        objectives, constraints = self.run_point(xnew)
+        f = objectives.values()[0]
 
         if isnan(f):
             msg = "Numerical overflow in the objective."
@@ -186,8 +185,8 @@ class SLSQPdriver(DriverUsesDerivatives):
         # Constraints
         if self.ncon > 0 :
             con_list = []
-            for v in self.get_constraints().values():
-                val = v.evaluate(self.parent)
+            for name in self.get_constraints():
+                val = constraints[name]
                 if '>' in val[2]:
                     con_list.append(val[0]-val[1])
                 else:
@@ -200,7 +199,9 @@ class SLSQPdriver(DriverUsesDerivatives):
             pyflush(self.iout)
             
         # Write out some relevant information to the recorder
-        self.record_case()
+        # (a point satisfied from eval_cache has already been recorded)
+        if not self._eval_hit:
+            self.record_case()
 
         return f, g
     
@@ -6,7 +6,9 @@ import logging
 import os
 import pkg_resources
 import re
+import shutil
 import sys
+import tempfile
 import time
 import unittest
 import nose
@@ -14,17 +16,20 @@ import nose
 import random
 import numpy.random as numpy_random
 
-from openmdao.main.api import Assembly, Component, Case, set_as_top
+from openmdao.main.api import Assembly, Component, Case, set_as_top, \
+                              Checkpointer
 from openmdao.main.interfaces import ICaseIterator
 from openmdao.main.eggchecker import check_save_load
 from openmdao.main.exceptions import RunStopped
-from openmdao.main.resource import ResourceAllocationManager, ClusterAllocator
+from openmdao.main.resource import ResourceAllocationManager, ClusterAllocator, \
+                                  LocalAllocator
 
 from openmdao.lib.datatypes.api import Float, Bool, Array, Int, Slot, Str
+from openmdao.lib.drivers import caseiterdriver
 from openmdao.lib.drivers.caseiterdriver import CaseIteratorDriver
 from openmdao.lib.drivers.simplecid import SimpleCaseIterDriver
 from openmdao.lib.casehandlers.api import ListCaseRecorder, ListCaseIterator, \
-                                          SequenceCaseFilter
+                                          SequenceCaseFilter, DBCaseRecorder
 
 from openmdao.test.cluster import init_cluster
 
@@ -55,6 +60,7 @@ class DrivenComponent(Component):
     raise_error = Bool(False, iotype='in')
     stop_exec = Bool(False, iotype='in')
     sleep = Float(0., iotype='in')
+    stall_file = Str('', iotype='in')
 
     rosen_suzuki = Float(0., iotype='out')
     sum_y = Float(0., iotype='out')
@@ -70,6 +76,10 @@ class DrivenComponent(Component):
         
         if self.sleep:
             time.sleep(self.sleep)
+        if self.stall_file and not os.path.exists(self.stall_file):
+            # Only the first evaluation stalls.
+            open(self.stall_file, 'w').close()
+            time.sleep(3.)
         self.rosen_suzuki = rosen_suzuki(self.x)
         self.sum_y = sum(self.y)
         if self.raise_error:
@@ -137,6 +147,13 @@ class TracedComponent(Component):
         self.itername = self.get_itername()
 
 
+class CostedCaseIterator(ListCaseIterator):
+    """ Cases cost more as their label increases. """
+
+    def get_cost(self, case):
+        return float(case.label)
+
+
 class TestCase(unittest.TestCase):
     """ Test CaseIteratorDriver. """
 
@@ -184,6 +201,18 @@ class TestCase(unittest.TestCase):
         self.run_cases(sequential=True, forced_errors=True, retry=False)
         self.run_cases(sequential=True, forced_errors=True, retry=True)
         
+    def test_printvar_expr(self):
+        # Printvars may be expressions, not just inputs and outputs.
+        self.model.driver.sequential = True
+        self.model.driver.iterator = ListCaseIterator(self.cases)
+        results = ListCaseRecorder()
+        self.model.driver.recorders = [results]
+        self.model.driver.printvars = ['driven.extra', 'driven.x[1]']
+        self.model.run()
+        self.assertEqual(len(results), len(self.cases))
+        for case in results.cases:
+            self.assertEqual(case['driven.x[1]'], case['driven.x'][1])
+
     def test_output_errors(self):
         inputs = [('driven.x', numpy_random.normal(size=4)),
                   ('driven.y', numpy_random.normal(size=10)),
@@ -238,6 +267,36 @@ class TestCase(unittest.TestCase):
         else:
             self.fail('Expected RuntimeError')
 
+    def test_checkpoint_restart(self):
+        logging.debug('')
+        logging.debug('test_checkpoint_restart')
+
+        stop_case = self.cases[1]  # Stop after 2 cases run.
+        stop_case['driven.stop_exec'] = True
+        self.model.driver.iterator = ListCaseIterator(self.cases)
+        self.model.driver.recorders = [ListCaseRecorder()]
+        self.model.driver.printvars = ['driven.extra']
+        self.model.driver.sequential = True
+        assert_raises(self, 'self.model.run()', globals(), locals(),
+                      RunStopped, 'driver: Run stopped')
+
+        tempdir = tempfile.mkdtemp()
+        try:
+            ckpt = Checkpointer(os.path.join(tempdir, 'ckpt'))
+            self.model.checkpoint(ckpt)
+            self.model.pre_delete()
+            self.model = self.model.restart(ckpt)
+        finally:
+            shutil.rmtree(tempdir)
+
+        # Only the cases not yet recorded are run.
+        self.assertEqual(len(self.model.driver.recorders[0]), 2)
+        self.model.driver.resume()
+        labels = [case.label for case in self.model.driver.recorders[0].cases]
+        self.assertEqual(sorted(labels, key=int),
+                         [str(i) for i in range(len(self.cases))])
+        self.verify_results()
+
     def test_concurrent(self):
         # This can always test using a LocalAllocator (forked processes).
         # It can also use a ClusterAllocator if the environment looks OK.
@@ -246,6 +305,96 @@ class TestCase(unittest.TestCase):
         init_cluster(encrypted=True, allow_shell=True)
         self.run_cases(sequential=False)
 
+    def test_fork_models(self):
+        # Servers load the model from a template rather than an egg.
+        logging.debug('')
+        logging.debug('test_fork_models')
+        if sys.platform == 'win32':
+            raise nose.SkipTest('fork_models requires fork()')
+
+        registered = []
+        orig_register = caseiterdriver.register_model_template
+        def register(name, tlo):
+            registered.append(name)
+            orig_register(name, tlo)
+
+        allocators = self.use_allocator(LocalAllocator('ForkHost',
+                                                       allow_shell=True,
+                                                       fork_models=True))
+        caseiterdriver.register_model_template = register
+        try:
+            self.run_cases(sequential=False)
+            self.assertEqual(len(registered), 1)
+            self.assertEqual(self.model.driver._egg_file, None)
+            stats = self.model.driver.get_run_stats()
+            self.assertEqual(stats['cases'], len(self.cases))
+        finally:
+            caseiterdriver.register_model_template = orig_register
+            self.restore_allocators(allocators)
+
+    def test_fork_models_pool(self):
+        # Pooled servers must not be reused for a later template.
+        logging.debug('')
+        logging.debug('test_fork_models_pool')
+        if sys.platform == 'win32':
+            raise nose.SkipTest('fork_models requires fork()')
+
+        allocators = self.use_allocator(LocalAllocator('ForkHost',
+                                                       allow_shell=True,
+                                                       fork_models=True))
+        ResourceAllocationManager.configure_pool(4, idle_timeout=600.)
+        try:
+            for i in range(2):
+                self.run_cases(sequential=False)
+                self.assertEqual(len(self.model.driver.recorders[0]),
+                                 len(self.cases))
+        finally:
+            ResourceAllocationManager.configure_pool(0)
+            self.restore_allocators(allocators)
+
+    def test_speculative(self):
+        # A case stalled on one server is re-run on the other, and only
+        # the first result is recorded.
+        logging.debug('')
+        logging.debug('test_speculative')
+
+        allocators = self.use_allocator(LocalAllocator('SpeculateHost',
+                                                       total_cpus=2,
+                                                       allow_shell=True))
+        tmpdir = tempfile.mkdtemp()
+        try:
+            self.cases[0].add_input('driven.stall_file',
+                                    os.path.join(tmpdir, 'stalled'))
+            self.model.driver.speculative = True
+            self.run_cases(sequential=False)
+            labels = [case.label
+                      for case in self.model.driver.recorders[0].cases]
+            self.assertEqual(sorted(labels),
+                             sorted([case.label for case in self.cases]))
+            stats = self.model.driver.get_run_stats()
+            self.assertEqual(stats['cases'], len(self.cases))
+            self.assertEqual(stats['servers'], 2)
+            self.assertEqual((stats['speculated'], stats['speculative_wins']),
+                             (1, 1))
+        finally:
+            self.restore_allocators(allocators)
+            shutil.rmtree(tmpdir)
+
+    def use_allocator(self, allocator):
+        """ Make `allocator` the only allocator, returning the originals. """
+        allocators = list(ResourceAllocationManager.list_allocators())
+        while ResourceAllocationManager.list_allocators():
+            ResourceAllocationManager.remove_allocator(0)
+        ResourceAllocationManager.add_allocator(allocator)
+        return allocators
+
+    def restore_allocators(self, allocators):
+        """ Restore `allocators` saved by :meth:`use_allocator`. """
+        while ResourceAllocationManager.list_allocators():
+            ResourceAllocationManager.remove_allocator(0)
+        for alloc in allocators:
+            ResourceAllocationManager.add_allocator(alloc)
+
     def test_concurrent_errors(self):
         logging.debug('')
         logging.debug('test_concurrent_errors')
@@ -261,7 +410,50 @@ class TestCase(unittest.TestCase):
         self.model.driver.extra_resources = {'allocator': name}
         self.run_cases(sequential=False)
 
-    def run_cases(self, sequential, forced_errors=False, retry=True):
+    def test_timing(self):
+        logging.debug('')
+        logging.debug('test_timing')
+        for sequential in (True, False):
+            self.run_cases(sequential=sequential, db_recorder=True)
+            for case in self.model.driver.recorders[0].cases:
+                self.assertEqual(sorted(case.timing.keys()),
+                                 ['execute', 'load', 'queue', 'record'])
+                if not sequential:
+                    self.assertTrue(case.timing['execute'] >= 0.2)
+            # Timing is persisted by the recorders.
+            for case in self.model.driver.recorders[1].get_iterator():
+                self.assertEqual(sorted(case.timing.keys()),
+                                 ['execute', 'load', 'queue', 'record'])
+            stats = self.model.driver.get_run_stats()
+            self.assertEqual(stats['cases'], len(self.cases))
+            if sequential:
+                self.assertEqual(stats['servers'], 1)
+            else:
+                self.assertTrue(stats['servers'] >= 1)
+            self.assertTrue(0. < stats['utilization'] <= 1.)
+            self.assertTrue(stats['rate'] > 0.)
+
+    def test_cost_hints(self):
+        logging.debug('')
+        logging.debug('test_cost_hints')
+
+        # Most costly cases within the lookahead window run first.
+        self.model.driver.iterator = CostedCaseIterator(self.cases)
+        self.model.driver.lookahead = 5
+        self.model.driver.recorders = [ListCaseRecorder()]
+        self.model.driver.printvars = ['driven.extra']
+        self.model.run()
+        labels = [case.label for case in self.model.driver.recorders[0].cases]
+        self.assertEqual(labels, ['4', '5', '6', '7', '8', '9',
+                                  '3', '2', '1', '0'])
+        self.verify_results()
+
+        stats = self.model.driver.get_run_stats()
+        self.assertEqual((stats['speculated'], stats['speculative_wins']),
+                         (0, 0))
+
+    def run_cases(self, sequential, forced_errors=False, retry=True,
+                  db_recorder=False):
         """ Evaluate cases, either sequentially or across multiple servers. """
         self.model.driver.sequential = sequential
         if not sequential:
@@ -270,6 +462,8 @@ class TestCase(unittest.TestCase):
         self.model.driver.iterator = ListCaseIterator(self.cases)
         results = ListCaseRecorder()
         self.model.driver.recorders = [results]
+        if db_recorder:
+            self.model.driver.recorders.append(DBCaseRecorder())
         self.model.driver.printvars = ['driven.extra']
         self.model.driver.error_policy = 'RETRY' if retry else 'ABORT'
 
@@ -17,8 +17,10 @@ from openmdao.lib.datatypes.api import Float, Bool
 from openmdao.lib.casehandlers.api import SequenceCaseFilter
 from openmdao.lib.drivers.doedriver import DOEdriver, NeighborhoodDOEdriver
 from openmdao.lib.casehandlers.api import ListCaseRecorder, DumpCaseRecorder
+from openmdao.lib.optproblems.branin import BraninComponent
 from openmdao.lib.doegenerators.api import OptLatinHypercube, FullFactorial, \
                                            CSVFile
+from openmdao.util.testutil import assert_raises
 
 # Capture original working directory so we can restore in tearDown().
 ORIG_DIR = os.getcwd()
@@ -227,6 +229,42 @@ class TestCaseDOE(unittest.TestCase):
         else:
             self.fail("Exception expected")
 
+    def test_batch(self):
+        top = set_as_top(Assembly())
+        top.add('branin', BraninComponent())
+        top.add('driver', DOEdriver())
+        top.driver.workflow.add('branin')
+        top.driver.DOEgenerator = FullFactorial(num_levels=4)
+        top.driver.record_doe = False
+        top.driver.add_parameter('branin.x', low=-5., high=10.)
+        top.driver.add_parameter('branin.y', low=0., high=15.)
+        top.driver.case_outputs = ['branin.f_xy']
+
+        expected = ListCaseRecorder()
+        top.driver.recorders = [expected]
+        top.run()
+
+        results = ListCaseRecorder()
+        top.driver.recorders = [results]
+        top.driver.batch = True
+        top.run()
+
+        self.assertEqual(len(results), 16)
+        self.assertEqual(top.driver.get_run_stats()['cases'], 16)
+        for case, orig in zip(results.cases, expected.cases):
+            self.assertEqual(case.msg, None)
+            self.assertEqual(case['branin.x'], orig['branin.x'])
+            self.assertEqual(case['branin.y'], orig['branin.y'])
+            self.assertAlmostEqual(case['branin.f_xy'], orig['branin.f_xy'])
+
+    def test_batch_errors(self):
+        self.model.driver.batch = True
+        self.model.driver.recorders = [ListCaseRecorder()]
+        assert_raises(self, 'self.model.run()', globals(), locals(),
+                      RuntimeError, 'driver: batch evaluation requires a'
+                      ' workflow containing one component with an'
+                      ' execute_batch() method')
+
     def run_cases(self, sequential, forced_errors=False, retry=True):
         # Evaluate cases, either sequentially or across  multiple servers.
 
@@ -0,0 +1,141 @@
+"""
+Test AsyncPatternSearch.
+"""
+
+import logging
+import os.path
+import pkg_resources
+import unittest
+
+from openmdao.main.api import Assembly, Component, set_as_top
+from openmdao.main.datatypes.api import Float
+from openmdao.lib.casehandlers.api import ListCaseRecorder
+from openmdao.lib.drivers.patternsearch import AsyncPatternSearch
+from openmdao.util.testutil import assert_raises, assert_rel_error
+
+# Capture original working directory so we can restore in tearDown().
+ORIG_DIR = os.getcwd()
+
+
+class Paraboloid(Component):
+    """ Minimum of 1.0 at (3, -1). """
+
+    x = Float(0., iotype='in')
+    y = Float(0., iotype='in')
+    y_max = Float(10., iotype='in')
+    f_xy = Float(0., iotype='out')
+
+    def execute(self):
+        if self.y > self.y_max:
+            self.raise_exception('y above %g' % self.y_max, RuntimeError)
+        self.f_xy = (self.x - 3.)**2 + 2. * (self.y + 1.)**2 + 1.
+
+
+class MyModel(Assembly):
+    """ Use AsyncPatternSearch with Paraboloid. """
+
+    def configure(self):
+        self.add('driver', AsyncPatternSearch())
+        self.add('comp', Paraboloid())
+        self.driver.workflow.add('comp')
+        self.driver.add_parameter('comp.x', low=-10., high=10.)
+        self.driver.add_parameter('comp.y', low=-10., high=10.)
+        self.driver.add_objective('comp.f_xy')
+
+
+class TestCase(unittest.TestCase):
+    """ Test AsyncPatternSearch. """
+
+    # Need to be in this directory or there are issues with egg loading.
+    directory = pkg_resources.resource_filename('openmdao.lib.drivers', 'test')
+
+    def setUp(self):
+        os.chdir(self.directory)
+        self.model = set_as_top(MyModel())
+
+    def tearDown(self):
+        self.model.pre_delete()
+        self.model = None
+
+        # Verify we didn't mess-up working directory.
+        end_dir = os.getcwd()
+        os.chdir(ORIG_DIR)
+        if os.path.realpath(end_dir).lower() != os.path.realpath(self.directory).lower():
+            self.fail('Ended in %s, expected %s' % (end_dir, self.directory))
+
+    def test_sequential(self):
+        logging.debug('')
+        logging.debug('test_sequential')
+        self.run_search(sequential=True)
+
+    def test_concurrent(self):
+        logging.debug('')
+        logging.debug('test_concurrent')
+        self.run_search(sequential=False)
+
+    def run_search(self, sequential):
+        driver = self.model.driver
+        driver.sequential = sequential
+        results = ListCaseRecorder()
+        driver.recorders = [results]
+
+        self.model.run()
+
+        assert_rel_error(self, self.model.comp.x, 3., 0.001)
+        assert_rel_error(self, self.model.comp.y, -1., 0.001)
+        assert_rel_error(self, driver.best_objective, 1., 0.001)
+        self.assertEqual(len(results), driver.evaluations)
+        self.assertTrue(driver.evaluations < driver.max_evals)
+        self.assertTrue(0. < driver.utilization <= 1.)
+        best = min(case['comp.f_xy'] for case in results.cases)
+        self.assertEqual(best, driver.best_objective)
+
+    def test_max_evals(self):
+        logging.debug('')
+        logging.debug('test_max_evals')
+        driver = self.model.driver
+        driver.max_evals = 7
+        results = ListCaseRecorder()
+        driver.recorders = [results]
+
+        self.model.run()
+
+        self.assertEqual(driver.evaluations, 7)
+        self.assertEqual(len(results), 7)
+
+    def test_failures(self):
+        # Failed evaluations don't stop the search, they just don't improve.
+        logging.debug('')
+        logging.debug('test_failures')
+        driver = self.model.driver
+        self.assertEqual(driver.error_policy, 'RETRY')
+        self.model.comp.y_max = 0.
+        for sequential in (True, False):
+            driver.sequential = sequential
+            results = ListCaseRecorder()
+            driver.recorders = [results]
+
+            self.model.run()
+
+            assert_rel_error(self, self.model.comp.x, 3., 0.001)
+            assert_rel_error(self, self.model.comp.y, -1., 0.001)
+            assert_rel_error(self, driver.best_objective, 1., 0.001)
+            self.assertEqual(len(results), driver.evaluations)
+            failed = [case for case in results.cases if case.msg]
+            self.assertTrue(failed)
+            for case in failed:
+                self.assertTrue(case['comp.y'] > 0.)
+
+    def test_empty_range(self):
+        self.model.driver.clear_parameters()
+        self.model.driver.add_parameter('comp.x', low=1., high=1.)
+        assert_raises(self, 'self.model.run()', globals(), locals(),
+                      ValueError, "driver: parameter 'comp.x' has an empty range")
+
+
+if __name__ == '__main__':
+    import nose
+    import sys
+    sys.argv.append('--cover-package=openmdao.lib.drivers')
+    sys.argv.append('--cover-erase')
+    nose.runmodule()
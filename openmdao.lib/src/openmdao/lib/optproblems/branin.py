@@ -1,5 +1,7 @@
 from math import cos, pi
 
+from numpy import array, broadcast_arrays, cos as array_cos
+
 from openmdao.main.api import Component
 from openmdao.main.problem_formulation import OptProblem
 
@@ -13,6 +15,15 @@ class BraninComponent(Component):
     
     def execute(self):
         self.f_xy = (self.y-(5.1/(4.*pi**2.))*self.x**2.+5.*self.x/pi-6.)**2.+10.*(1.-1./(8.*pi))*cos(self.x)+10.
+
+    def execute_batch(self, inputs):
+        """Evaluate `f_xy` for a batch of points in one call. `inputs` maps
+        input names to lists of values, inputs not given keep their current
+        value. Returns a dictionary mapping output names to lists."""
+        x, y = broadcast_arrays(array(inputs.get('x', [self.x]), dtype=float),
+                                array(inputs.get('y', [self.y]), dtype=float))
+        f_xy = (y-(5.1/(4.*pi**2.))*x**2.+5.*x/pi-6.)**2.+10.*(1.-1./(8.*pi))*array_cos(x)+10.
+        return {'f_xy': f_xy.tolist()}
     
 class BraninProblem(OptProblem): 
     """Branin Test Problem Definition""" 
@@ -5,7 +5,9 @@ import logging
 
 # pylint: disable-msg=E0611,F0401
 try:
-    from numpy import array, zeros, dot, ones, arange, eye, abs, vstack, exp, diag
+    from numpy import array, zeros, dot, ones, arange, eye, abs, vstack, exp, diag, \
+                      column_stack
+    from numpy import sqrt as npsqrt
     from numpy.linalg import det, linalg, lstsq
     from scipy.linalg import cho_factor, cho_solve
     from scipy.optimize import fmin
@@ -103,6 +105,37 @@ class KrigingSurrogate(Container):
         
         return NormalDistribution(f, RMSE)
         
+    def predict_batch(self, X):
+        """Calculates predicted values of the response for each list of
+        inputs in `X`, as :meth:`predict` would, with a single solve for
+        all of the points. Returns a list of NormalDistributions.
+        """
+        if self.m == None: #untrained surrogate
+            raise RuntimeError("KrigingSurrogate has not been trained, so no "
+                               "prediction can be made")
+        Y = self.Y
+        thetas = 10.**self.thetas
+        XX = array(self.X)
+        new_x = array(X, dtype=float).reshape((-1, self.m))
+        r = zeros((len(new_x), self.n))
+        for i in range(self.n):
+            r[:, i] = dot((new_x-XX[i])**2., thetas)
+        r = exp(-r)
+
+        one = ones(self.n)
+        rhs = column_stack([Y-dot(one, self.mu), one, r.T])
+        if self.R_fact is not None:
+            R_fact = (self.R_fact[0].T,not self.R_fact[1])
+            sol = cho_solve(R_fact, rhs)
+        else:
+            sol = lstsq(self.R.T, rhs)[0]
+
+        f = self.mu + dot(r, sol[:, 0])
+        term1 = (r*sol[:, 2:].T).sum(axis=1)
+        term2 = (1.0 - dot(one, sol[:, 2:]))**2./dot(one, sol[:, 1])
+        RMSE = npsqrt(abs(self.sig2*(1.0-term1+term2)))
+
+        return [NormalDistribution(mu, sigma) for mu, sigma in zip(f, RMSE)]
 
     def train(self,X,Y):
         """Train the surrogate model with the given set of inputs and outputs."""
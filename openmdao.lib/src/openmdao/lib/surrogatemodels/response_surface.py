@@ -61,6 +61,21 @@ class ResponseSurface(Container):
         new_y = new_x*self.betas
         return new_y[0,0]
 
+    def predict_batch(self, X):
+        """Calculates predicted values of the response for each list of
+        inputs in `X`, as :meth:`predict` would, with a single matrix
+        product for all of the points. Returns a list of values."""
+
+        new_x = matrix(X, dtype=float).reshape((-1, self.n))
+        new_x = concatenate((matrix(ones((new_x.shape[0],1))),new_x),1)
+        for i in range(1,self.n+1):
+            new_x = concatenate((new_x,power(new_x[:,i],2)),1)
+        for i in range(1,self.n):
+            for j in range(i+1,self.n+1):
+                new_x = concatenate((new_x,multiply(new_x[:,i],new_x[:,j])),1)
+
+        return (new_x*self.betas).A1.tolist()
+
 
 if __name__ == "__main__":
     
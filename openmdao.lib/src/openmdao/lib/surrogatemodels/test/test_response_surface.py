@@ -5,6 +5,7 @@ from numpy import array,round,linspace,sin,cos,pi
 import numpy as np
 
 from openmdao.lib.surrogatemodels.logistic_regression import LogisticRegression
+from openmdao.lib.surrogatemodels.response_surface import ResponseSurface
 
 
 class LogisticRegressionTest(unittest.TestCase):
@@ -42,4 +43,26 @@ class LogisticRegressionTest(unittest.TestCase):
     def test_uncertain_value(self): 
         lr = LogisticRegression()
         
-        self.assertEqual(lr.get_uncertain_value(1.0),1.0)
\ No newline at end of file
+        self.assertEqual(lr.get_uncertain_value(1.0),1.0)
+
+
+class ResponseSurfaceTest(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(10)
+
+        self.X_train = np.random.uniform(-5., 5., (30, 3))
+        self.Y_train = [x[0]**2 - 2.*x[0]*x[1] + 3.*x[2] + 1.
+                        for x in self.X_train]
+
+    def test_predict_batch(self):
+        rs = ResponseSurface(self.X_train, self.Y_train)
+
+        X = np.random.uniform(-5., 5., (10, 3))
+        expected = [rs.predict(x) for x in X]
+        # Lists of lists work too, and a single point gives a list of one.
+        for points in (X, X.tolist(), X[:1]):
+            batch = rs.predict_batch(points)
+            self.assertEqual(len(batch), len(points))
+            for value, exp in zip(batch, expected):
+                self.assertAlmostEqual(value, exp, places=8)
@@ -2,42 +2,53 @@
 Pseudo package containing all of the main classes/objects in the 
 openmdao.main API.
 
+Names are imported from their defining modules the first time they are
+used, so importing this module doesn't pull in everything it lists.
 """
 
-from openmdao.util.log import logger, enable_console
-from openmdao.main.expreval import ExprEvaluator
+from openmdao.util.lazyimport import lazy_import
 
-from openmdao.main.factory import Factory
-from openmdao.main.factorymanager import create, get_available_types
+lazy_import(__name__, [
+    ('openmdao.util.log', ('logger', 'enable_console')),
+    ('openmdao.main.expreval', ('ExprEvaluator',)),
 
-from openmdao.main.container import Container, get_default_name, \
-                                    create_io_traits
-from openmdao.main.vartree import VariableTree
-from openmdao.main.component import Component, SimulationRoot
-from openmdao.main.component_with_derivatives import ComponentWithDerivatives
-from openmdao.main.driver_uses_derivatives import DriverUsesDerivatives
-from openmdao.main.assembly import Assembly, set_as_top, dump_iteration_tree
-from openmdao.main.driver import Driver
-from openmdao.main.workflow import Workflow
-from openmdao.main.dataflow import Dataflow
-from openmdao.main.seqentialflow import SequentialWorkflow
-from openmdao.main.variable import Variable
+    ('openmdao.main.factory', ('Factory',)),
+    ('openmdao.main.factorymanager', ('create', 'get_available_types')),
 
-from openmdao.main.exceptions import ConstraintError
+    ('openmdao.main.container', ('Container', 'get_default_name',
+                                 'create_io_traits')),
+    ('openmdao.main.vartree', ('VariableTree',)),
+    ('openmdao.main.component', ('Component', 'SimulationRoot')),
+    ('openmdao.main.component_with_derivatives',
+     ('ComponentWithDerivatives',)),
+    ('openmdao.main.driver_uses_derivatives', ('DriverUsesDerivatives',)),
+    ('openmdao.main.assembly', ('Assembly', 'set_as_top',
+                                'dump_iteration_tree')),
+    ('openmdao.main.driver', ('Driver',)),
+    ('openmdao.main.evalcache', ('EvalCache',)),
+    ('openmdao.main.workflow', ('Workflow',)),
+    ('openmdao.main.dataflow', ('Dataflow',)),
+    ('openmdao.main.seqentialflow', ('SequentialWorkflow',)),
+    ('openmdao.main.variable', ('Variable',)),
 
-from openmdao.main.filevar import FileMetadata, FileRef
+    ('openmdao.main.exceptions', ('ConstraintError',)),
 
-from openmdao.main.case import Case
+    ('openmdao.main.filevar', ('FileMetadata', 'FileRef')),
 
-from openmdao.main.arch import Architecture
-from openmdao.main.problem_formulation import ArchitectureAssembly, OptProblem
+    ('openmdao.main.case', ('Case',)),
 
-from openmdao.util.eggsaver import SAVE_PICKLE, SAVE_CPICKLE #, SAVE_YAML, SAVE_LIBYAML
+    ('openmdao.main.arch', ('Architecture',)),
+    ('openmdao.main.problem_formulation', ('ArchitectureAssembly',
+                                           'OptProblem')),
 
-from openmdao.units import convert_units
+    ('openmdao.util.eggsaver', ('SAVE_PICKLE', 'SAVE_CPICKLE')),
+    ('openmdao.main.checkpoint', ('Checkpointer',)),
 
-from zope.interface import implements, Attribute, Interface
+    ('openmdao.units', ('convert_units',)),
 
-# TODO: This probably shouldn't be here. Removing it will require edits to some
-# of our plugins
-from openmdao.main.datatypes.slot import Slot
+    ('zope.interface', ('implements', 'Attribute', 'Interface')),
+
+    # TODO: This probably shouldn't be here. Removing it will require edits
+    # to some of our plugins
+    ('openmdao.main.datatypes.slot', ('Slot',)),
+])
@@ -20,7 +20,7 @@ from openmdao.main.interfaces import implements, IAssembly, IDriver, IArchitectu
                                      ICaseIterator, ICaseRecorder, IDOEgenerator
 from openmdao.main.mp_support import has_interface
 from openmdao.main.container import find_trait_and_value, _copydict
-from openmdao.main.component import Component
+from openmdao.main.component import Component, ConfigGeneration
 from openmdao.main.variable import Variable
 from openmdao.main.datatypes.api import Slot
 from openmdao.main.driver import Driver, Run_Once
@@ -564,7 +564,8 @@ class Assembly (Component):
             super(Assembly, self).disconnect(src, dest)
             self.raise_exception("Can't connect '%s' to '%s': %s" % (src, dest, str(err)),
                                  RuntimeError)
-        
+
+        ConfigGeneration.bump()
         if not srcexpr.refs_parent():
             if not destexpr.refs_parent():
                 # if it's an internal connection, could change dependencies, so we have
@@ -604,6 +605,7 @@ class Assembly (Component):
             super(Assembly, self).disconnect(u, v)
                 
         self._exprmapper.disconnect(varpath, varpath2)
+        ConfigGeneration.bump()
             
     def config_changed(self, update_parent=True):
         """Call this whenever the configuration of this Component changes,
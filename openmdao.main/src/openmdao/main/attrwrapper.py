@@ -3,7 +3,7 @@ __all__ = ['AttrWrapper']
 
 import operator
 
-from openmdao.units import PhysicalQuantity
+from openmdao.units import PhysicalQuantity, get_conversion_tuple
 
 class AttrWrapper(object):
     """A class that encapsulates a value and any metadata necessary
@@ -74,6 +74,8 @@ class UnitsAttrWrapper(AttrWrapper):
 
     def convert_from(self, wrapper):
         if isinstance(wrapper, UnitsAttrWrapper):
-            return wrapper.pq.convert_value(self.pq.unit)
+            factor, offset = get_conversion_tuple(wrapper.metadata['units'],
+                                                  self.metadata['units'])
+            return (wrapper.value + offset) * factor
         raise ValueError("incompatible AttrWrapper objects")
         
\ No newline at end of file
@@ -88,6 +88,7 @@ class Case(object):
         else:
             self.uuid = str(uuid1())  # unique identifier
         self.parent_uuid = str(parent_uuid)  # identifier of parent case, if any
+        self.timing = None  # Optional dictionary of evaluation times.
 
         if inputs: 
             self.add_inputs(inputs)
@@ -245,6 +246,7 @@ class Case(object):
         self.parent_uuid = ''
         self.uuid = str(uuid1())
         self.retries = None
+        self.timing = None
         for key in self._outputs.keys():
             self._outputs[key] = _Missing
 
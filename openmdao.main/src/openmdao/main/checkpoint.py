@@ -0,0 +1,158 @@
+"""
+Incremental checkpoints of an object graph.
+
+A checkpoint is a directory containing the pickled object graph
+(``state.pkl``) and one ``.npy`` file per large NumPy array.  Array files are
+named by a digest of their contents, so an array that hasn't changed since the
+previous checkpoint is not written again, and on restart arrays are mapped
+copy-on-write rather than read into memory.
+"""
+
+#public symbols
+__all__ = ['Checkpointer']
+
+import cPickle
+import hashlib
+import logging
+import os.path
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_STATE = 'state.pkl'
+_ARRAY_EXT = '.npy'
+
+
+class Checkpointer(object):
+    """
+    Saves and restores checkpoints in `directory`.
+
+    directory: string
+        Directory for checkpoint files. It is created if necessary.
+
+    threshold: int
+        Arrays of at least this many bytes are stored out-of-band.
+        Smaller arrays are pickled with the rest of the state.
+
+    logger: :class:`logging.Logger`
+        Used for logging progress, default is root logger.
+    """
+
+    def __init__(self, directory, threshold=65536, logger=None):
+        self.directory = os.path.abspath(directory)
+        self.threshold = threshold
+        self._logger = logger or logging.getLogger()
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+
+        self.arrays_written = 0  # Array files written by the last save.
+        self.arrays_reused = 0   # Array files reused by the last save.
+
+    @property
+    def state_path(self):
+        """ Path to the pickled state of the most recent checkpoint. """
+        return os.path.join(self.directory, _STATE)
+
+    def exists(self):
+        """ Return True if a checkpoint has been saved. """
+        return os.path.exists(self.state_path)
+
+    def save(self, root):
+        """
+        Save the state of `root` and its children. Array files from earlier
+        checkpoints which are no longer referenced are removed once the new
+        state has been written.
+
+        root: object
+            The root of the object tree to save.
+        """
+        self.arrays_written = 0
+        self.arrays_reused = 0
+        keys = {}  # id(array) -> key, for arrays referenced more than once
+        refs = []  # Keep arrays alive so ids stay unique during the dump.
+
+        def persistent_id(obj):
+            if numpy is None or not isinstance(obj, numpy.ndarray) or \
+               obj.dtype.hasobject or obj.nbytes < self.threshold:
+                return None
+            try:
+                return keys[id(obj)]
+            except KeyError:
+                key = self._save_array(obj)
+                keys[id(obj)] = key
+                refs.append(obj)
+                return key
+
+        parent = getattr(root, 'parent', None)
+        if parent is not None:
+            root.parent = None  # Don't want to save stuff above us.
+        tmp_path = self.state_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as out:
+                pickler = cPickle.Pickler(out, -1)
+                pickler.persistent_id = persistent_id
+                pickler.dump(root)
+        finally:
+            if parent is not None:
+                root.parent = parent
+
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)  # Windows won't rename over it.
+        os.rename(tmp_path, self.state_path)
+
+        self._logger.debug('checkpoint %s: %d arrays written, %d reused',
+                           self.directory, self.arrays_written,
+                           self.arrays_reused)
+        self._remove_unused(set(keys.values()))
+
+    def load(self):
+        """
+        Load and return the root object of the most recent checkpoint.
+        Out-of-band arrays are memory-mapped copy-on-write.
+        """
+        arrays = {}  # Preserve sharing of arrays referenced more than once.
+
+        def persistent_load(key):
+            try:
+                return arrays[key]
+            except KeyError:
+                path = os.path.join(self.directory, key+_ARRAY_EXT)
+                arr = arrays[key] = numpy.load(path, mmap_mode='c')
+                return arr
+
+        with open(self.state_path, 'rb') as inp:
+            unpickler = cPickle.Unpickler(inp)
+            unpickler.persistent_load = persistent_load
+            return unpickler.load()
+
+    def _save_array(self, arr):
+        """ Write `arr` unless an identical array file exists. """
+        arr = numpy.ascontiguousarray(arr)
+        digest = hashlib.sha1(arr.dtype.str)
+        digest.update(str(arr.shape))
+        digest.update(buffer(arr))
+        key = digest.hexdigest()
+
+        path = os.path.join(self.directory, key+_ARRAY_EXT)
+        if os.path.exists(path):
+            self.arrays_reused += 1
+        else:
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as out:
+                numpy.save(out, arr)
+            os.rename(tmp_path, path)
+            self.arrays_written += 1
+        return key
+
+    def _remove_unused(self, keys):
+        """ Remove array files whose key isn't in `keys`. """
+        for name in os.listdir(self.directory):
+            key, ext = os.path.splitext(name)
+            if ext == _ARRAY_EXT and key not in keys:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError as exc:  # Still mapped on Windows.
+                    self._logger.debug('checkpoint: removing %s failed: %s',
+                                       name, exc)
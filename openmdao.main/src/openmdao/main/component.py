@@ -1,7 +1,7 @@
 """ Class definition for Component. """
 
 #public symbols
-__all__ = ['Component', 'SimulationRoot']
+__all__ = ['Component', 'SimulationRoot', 'ConfigGeneration']
 
 
 import fnmatch
@@ -35,6 +35,8 @@ from openmdao.main.rbac import rbac
 from openmdao.main.mp_support import has_interface, is_instance
 from openmdao.main.datatypes.api import Bool, List, Str, Int, Slot
 from openmdao.main.publisher import Publisher
+from openmdao.main.validity import ValidityMap
+from openmdao.main.checkpoint import Checkpointer
 
 from openmdao.util.eggsaver import SAVE_CPICKLE
 from openmdao.util.eggobserver import EggObserver
@@ -82,6 +84,26 @@ class SimulationRoot(object):
             return os.path.realpath(path).startswith(root)
 
 
+class ConfigGeneration(object):
+    """Singleton counter which is incremented whenever the configuration
+    of any component, driver, or workflow changes. Views of the model
+    structure (such as the GUI's dataflow and workflow) compare generations
+    to tell when they need to be rebuilt. There is one counter for the
+    whole process, not one per model."""
+
+    __count = 0
+
+    @staticmethod
+    def get():
+        """Return the current configuration generation."""
+        return ConfigGeneration.__count
+
+    @staticmethod
+    def bump():
+        """Record that some configuration changed."""
+        ConfigGeneration.__count += 1
+
+
 class DirectoryContext(object):
     """Supports using the 'with' statement in place of try-finally for
     :meth:`self.push_dir` and subsequent :meth:`self.pop_dir`."""
@@ -144,7 +166,7 @@ class Component(Container):
 
         # contains validity flag for each io Trait (inputs are valid since they're not connected yet,
         # and outputs are invalid)
-        self._valid_dict = dict([(name, t.iotype == 'in') \
+        self._valid_dict = ValidityMap([(name, t.iotype == 'in') \
             for name, t in self.class_traits().items() if t.iotype])
 
         # dependency graph between us and our boundaries (bookkeeps connections between our
@@ -170,6 +192,8 @@ class Component(Container):
         self._expr_sources = None
         self._connected_inputs = None
         self._connected_outputs = None
+        self._io_slots = None
+        self._conn_in_slots = None
 
         self.exec_count = 0
         self.derivative_exec_count = 0
@@ -199,7 +223,8 @@ class Component(Container):
             self._exec_state = state
             pub = Publisher.get_instance()
             if pub:
-                pub.publish('.'.join([self.get_pathname(), 'exec_state']), state)
+                pub.publish('.'.join([self.get_pathname(), 'exec_state']),
+                            state, coalesce=True)
 
     @rbac(('owner', 'user'))
     def get_itername(self):
@@ -254,12 +279,20 @@ class Component(Container):
         state['_expr_sources'] = None
         state['_connected_inputs'] = None
         state['_connected_outputs'] = None
+        state['_io_slots'] = None
+        state['_conn_in_slots'] = None
 
         return state
 
     def __setstate__(self, state):
         super(Component, self).__setstate__(state)
 
+        # states saved before validity was kept in a ValidityMap
+        if isinstance(self._valid_dict, dict):
+            self._valid_dict = ValidityMap(self._valid_dict.items())
+        self._io_slots = None
+        self._conn_in_slots = None
+
         # make sure all input callbacks are in place.  If callback is
         # already there, this will have no effect.
         for name, trait in self._alltraits().items():
@@ -362,9 +395,7 @@ class Component(Container):
         if self.parent is None:  # if parent is None, we're not part of an Assembly
                                  # so Variable validity doesn't apply. Just execute.
             self._call_execute = True
-            valids = self._valid_dict
-            for name in self.list_inputs():
-                valids[name] = True
+            self._valid_dict.update_many(self.list_inputs(), True)
         else:
             valids = self._valid_dict
             invalid_ins = [inp for inp in self.list_inputs(connected=True)
@@ -372,9 +403,9 @@ class Component(Container):
             if invalid_ins:
                 self._call_execute = True
                 self.parent.update_inputs(self.name, invalid_ins)
-                for name in invalid_ins:
-                    valids[name] = True
-            elif self._call_execute == False and len(self.list_outputs(valid=False)):
+                valids.update_many(invalid_ins, True)
+            elif self._call_execute == False and valids.num_invalid and \
+                 len(self.list_outputs(valid=False)):
                 self._call_execute = True
 
         if self._call_check_config:
@@ -435,13 +466,15 @@ class Component(Container):
         Overrides of this function must call this version.  This is only
         called if execute() actually ran.
         """
-        # make our output Variables valid again
-        valids = self._valid_dict
-        for name in self.list_outputs(valid=False):
-            valids[name] = True
+        # make our output Variables valid again, and
         ## make sure our inputs are valid too
-        for name in self.list_inputs(valid=False):
-            valids[name] = True
+        valids = self._valid_dict
+        if valids.num_invalid:
+            slots = self._get_io_slots()
+            if len(slots) == len(valids):
+                valids.set_all(True)
+            else:
+                valids.set_indices(slots, True)
         self._call_execute = False
         self._set_exec_state('VALID')
         self.publish_vars()
@@ -616,7 +649,7 @@ class Component(Container):
         """Return False if any of our variables is invalid."""
         if self._call_execute:
             return False
-        if False in self._valid_dict.values():
+        if self._valid_dict.num_invalid:
             self._call_execute = True
             return False
         if self.parent is not None:
@@ -639,12 +672,15 @@ class Component(Container):
         """
         if update_parent and hasattr(self, 'parent') and self.parent:
             self.parent.config_changed(update_parent)
+        ConfigGeneration.bump()
         self._input_names = None
         self._output_names = None
         self._connected_inputs = None
         self._connected_outputs = None
         self._container_names = None
         self._expr_sources = None
+        self._io_slots = None
+        self._conn_in_slots = None
         self._call_check_config = True
         self._call_execute = True
 
@@ -929,16 +965,28 @@ class Component(Container):
 
     def checkpoint(self, outstream, fmt=SAVE_CPICKLE):
         """Save sufficient information for a restart. By default, this
-        just calls *save()*.
+        just calls *save()*. If `outstream` is a :class:`Checkpointer`,
+        large arrays are stored out-of-band and only written if they have
+        changed since the previous checkpoint.
         """
-        self.save(outstream, fmt)
+        if isinstance(outstream, Checkpointer):
+            outstream.save(self)
+        else:
+            self.save(outstream, fmt)
 
     def restart(self, instream):
-        """Restore state using a checkpoint file. The checkpoint file is
+        """Restore state using a checkpoint file (or :class:`Checkpointer`)
+        and return the restored object. The checkpoint file is
         typically a delta from a full saved state file. If checkpoint is
         overridden, this should also be overridden.
         """
-        self.load(instream)
+        if isinstance(instream, Checkpointer):
+            top = instream.load()
+            top.cpath_updated()
+            top.parent = None
+            top.post_load()
+            return top
+        return self.load(instream)
 
     def save_to_egg(self, name, version, py_dir=None, require_relpaths=True,
                     child_objs=None, dst_dir=None, observer=None,
@@ -1418,9 +1466,33 @@ class Component(Container):
 
     def set_valid(self, names, valid):
         """Mark the io traits with the given names as valid or invalid."""
-        valids = self._valid_dict
-        for name in names:
-            valids[name] = valid
+        self._valid_dict.update_many(names, valid)
+
+    def _get_io_slots(self):
+        """Return the slots in our ValidityMap of all of our inputs and
+        outputs.
+        """
+        ins = self.list_inputs()
+        outs = self.list_outputs()
+        layout = self._valid_dict.layout
+        cache = self._io_slots
+        if cache is None or cache[0] is not ins or cache[1] is not outs \
+           or cache[2] != layout:
+            slots = self._valid_dict.indices(ins + outs)
+            self._io_slots = cache = (ins, outs, layout, slots)
+        return cache[3]
+
+    def _get_conn_in_slots(self):
+        """Return a dict mapping the names of our connected inputs to their
+        slots in our ValidityMap.
+        """
+        conn = self.list_inputs(connected=True)
+        layout = self._valid_dict.layout
+        cache = self._conn_in_slots
+        if cache is None or cache[0] is not conn or cache[1] != layout:
+            slots = dict(zip(conn, self._valid_dict.indices(conn)))
+            self._conn_in_slots = cache = (conn, layout, slots)
+        return cache[2]
 
     @rbac(('owner', 'user'))
     def invalidate_deps(self, varnames=None, force=False):
@@ -1442,23 +1514,19 @@ class Component(Container):
 
         # only invalidate connected inputs. inputs that are not connected
         # should never be invalidated
+        conn = self._get_conn_in_slots()
         if varnames is None:
-            for var in self.list_inputs(connected=True):
-                valids[var] = False
-        else:
-            conn = self.list_inputs(connected=True)
-            if conn:
-                for var in varnames:
-                    if var in conn:
-                        valids[var] = False
+            valids.set_indices(conn.values(), False)
+        elif conn:
+            valids.set_indices([conn[var] for var in varnames if var in conn],
+                               False)
 
         # this assumes that all outputs are either valid or invalid
         if not force and outs and (valids[outs[0]] is False):
             # nothing to do because our outputs are already invalid
             return []
 
-        for out in outs:
-            valids[out] = False
+        valids.update_many(outs, False)
 
         return None  # None indicates that all of our outputs are invalid.
 
@@ -1523,7 +1591,7 @@ class Component(Container):
                         key = '.'.join([pname, var])
                         val = getattr(self, var)
                     lst.append((key, val))
-                pub.publish_list(lst)
+                pub.publish_list(lst, coalesce=True)
 
     def get_attributes(self, io_only=True):
         """ get attributes of component. includes inputs and ouputs and, if
@@ -177,6 +177,9 @@ class Container(SafeHasTraits):
         self._name = None
         self._cached_traits_ = None
 
+        # (childname, src) -> src transformed into the child's scope
+        self._src_xforms = {}
+
         if doc is not None:
             self.__doc__ = doc
 
@@ -435,6 +438,7 @@ class Container(SafeHasTraits):
                         list_fixups[name] = val
         state['_added_traits'] = dct
         state['_cached_traits_'] = None
+        state['_src_xforms'] = {}
         state['_list_fixups'] = list_fixups
         return state
 
@@ -442,6 +446,7 @@ class Container(SafeHasTraits):
         """Restore this component's state."""
         list_fixups = state.pop('_list_fixups', {})
         super(Container, self).__setstate__({})
+        self._src_xforms = {}
         self.__dict__.update(state)
 
         # restore dynamically added traits, since they don't seem
@@ -518,6 +523,7 @@ class Container(SafeHasTraits):
         super(Container, self).add_trait(name, trait)
         if self._cached_traits_ is not None:
             self._cached_traits_[name] = self.trait(name)
+        self._src_xforms.clear()
         
     def remove_trait(self, name):
         """Overrides HasTraits definition of remove_trait in order to
@@ -531,6 +537,7 @@ class Container(SafeHasTraits):
             del self._cached_traits_[name]
         except (KeyError, TypeError):
             pass
+        self._src_xforms.clear()
         
         super(Container, self).remove_trait(name)
             
@@ -1038,7 +1045,13 @@ class Container(SafeHasTraits):
             if obj is Missing or not is_instance(obj, Container):
                 return self._set_failed(path, value, index, src, force)
             if src is not None:
-                src = ExprEvaluator(src, scope=self).scope_transform(self, obj, parent=self)
+                key = (childname, src)
+                try:
+                    src = self._src_xforms[key]
+                except KeyError:
+                    src = ExprEvaluator(src, scope=self).scope_transform(self, obj,
+                                                                         parent=self)
+                    self._src_xforms[key] = src
             obj.set(restofpath, value, index, src=src, force=force)
         else:
             try:
@@ -8,7 +8,7 @@ __all__ = ["Array"]
 import logging
 
 # pylint: disable-msg=E0611,F0401
-from openmdao.units import PhysicalQuantity
+from openmdao.units import PhysicalQuantity, get_conversion_tuple
 
 from openmdao.main.attrwrapper import AttrWrapper, UnitsAttrWrapper
 from openmdao.main.index import get_indexed_value
@@ -171,23 +171,32 @@ class Array(TraitArray):
         dst_units = self.units
 
         try:
-            pq = PhysicalQuantity(1.0, src_units)
-        except NameError:
-            raise NameError("while setting value of %s: undefined unit '%s'" %
-                            (src_units, name))
-        
-        try:
-            pq.convert_to_unit(dst_units)
-        except NameError:
-            raise NameError("undefined unit '%s' for variable '%s'" %
-                            (dst_units, name))
-        except TypeError:
-            msg = "%s: units '%s' are incompatible " % (name, src_units) + \
-                   "with assigning units of '%s'" % (dst_units)
-            raise TypeError(msg)
+            scaler, adder = get_conversion_tuple(src_units, dst_units)
+        except Exception:
+            # Not cached, so take the slow path to get the right error.
+            try:
+                pq = PhysicalQuantity(1.0, src_units)
+            except NameError:
+                raise NameError("while setting value of %s: undefined unit '%s'" %
+                                (src_units, name))
+            
+            try:
+                pq.convert_to_unit(dst_units)
+            except NameError:
+                raise NameError("undefined unit '%s' for variable '%s'" %
+                                (dst_units, name))
+            except TypeError:
+                msg = "%s: units '%s' are incompatible " % (name, src_units) + \
+                       "with assigning units of '%s'" % (dst_units)
+                raise TypeError(msg)
+            raise
         
         try:
-            value *= pq.value
+            # value may be the source's own array, so convert into a new one
+            # rather than scaling in place.
+            value = value*scaler
+            if adder:
+                value += adder*scaler
             return super(Array, self).validate(obj, name, value)
         except Exception:
             self.error(obj, name, value)
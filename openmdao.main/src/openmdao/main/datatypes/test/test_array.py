@@ -58,6 +58,16 @@ class ArrayTestCase(unittest.TestCase):
         self.assertAlmostEqual(24., self.hobj.arr2[1])
         self.assertAlmostEqual(36., self.hobj.arr2[2])
         
+        # source is left alone
+        self.assertTrue(all(array([1.,2.,3.]) == self.hobj.arr1))
+        
+        # units with an offset
+        self.hobj.add('degc', Array(array([0., 100.]), iotype='in', units='degC'))
+        self.hobj.add('degf', Array(iotype='in', units='degF'))
+        self.hobj.degf = self.hobj.get_wrapped_attr('degc')
+        self.assertAlmostEqual(32., self.hobj.degf[0])
+        self.assertAlmostEqual(212., self.hobj.degf[1])
+        
         # unit to unitless
         self.hobj.add('arr5', Array(iotype='in'))
         self.hobj.arr5 = [1., 2., 4.]
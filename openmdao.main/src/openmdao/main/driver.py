@@ -4,14 +4,18 @@
 __all__ = ["Driver"]
 
 import fnmatch
+from functools import partial
+import re
+
+from ordereddict import OrderedDict
 
 # pylint: disable-msg=E0611,F0401
 
 from openmdao.main.interfaces import IDriver, ICaseRecorder, IHasEvents, \
-                                     implements
+                                     IContainer, implements
 from openmdao.main.exceptions import RunStopped
 from openmdao.main.expreval import ExprEvaluator
-from openmdao.main.component import Component
+from openmdao.main.component import Component, ConfigGeneration
 from openmdao.main.workflow import Workflow
 from openmdao.main.case import Case
 from openmdao.main.dataflow import Dataflow
@@ -25,6 +29,18 @@ from openmdao.main.mp_support import is_instance, has_interface
 from openmdao.main.rbac import rbac
 from openmdao.main.datatypes.api import List, Slot, Str
 
+# Printvar paths which can be fetched directly from their component.
+_SIMPLE_PATH = re.compile(r'^[A-Za-z_][A-Za-z_0-9]*(\.[A-Za-z_][A-Za-z_0-9]*)+$')
+
+
+def _is_expression(text):
+    """Return True if `text` is a valid Python expression."""
+    try:
+        compile(text, '<printvar>', 'eval')
+    except SyntaxError:
+        return False
+    return True
+
 
 @add_delegate(HasEvents)
 class Driver(Component):
@@ -47,6 +63,19 @@ class Driver(Component):
     
     def __init__(self, doc=None):
         self._iter = None
+
+        # Optional EvalCache used by run_point().
+        self.eval_cache = None
+        self._eval_hit = False      # True if last run_point() was a hit.
+        self._eval_run_key = None   # Key of point the model was last run at.
+        self._eval_pending = None   # (key, values) to run at to sync model.
+
+        # Results of iteration_set(), _get_required_compnames(), etc.
+        # Valid while the configuration generation is _iter_cache_gen.
+        self._iter_cache = {}
+        self._iter_cache_gen = None
+        self._last_invalid = None   # Workflow component last found invalid.
+
         super(Driver, self).__init__(doc=doc)
         self.workflow = Dataflow(self)
         self.force_execute = True
@@ -55,10 +84,46 @@ class Driver(Component):
         # constraints, or objectives.
         self._invalidated = False
 
+    def __getstate__(self):
+        """Return dict representing this driver's state."""
+        state = super(Driver, self).__getstate__()
+        state['_iter_cache'] = {}
+        state['_iter_cache_gen'] = None
+        state['_last_invalid'] = None
+        return state
 
     def _workflow_changed(self, oldwf, newwf):
         if newwf is not None:
             newwf._parent = self
+        ConfigGeneration.bump()
+
+    def _cached(self, name, func):
+        """Return the result of `func`, which is cached under `name` until
+        the configuration of the model changes. `func` must not change the
+        configuration itself, or its result is never cached.
+
+        The configuration generation is shared by every model in the
+        process, so a change anywhere clears the caches of every driver.
+        That is only a cost while models are being configured."""
+        gen = ConfigGeneration.get()
+        if gen != self._iter_cache_gen:
+            self._iter_cache = {}
+            self._iter_cache_gen = gen
+            self._last_invalid = None
+        try:
+            return self._iter_cache[name]
+        except KeyError:
+            value = func()
+            # Don't cache if func() itself changed the configuration.
+            if ConfigGeneration.get() == gen:
+                self._iter_cache[name] = value
+            return value
+
+    def _clear_iter_cache(self):
+        """Discard cached iteration sets and dependencies."""
+        self._iter_cache = {}
+        self._iter_cache_gen = None
+        self._last_invalid = None
 
     def get_expr_scope(self):
         """Return the scope to be used to evaluate ExprEvaluators."""
@@ -71,6 +136,8 @@ class Driver(Component):
         """
         self._invalidated = True
         self._set_exec_state('INVALID')
+        self._clear_eval_cache()
+        ConfigGeneration.bump()
         
     def is_valid(self):
         """Return False if any Component in our workflow(s) is invalid,
@@ -84,10 +151,18 @@ class Driver(Component):
         if self._invalidated:
             return False
 
-        # force execution if any component in the workflow is invalid
-        for comp in self.workflow.get_components():
-            if not comp.is_valid():
+        # force execution if any component in the workflow is invalid.
+        # The component found invalid last time is likely to still be
+        # invalid, so check it first.
+        comps = self._cached('components', self.workflow.get_components)
+        last = self._last_invalid
+        if last is not None and not last.is_valid():
+            return False
+        for comp in comps:
+            if comp is not last and not comp.is_valid():
+                self._last_invalid = comp
                 return False
+        self._last_invalid = None
         return True
 
     def check_config(self):
@@ -126,10 +201,30 @@ class Driver(Component):
         """Return a set of all Components in our workflow(s), and
         recursively in any workflow in any Driver in our workflow(s).
         """
-        allcomps = set()
+        self._fill_workflow()
+        return set(self._cached('iteration_set', self._iteration_set))
+
+    def _fill_workflow(self):
+        """If our workflow is empty, add the components required by our
+        parameters, objectives and constraints, and do the same for any
+        Driver in our workflow. Done before computing cached results which
+        depend on the workflow, since adding to a workflow changes the
+        configuration."""
+        self._cached('filled', self._fill_workflows)
+
+    def _fill_workflows(self):
+        """Return True after uncached :meth:`_fill_workflow`."""
         if len(self.workflow) == 0:
             for compname in self._get_required_compnames():
                 self.workflow.add(compname)
+        for child in self.workflow.get_components():
+            if isinstance(child, Driver):
+                child._fill_workflow()
+        return True
+
+    def _iteration_set(self):
+        """Return uncached :meth:`iteration_set`."""
+        allcomps = set()
         for child in self.workflow.get_components():
             allcomps.add(child)
             if has_interface(child, IDriver):
@@ -143,6 +238,10 @@ class Driver(Component):
         in this Driver, ignoring any dependencies on components that are
         inside of this Driver's iteration set.
         """
+        return list(self._cached('expr_depends', self._get_expr_depends))
+
+    def _get_expr_depends(self):
+        """Return uncached :meth:`get_expr_depends`."""
         iternames = set([c.name for c in self.iteration_set()])
         conn_list = super(Driver, self).get_expr_depends()
         new_list = []
@@ -158,6 +257,11 @@ class Driver(Component):
         components in the data flow between components referenced by
         parameters and those referenced by objectives and/or constraints.
         """
+        return set(self._cached('required_compnames',
+                                self._find_required_compnames))
+
+    def _find_required_compnames(self):
+        """Return uncached :meth:`_get_required_compnames`."""
         setcomps = set()
         getcomps = set()
 
@@ -250,9 +354,19 @@ class Driver(Component):
         """
         # Override just to reset the workflow :-(
         self.workflow.reset()
+        # Results from a previous run may depend on inputs that have changed.
+        self._clear_eval_cache()
         super(Driver, self).run(force, ffd_order, case_id)
         self._invalidated = False
 
+    def _post_execute(self):
+        """Leave the model at the last point requested from
+        :meth:`run_point` before marking outputs valid."""
+        self._sync_eval_point()
+        if self.eval_cache is not None:
+            self._logger.debug('eval_cache: %s', self.eval_cache.stats())
+        super(Driver, self)._post_execute()
+
     def execute(self):
         """ Iterate over a workflow of Components until some condition
         is met. If you don't want to structure your driver to use *pre_iteration*,
@@ -322,11 +436,78 @@ class Driver(Component):
         wf = self.workflow
         if len(wf) == 0:
             self._logger.warning("'%s': workflow is empty!" % self.get_pathname())
+        self._eval_run_key = None
+        self._eval_pending = None
         wf.run(ffd_order=self.ffd_order, case_id=self._case_id)
 
+    def run_point(self, values):
+        """Set the parameters to `values`, run the workflow, and return
+        ``(objectives, constraints)``, where `objectives` maps objective
+        names to values and `constraints` maps constraint names to
+        ``(lhs, rhs, comparator, is_violated)`` tuples.
+
+        If :attr:`eval_cache` is set and `values` was already evaluated
+        during this execution, the recorded results are returned and the
+        workflow isn't run. The model is brought to the point before
+        derivatives are calculated, cases are recorded, or execution
+        completes. Points run under fake finite difference aren't
+        recorded, since their results are approximate.
+
+        values: iterator
+            Parameter values, in the order of :meth:`get_parameters`.
+        """
+        cache = self.eval_cache
+        key = None if cache is None else cache.key(values)
+        if key is not None:
+            result = cache.get(key)
+            if result is not None:
+                self._eval_hit = True
+                if key == self._eval_run_key:
+                    self._eval_pending = None
+                else:
+                    self._eval_pending = (key, list(values))
+                return result
+
+        self._eval_hit = False
+        self.set_parameters(values)
+        Driver.run_iteration(self)
+
+        objectives = OrderedDict()
+        if hasattr(self, 'get_objectives'):
+            for name, obj in self.get_objectives().iteritems():
+                objectives[name] = obj.evaluate(self.parent)
+        constraints = OrderedDict()
+        for getter in ('get_eq_constraints', 'get_ineq_constraints'):
+            if hasattr(self, getter):
+                for name, con in getattr(self, getter)().iteritems():
+                    constraints[name] = con.evaluate(self.parent)
+        result = (objectives, constraints)
+
+        if key is not None and self.ffd_order == 0:
+            cache.put(key, result)
+            self._eval_run_key = key
+        return result
+
+    def _sync_eval_point(self):
+        """If the last :meth:`run_point` was satisfied from the cache at a
+        point other than where the model was last run, run it there."""
+        if self._eval_pending is not None:
+            key, values = self._eval_pending
+            self.set_parameters(values)
+            Driver.run_iteration(self)
+            self._eval_run_key = key
+
+    def _clear_eval_cache(self):
+        """Discard cached evaluations."""
+        if self.eval_cache is not None:
+            self.eval_cache.clear()
+        self._eval_run_key = None
+        self._eval_pending = None
+
     def calc_derivatives(self, first=False, second=False):
         """ Calculate derivatives and save baseline states for all components
         in this workflow."""
+        self._sync_eval_point()
         self.workflow.calc_derivatives(first, second)
 
     def check_derivatives(self, order, driver_inputs, driver_outputs):
@@ -343,6 +524,8 @@ class Driver(Component):
         changed.
         """
         super(Driver, self).config_changed(update_parent)
+        self._clear_eval_cache()
+        self._clear_iter_cache()
         if self.workflow is not None:
             self.workflow.config_changed()
 
@@ -359,6 +542,8 @@ class Driver(Component):
         if not self.recorders:
             return
 
+        self._sync_eval_point()
+
         case_input = []
         case_output = []
 
@@ -390,24 +575,12 @@ class Driver(Component):
                 case_output.append(["Constraint ( %s )" % name, val[1] - val[0]])
 
         # Additional user-requested variables
-        for printvar in self.printvars:
-
-            if  '*' in printvar:
-                printvars = self._get_all_varpaths(printvar)
-            else:
-                printvars = [printvar]
-
-            for var in printvars:
-                iotype = self.parent.get_metadata(var, 'iotype')
+        if self.printvars:
+            for var, iotype, getter in self._get_printvars():
                 if iotype == 'in':
-                    val = ExprEvaluator(var, scope=self.parent).evaluate()
-                    case_input.append([var, val])
-                elif iotype == 'out':
-                    val = ExprEvaluator(var, scope=self.parent).evaluate()
-                    case_output.append([var, val])
+                    case_input.append([var, getter()])
                 else:
-                    msg = "%s is not an input or output" % var
-                    self.raise_exception(msg, ValueError)
+                    case_output.append([var, getter()])
 
         # Pull iteration coord from workflow
         coord = self.workflow._iterbase('')
@@ -418,6 +591,66 @@ class Driver(Component):
         for recorder in self.recorders:
             recorder.record(case)
 
+    def _get_printvars(self, check_iotype=True):
+        """Return a list of ``(varpath, iotype, getter)`` for the expanded
+        printvars, cached until the next configuration change.
+        If `check_iotype` is False, a printvar may be any expression, such
+        as an array element, and its iotype is returned as None."""
+        printvars = tuple(self.printvars)
+        return self._cached(('printvars', check_iotype)+printvars,
+                            lambda: self._resolve_printvars(printvars,
+                                                            check_iotype))
+
+    def _resolve_printvars(self, printvars, check_iotype=True):
+        """Return a list of ``(varpath, iotype, getter)`` for `printvars`,
+        expanding wildcard patterns. The workflow is only walked once,
+        however many patterns there are. A printvar containing ``*`` which
+        matches no variable but is a valid expression (such as
+        ``comp.x*2``) is kept as an expression. If `check_iotype` is True,
+        a ValueError is raised for a printvar which isn't an input or
+        output.
+
+        Used by :meth:`_get_printvars`."""
+        resolved = []
+        all_vars = None
+        for printvar in printvars:
+            if '*' in printvar:
+                if all_vars is None:
+                    all_vars = self._get_all_varpaths('*')
+                if printvar == '*':
+                    varpaths = all_vars
+                else:
+                    varpaths = fnmatch.filter(all_vars, printvar)
+                if not varpaths and _is_expression(printvar):
+                    varpaths = [printvar]
+            else:
+                varpaths = [printvar]
+
+            for var in varpaths:
+                iotype = None
+                if check_iotype:
+                    try:
+                        iotype = self.parent.get_metadata(var, 'iotype')
+                    except AttributeError:
+                        pass
+                    if iotype not in ('in', 'out'):
+                        msg = "%s is not an input or output" % var
+                        self.raise_exception(msg, ValueError)
+                resolved.append((var, iotype, self._printvar_getter(var)))
+        return resolved
+
+    def _printvar_getter(self, var):
+        """Return a function returning the current value of printvar `var`.
+        Simple varpaths are bound to their component, anything else is
+        evaluated by an ExprEvaluator."""
+        compname, dot, rest = var.partition('.')
+        if dot and _SIMPLE_PATH.match(var):
+            comp = self.parent.get(compname)
+            if has_interface(comp, IContainer):
+                return partial(comp.get, rest)
+        expr = ExprEvaluator(var, scope=self.parent)
+        return partial(expr.evaluate, self.parent)
+
     def _get_all_varpaths(self, pattern, header=''):
         ''' Return a list of all varpaths in the driver's workflow that
         match the specified pattern.
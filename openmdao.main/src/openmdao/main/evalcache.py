@@ -0,0 +1,94 @@
+"""
+Memoization of design point evaluations for drivers.
+"""
+
+#public symbols
+__all__ = ['EvalCache']
+
+from ordereddict import OrderedDict
+
+
+class EvalCache(object):
+    """
+    A bounded, least-recently-used cache of the objective and constraint
+    values obtained at design points, keyed by parameter values.
+    Assign one to a driver's `eval_cache` attribute to have
+    :meth:`Driver.run_point` return recorded results rather than running the
+    workflow again at points it has already evaluated.
+
+    size: int
+        Maximum number of points retained.
+
+    tolerance: float
+        Float parameter values are compared after rounding to a multiple of
+        `tolerance`. Zero (the default) requires an exact match.
+        This should be much smaller than any finite difference step size.
+    """
+
+    def __init__(self, size=100, tolerance=0.):
+        if size < 1:
+            raise ValueError('size must be >= 1')
+        if tolerance < 0.:
+            raise ValueError('tolerance must be >= 0')
+        self.size = size
+        self.tolerance = tolerance
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, values):
+        """
+        Return the lookup key for parameter `values`, or None if `values`
+        can't be used as a key.
+        """
+        tol = self.tolerance
+        if tol:
+            values = [int(round(val / tol)) if isinstance(val, float) else val
+                      for val in values]
+        key = tuple(values)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key):
+        """
+        Return the result recorded for `key`, or None if there isn't one.
+        Updates hit/miss statistics.
+        """
+        try:
+            result = self._entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries[key] = result  # Now most recently used.
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """ Record `result` for `key`, discarding the least recently used
+        entry if the cache is full. """
+        entries = self._entries
+        entries.pop(key, None)
+        entries[key] = result
+        if len(entries) > self.size:
+            entries.popitem(last=False)
+
+    def clear(self):
+        """ Discard all entries. Statistics are retained. """
+        self._entries.clear()
+
+    def stats(self):
+        """ Return a dictionary of cache statistics. """
+        total = self.hits + self.misses
+        return dict(hits=self.hits, misses=self.misses, size=len(self),
+                    hit_rate=float(self.hits)/total if total else 0.)
+
+    def reset_stats(self):
+        """ Reset hit/miss statistics. """
+        self.hits = 0
+        self.misses = 0
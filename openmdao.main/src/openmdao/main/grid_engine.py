@@ -13,7 +13,9 @@ import fnmatch
 import os.path
 import string
 import sys
+import threading
 
+from openmdao.main import jobarray
 from openmdao.main.mp_support import OpenMDAO_Manager, register
 from openmdao.main.objserverfactory import ObjServer
 from openmdao.main.rbac import rbac
@@ -252,6 +254,13 @@ class GridEngineServer(ObjServer):
 
     _QSUB = ['qsub']  # Replaced with path to fake for testing.
 
+    _array_lock = threading.Lock()
+    _array_count = 0
+
+    def __init__(self, *args, **kwargs):
+        super(GridEngineServer, self).__init__(*args, **kwargs)
+        self._arrays = {}  # Handle -> (path, ntasks, state)
+
     @rbac('owner')
     def configure(self, category_map):
         """
@@ -361,6 +370,182 @@ class GridEngineServer(ObjServer):
 
         Output from `qsub` itself is routed to ``qsub.out``.
         """
+        cmd, env = self._qsub_command(resource_desc)
+
+        cmd.append(self._fix_path(resource_desc['remote_command']))
+
+        if 'args' in resource_desc:
+            for arg in resource_desc['args']:
+                cmd.append(self._fix_path(arg))
+
+        return self._run_qsub(cmd, env, 'qsub.out')
+
+    @rbac('owner')
+    def execute_array(self, resource_desc, tasks):
+        """
+        Submit `tasks` as a single job array (``qsub -t 1-N``) and wait for
+        all tasks to complete. This avoids the scheduler overhead and queue
+        latency of submitting each task as a separate job.
+        Returns a list of ``(return_code, error_msg)``, one per task.
+        A `return_code` of None indicates the task didn't complete, for
+        example due to exceeding a resource limit.
+
+        resource_desc: dict
+            Resources common to all tasks, processed as for
+            :meth:`execute_command`. 'remote_command', 'args', 'input_path',
+            'output_path', 'error_path', and 'join_files' are ignored.
+            'job_name' is used for the array job and its files.
+
+        tasks: list(dict)
+            Task descriptions, each with a 'remote_command' entry and
+            optionally 'args', 'job_environment' (added to the common
+            environment), 'input_path', 'output_path', 'error_path', and
+            'join_files'. Defaults are as for :meth:`execute_command`.
+
+        Each task runs :mod:`jobarray` to execute its command and record
+        its status in a file alongside the task table
+        ``<job_name>-<n>.tasks`` in the server directory.
+        The job output from `qsub` is routed to ``<job_name>-<n>.out``.
+        """
+        path = self._write_tasks(resource_desc, tasks)
+        return self._execute_array(resource_desc, path, len(tasks), {})
+
+    @rbac('owner')
+    def start_array(self, resource_desc, tasks):
+        """
+        Start :meth:`execute_array` in the background, returning a handle
+        for :meth:`array_status` and :meth:`wait_command`.
+
+        resource_desc: dict
+            Resources common to all tasks.
+
+        tasks: list(dict)
+            Task descriptions.
+        """
+        path = self._write_tasks(resource_desc, tasks)
+        state = {}
+        handle = self._start_background(self._execute_array, resource_desc,
+                                        path, len(tasks), state)
+        self._arrays[handle] = (path, len(tasks), state)
+        return handle
+
+    @rbac('owner')
+    def array_status(self, handle):
+        """
+        Returns a list with an entry per task of the job array started by
+        :meth:`start_array`: ``(return_code, error_msg)`` if the task has
+        completed, otherwise None. Once :meth:`wait_command` has returned,
+        the handle is no longer valid.
+
+        handle: int
+            Value returned by :meth:`start_array`.
+        """
+        try:
+            path, ntasks, state = self._arrays[handle]
+        except KeyError:
+            raise ValueError('invalid array handle %r' % handle)
+        if handle not in self._commands:  # wait_command() has returned.
+            del self._arrays[handle]
+            raise ValueError('invalid array handle %r' % handle)
+        if 'results' in state:  # Set before status files are removed.
+            return list(state['results'])
+        return [jobarray.read_status(path, task_id)
+                for task_id in range(1, ntasks+1)]
+
+    def _execute_array(self, resource_desc, path, ntasks, state):
+        """
+        Submit job array for task table `path` and return task results.
+        The results are also recorded in `state`.
+        """
+        try:
+            return_code, error_msg = self._submit_array(resource_desc, path,
+                                                        ntasks)
+            results = []
+            for task_id in range(1, ntasks+1):
+                status = jobarray.read_status(path, task_id)
+                if status is None:
+                    status = (None, 'No status for task %d%s'
+                                    % (task_id, error_msg))
+                results.append(status)
+            state['results'] = results
+            self._logger.debug('    returning %s', results)
+            return results
+        finally:
+            self._remove_tasks(path, ntasks)
+
+    def _write_tasks(self, resource_desc, tasks):
+        """ Write task table for `tasks`, returning its path. """
+        if not tasks:
+            raise ValueError('no tasks specified')
+        self.home_dir = os.path.expanduser('~')
+        self.work_dir = ''
+        if 'working_directory' in resource_desc:
+            self.work_dir = self._fix_path(resource_desc['working_directory'])
+
+        fixed = []
+        for task in tasks:
+            task = dict(task)
+            for key in ('remote_command', 'input_path', 'output_path',
+                        'error_path'):
+                if key in task:
+                    task[key] = self._fix_path(task[key])
+            if 'args' in task:
+                task['args'] = [self._fix_path(arg) for arg in task['args']]
+            fixed.append(task)
+
+        with GridEngineServer._array_lock:
+            GridEngineServer._array_count += 1
+            count = GridEngineServer._array_count
+        name = self._jobname(resource_desc.get('job_name', 'array'))
+        path = os.path.join(os.getcwd(), '%s-%d.tasks' % (name, count))
+        jobarray.write_table(path, fixed)
+        return path
+
+    def _submit_array(self, resource_desc, path, ntasks):
+        """ Submit job array for task table `path`. """
+        desc = dict(resource_desc)
+        for key in ('remote_command', 'args', 'input_path', 'error_path',
+                    'join_files'):
+            desc.pop(key, None)
+        base = os.path.splitext(path)[0]
+        desc['output_path'] = base+'.out'
+        desc['join_files'] = True
+
+        cmd, env = self._qsub_command(desc)
+        cmd.extend(('-t', '1-%d' % ntasks))
+        script = os.path.splitext(jobarray.__file__)[0]+'.py'
+        cmd.extend((sys.executable, script, path, 'SGE_TASK_ID'))
+        return self._run_qsub(cmd, env, base+'.qsub')
+
+    def _remove_tasks(self, path, ntasks):
+        """ Remove task table `path` and its status files. """
+        for name in [path] + [jobarray.status_path(path, task_id)
+                              for task_id in range(1, ntasks+1)]:
+            if os.path.exists(name):
+                try:
+                    os.remove(name)
+                except OSError as exc:  #pragma no cover
+                    self._logger.warning("Can't remove %r: %s", name, exc)
+
+    def _run_qsub(self, cmd, env, qsub_out):
+        """ Run `qsub` command `cmd` with output to `qsub_out`. """
+        self._logger.info('%r', ' '.join(cmd))
+        try:
+            process = ShellProc(cmd, DEV_NULL, qsub_out, STDOUT, env)
+        except Exception as exc:
+            self._logger.error('exception creating process: %s', exc)
+            raise
+
+        self._logger.debug('    PID = %d', process.pid)
+        return_code, error_msg = process.wait()
+        self._logger.debug('    returning %s', (return_code, error_msg))
+        return (return_code, error_msg)
+
+    def _qsub_command(self, resource_desc):
+        """
+        Return ``(cmd, env)``, where `cmd` is the `qsub` command, excluding
+        the command to be run, for `resource_desc`.
+        """
         self.home_dir = os.path.expanduser('~')
         self.work_dir = ''
 
@@ -484,23 +669,7 @@ class GridEngineServer(ObjServer):
         if 'native_specification' in resource_desc:
             cmd.extend(resource_desc['native_specification'])
 
-        cmd.append(self._fix_path(resource_desc['remote_command']))
-
-        if 'args' in resource_desc:
-            for arg in resource_desc['args']:
-                cmd.append(self._fix_path(arg))
-
-        self._logger.info('%r', ' '.join(cmd))
-        try:
-            process = ShellProc(cmd, DEV_NULL, 'qsub.out', STDOUT, env)
-        except Exception as exc:
-            self._logger.error('exception creating process: %s', exc)
-            raise
-
-        self._logger.debug('    PID = %d', process.pid)
-        return_code, error_msg = process.wait(1)
-        self._logger.debug('    returning %s', (return_code, error_msg))
-        return (return_code, error_msg)
+        return (cmd, env)
 
     def _fix_path(self, path):
         """ Translates special prefixes. """
@@ -0,0 +1,137 @@
+"""
+Support for running a batch of commands as a queuing system job array.
+
+A job array is described by a task table, a JSON file containing a list of
+task descriptions. Each task of the array runs this module as a script with
+the table path and the name of the environment variable containing the
+(1-origin) task index. The selected task's command is run and its return code
+and error message are written to a status file next to the table.
+This module is intentionally lightweight since it is loaded once per task.
+"""
+
+import json
+import os.path
+import signal
+import subprocess
+import sys
+
+# Keys recognized in a task description.
+TASK_KEYS = ('remote_command', 'args', 'job_environment', 'input_path',
+             'output_path', 'error_path', 'join_files')
+
+DEV_NULL = 'nul:' if sys.platform == 'win32' else '/dev/null'
+
+
+def write_table(path, tasks):
+    """
+    Write task table `tasks` to `path`.
+
+    path: string
+        Path to task table file.
+
+    tasks: list(dict)
+        Task descriptions, each with a 'remote_command' entry and optionally
+        'args', 'job_environment', 'input_path', 'output_path',
+        'error_path', and 'join_files'.
+    """
+    for i, task in enumerate(tasks):
+        if 'remote_command' not in task:
+            raise KeyError("task %d: 'remote_command' required" % (i+1))
+        for key in task:
+            if key not in TASK_KEYS:
+                raise KeyError('task %d: unsupported key %r' % (i+1, key))
+    with open(path, 'w') as out:
+        json.dump(tasks, out)
+
+
+def status_path(path, task_id):
+    """ Return path to status file for `task_id` of table `path`. """
+    return '%s.%d.status' % (path, task_id)
+
+
+def read_status(path, task_id):
+    """
+    Return ``(return_code, error_msg)`` for `task_id` of table `path`,
+    or None if the task hasn't completed.
+    """
+    try:
+        with open(status_path(path, task_id), 'r') as inp:
+            code = inp.readline()
+            msg = inp.read()
+    except IOError:
+        return None
+    try:
+        return (int(code), msg)
+    except ValueError:  # Partially written.
+        return None
+
+
+def run_task(path, task_id):
+    """
+    Run task `task_id` (1-origin) of table `path` and write its status.
+    Returns the command's return code.
+    """
+    with open(path, 'r') as inp:
+        task = json.load(inp)[task_id-1]
+
+    cmd = [task['remote_command']]
+    cmd.extend(task.get('args', []))
+    env = None
+    if task.get('job_environment'):
+        env = os.environ.copy()
+        env.update(task['job_environment'])
+
+    base = os.path.basename(task['remote_command'])
+    files = []
+    try:
+        stdin = open(task.get('input_path', DEV_NULL), 'r')
+        files.append(stdin)
+        stdout = open(task.get('output_path', '%s.stdout' % base), 'w')
+        files.append(stdout)
+        if task.get('join_files'):
+            stderr = subprocess.STDOUT
+        else:
+            stderr = open(task.get('error_path', '%s.stderr' % base), 'w')
+            files.append(stderr)
+        return_code = subprocess.call(cmd, stdin=stdin, stdout=stdout,
+                                      stderr=stderr, env=env)
+        error_msg = _error_message(return_code)
+    except Exception as exc:
+        return_code = 127
+        error_msg = ': %s' % exc
+    finally:
+        for fileobj in files:
+            fileobj.close()
+
+    tmp = status_path(path, task_id) + '.tmp'
+    with open(tmp, 'w') as out:
+        out.write('%d\n%s' % (return_code, error_msg))
+    if os.path.exists(status_path(path, task_id)):
+        os.remove(status_path(path, task_id))  # Windows won't rename over it.
+    os.rename(tmp, status_path(path, task_id))
+    return return_code
+
+
+def _error_message(return_code):
+    """ Return error message for `return_code` (see ShellProc). """
+    if return_code > 0:
+        return ': %s' % os.strerror(return_code)
+    elif return_code < 0 and sys.platform != 'win32':
+        for name, value in signal.__dict__.items():
+            if name.startswith('SIG') and not name.startswith('SIG_') and \
+               value == -return_code:
+                return ': %s' % name
+    return ''
+
+
+def main():  #pragma no cover
+    """ Run a task: ``python jobarray.py table_path task_id_env_var``. """
+    if len(sys.argv) != 3:
+        print 'usage: %s table_path task_id_env_var' % sys.argv[0]
+        sys.exit(2)
+    path, var = sys.argv[1:]
+    sys.exit(run_task(path, int(os.environ[var])))
+
+
+if __name__ == '__main__':  #pragma no cover
+    main()
@@ -26,6 +26,15 @@ the proxy.
 Assuming the credentials check passes, the server will set its credentials
 to those specified by the :class:`AccessController` during the execution of the
 method.
+
+Requests may be pipelined: :meth:`OpenMDAO_Proxy.call_async` sends a request
+tagged with a request ID and returns a :class:`ProxyCall` without waiting for
+the reply. The server processes requests on a connection in order, echoing the
+request ID in the reply. :func:`wait_for_calls` waits for replies on any number
+of connections, allowing a single thread to drive many servers.
+
+Large NumPy arrays in requests and replies are sent as raw frames following the
+pickled message rather than being pickled (see :func:`mp_util.send_message`).
 """
 
 # Unfortunately, there's a lot of multiprocessing package code duplication here.
@@ -41,6 +50,7 @@ import hashlib
 import inspect
 import logging
 import os
+import select
 import signal
 import socket
 import sys
@@ -58,11 +68,12 @@ if sys.platform == 'win32':  #pragma no cover
     from _multiprocessing import win32
 
 from enthought.traits.trait_handlers import TraitDictObject
+from ordereddict import OrderedDict
 
 from openmdao.main.interfaces import obj_has_interface
-from openmdao.main.mp_util import decrypt, encrypt, is_legal_connection, \
+from openmdao.main.mp_util import decode_message, is_legal_connection, \
                                   keytype, make_typeid, public_methods, \
-                                  SPECIALS
+                                  send_message, SPECIALS
 from openmdao.main.rbac import AccessController, RoleError, check_role, \
                                need_proxy, Credentials, \
                                get_credentials, set_credentials
@@ -357,7 +368,6 @@ class OpenMDAO_Server(Server):
         self._logger.log(LOG_DEBUG2, 'starting server thread to service %r, %s',
                          threading.current_thread().name, keytype(self._authkey))
         recv = conn.recv
-        send = conn.send
         id_to_obj = self.id_to_obj
         id_to_controller = self._id_to_controller
 
@@ -371,10 +381,10 @@ class OpenMDAO_Server(Server):
 
             try:
                 ident = methodname = args = kwds = credentials = None
-                obj = exposed = gettypeid = None
+                obj = exposed = gettypeid = reqid = None
                 data = recv()
                 try:
-                    request = decrypt(data, session_key)
+                    request = decode_message(conn, data, session_key)
                 except Exception as exc:
                     trace = traceback.format_exc()
                     msg = "Can't decrypt/unpack request. This could be the" \
@@ -383,7 +393,9 @@ class OpenMDAO_Server(Server):
                     self._logger.error(trace)
                     raise RuntimeError(msg)
 
-                ident, methodname, args, kwds, credentials = request
+                ident, methodname, args, kwds, credentials = request[:5]
+                if len(request) > 5:
+                    reqid = request[5]  # Pipelined request.
                 self._logger.log(LOG_DEBUG3, 'request %s %s', ident, methodname)
 #                self._logger.log(LOG_DEBUG3, 'credentials %s', credentials)
 #                self._logger.log(LOG_DEBUG3, 'id_to_obj:\n%s',
@@ -491,11 +503,16 @@ class OpenMDAO_Server(Server):
                 self._logger.error(trace)
                 msg = ('#TRACEBACK', trace)
 
+            if reqid is not None:
+                msg = (msg[0], msg[1], reqid)
             try:
                 try:
-                    send(encrypt(msg, session_key))
+                    send_message(conn, msg, session_key)
                 except Exception:
-                    send(encrypt(('#UNSERIALIZABLE', repr(msg)), session_key))
+                    msg = ('#UNSERIALIZABLE', repr(msg))
+                    if reqid is not None:
+                        msg += (reqid,)
+                    send_message(conn, msg, session_key)
             # Just being defensive, this should never happen.
             except Exception as exc: #pragma no cover
                 self._logger.error('exception in thread serving %r',
@@ -1193,9 +1210,29 @@ class OpenMDAO_Proxy(BaseProxy):
         This version optionally encrypts the channel and sends the current
         thread's credentials with method arguments.
         """
-        args = args or ()
-        kwds = kwds or {}
+        channel = self._get_channel(methodname)
+        call = ProxyCall(self, channel, methodname)
+        channel.send(call, self._form_request(methodname, args, kwds), False)
+        return call.result()
 
+    def call_async(self, methodname, *args, **kwds):
+        """
+        Send a request to call `methodname` of the referrent with `args` and
+        `kwds`, returning a :class:`ProxyCall` for the pending result.
+        Any number of calls may be outstanding on a connection. Since
+        connections are per-thread, the result must be obtained in the
+        calling thread.
+
+        methodname: string
+            Name of remote method to call.
+        """
+        channel = self._get_channel(methodname)
+        call = ProxyCall(self, channel, methodname)
+        channel.send(call, self._form_request(methodname, args, kwds), True)
+        return call
+
+    def _get_channel(self, methodname):
+        """ Return :class:`_Channel` for this thread's connection. """
         try:
             conn = self._tls.connection
         except AttributeError:
@@ -1214,7 +1251,16 @@ class OpenMDAO_Proxy(BaseProxy):
             else:
                 self._tls.session_key = ''
 
-        session_key = self._tls.session_key
+        channel = getattr(self._tls, 'channel', None)
+        if channel is None or channel.conn is not conn:
+            channel = _Channel(conn, self._tls.session_key, self._token.address)
+            self._tls.channel = channel
+        return channel
+
+    def _form_request(self, methodname, args, kwds):
+        """ Return request tuple for calling `methodname`. """
+        args = args or ()
+        kwds = kwds or {}
 
 # FIXME: Bizarre problem evidenced by test_extcode.py (Python 2.6.1)
 # For some reason pickling the env_vars dictionary causes:
@@ -1229,17 +1275,11 @@ class OpenMDAO_Proxy(BaseProxy):
             else:
                 new_args.append(arg)
 
-        try:
-            conn.send(encrypt((self._id, methodname, new_args, kwds,
-                               get_credentials().encode()), session_key))
-        except IOError as exc:
-            msg = "Can't send to server at %r for %r: %r" \
-                  % (self._token.address, methodname, exc)
-            logging.error(msg)
-            raise RuntimeError(msg)
-
-        kind, result = decrypt(conn.recv(), session_key)
+        return (self._id, methodname, new_args, kwds,
+                get_credentials().encode())
 
+    def _handle_reply(self, kind, result):
+        """ Return result of a call given reply `kind` and `result`. """
         if kind == '#RETURN':
             return result
 
@@ -1412,6 +1452,195 @@ class OpenMDAO_Proxy(BaseProxy):
                 (_auto_proxy, self._token, self._serializer, kwds))
 
 
+class ProxyCall(object):
+    """
+    A pending call returned by :meth:`OpenMDAO_Proxy.call_async`.
+
+    proxy: :class:`OpenMDAO_Proxy`
+        The proxy the call was made on.
+
+    channel: :class:`_Channel`
+        The connection the request was sent on.
+
+    methodname: string
+        Name of the remote method.
+    """
+
+    def __init__(self, proxy, channel, methodname):
+        self.proxy = proxy
+        self.methodname = methodname
+        self._channel = channel
+        self._reply = None
+        self._handled = False
+        self._value = None
+        self._error = None
+
+    def __repr__(self):
+        return '<ProxyCall %s %s>' % (self.methodname,
+                                      'done' if self.done() else 'pending')
+
+    def done(self):
+        """ Return True if the reply has been received. """
+        return self._reply is not None
+
+    def poll(self):
+        """
+        Receive any replies already available on the call's connection,
+        without blocking. Returns True if this call is done.
+        """
+        while self._reply is None and self._channel.receive(0):
+            pass
+        return self._reply is not None
+
+    def result(self, timeout=None):
+        """
+        Return the result of the call, raising the remote exception if the
+        call failed. Raises :class:`RuntimeError` if `timeout` seconds pass
+        before the reply is received.
+
+        timeout: float
+            Maximum seconds to wait, None implies no limit.
+        """
+        if self._reply is None:
+            deadline = None if timeout is None else time.time() + timeout
+            while self._reply is None:
+                if deadline is None:
+                    self._channel.receive(None)
+                elif not self._channel.receive(max(deadline - time.time(),
+                                                   0.)):
+                    raise RuntimeError('Timeout waiting for %r reply from %r'
+                                       % (self.methodname,
+                                          self._channel.address))
+        if not self._handled:
+            self._handled = True
+            kind, result = self._reply
+            try:
+                self._value = self.proxy._handle_reply(kind, result)
+            except Exception as exc:
+                self._error = exc
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def fileno(self):
+        """ Return file descriptor of the call's connection. """
+        return self._channel.conn.fileno()
+
+
+class _Channel(object):
+    """
+    Tracks the outstanding requests on a proxy connection. Since requests
+    on a connection are processed in order, a reply without a request ID
+    belongs to the oldest outstanding request.
+    """
+
+    def __init__(self, conn, session_key, address):
+        self.conn = conn
+        self.session_key = session_key
+        self.address = address
+        self._pending = OrderedDict()  # reqid -> ProxyCall
+        self._next_id = 0
+
+    def send(self, call, request, pipelined):
+        """ Send `request` for `call`, tagged with a request ID if
+        `pipelined`. """
+        self._next_id += 1
+        reqid = self._next_id
+        if pipelined:
+            request += (reqid,)
+        try:
+            send_message(self.conn, request, self.session_key)
+        except IOError as exc:
+            msg = "Can't send to server at %r for %r: %r" \
+                  % (self.address, call.methodname, exc)
+            logging.error(msg)
+            raise RuntimeError(msg)
+        self._pending[reqid] = call
+
+    def receive(self, timeout):
+        """
+        Receive one reply and record it in its call. Returns False if no
+        reply arrived within `timeout` seconds (None implies no limit).
+        """
+        if not self._pending:
+            return False
+        if timeout is not None and not self.conn.poll(timeout):
+            return False
+        try:
+            reply = decode_message(self.conn, self.conn.recv(),
+                                   self.session_key)
+        except Exception as exc:
+            # Fail all outstanding calls, the connection is unusable.
+            msg = 'Connection to %r failed: %r' % (self.address, exc)
+            for call in self._pending.values():
+                call._reply = ('#TRACEBACK', msg)
+            self._pending.clear()
+            raise
+        if len(reply) > 2:
+            call = self._pending.pop(reply[2])
+        else:
+            reqid, call = self._pending.popitem(last=False)
+        call._reply = reply[:2]
+        return True
+
+
+def wait_for_calls(calls, timeout=None):
+    """
+    Wait until at least one of `calls` is done, receiving replies on their
+    connections as they arrive. Returns the list of calls which are done,
+    which is empty if `timeout` expired first.
+
+    calls: list
+        :class:`ProxyCall` objects, possibly on different connections.
+
+    timeout: float
+        Maximum seconds to wait, None implies no limit.
+    """
+    done = [call for call in calls if call.done()]
+    if done or not calls:
+        return done
+
+    channels = {}
+    for call in calls:
+        channels[id(call._channel)] = call._channel
+    channels = channels.values()
+
+    deadline = None if timeout is None else time.time() + timeout
+    while True:
+        if deadline is None:
+            wait = None
+        else:
+            wait = max(deadline - time.time(), 0.)
+        for channel in _ready_channels(channels, wait):
+            while channel.receive(0):
+                pass
+        done = [call for call in calls if call.done()]
+        if done or (deadline is not None and time.time() >= deadline):
+            return done
+
+
+def _ready_channels(channels, timeout):
+    """ Return channels with data available within `timeout` seconds. """
+    if sys.platform == 'win32':  #pragma no cover
+        # Can't select() on pipes, so poll.
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            ready = [chan for chan in channels if chan.conn.poll(0)]
+            if ready or (deadline is not None and time.time() >= deadline):
+                return ready
+            time.sleep(0.001)
+    else:
+        while True:
+            try:
+                ready = select.select([chan.conn for chan in channels],
+                                      [], [], timeout)[0]
+            except select.error as exc:
+                if exc.args[0] != errno.EINTR:
+                    raise
+            else:
+                return [chan for chan in channels if chan.conn in ready]
+
+
 def register(cls, manager, module=None):
     """
     Register class `cls` proxy info with `manager`. The class will be
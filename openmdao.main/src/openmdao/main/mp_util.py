@@ -5,6 +5,7 @@ Multiprocessing support utilities.
 import atexit
 import ConfigParser
 import cPickle
+import cStringIO
 import errno
 import getpass
 import inspect
@@ -17,6 +18,11 @@ import time
 
 from Crypto.Cipher import AES
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from multiprocessing import current_process, connection
 from multiprocessing.managers import BaseProxy
 
@@ -29,6 +35,18 @@ from openmdao.util.shellproc import ShellProc, STDOUT
 # Names of attribute access methods requiring special handling.
 SPECIALS = ('__getattribute__', '__getattr__', '__setattr__', '__delattr__')
 
+# Arrays of at least this many bytes are sent as out-of-band frames.
+OOB_THRESHOLD = 65536
+
+# Size of encrypted out-of-band chunks (a multiple of AES.block_size).
+OOB_CHUNK = 1 << 20
+
+# Maximum total bytes of out-of-band arrays accepted in one message.
+OOB_MAX = 1 << 34
+
+# Marks a message followed by out-of-band array frames.
+_OOB = '#OOB'
+
 
 def keytype(authkey):
     """
@@ -211,22 +229,28 @@ def encrypt(obj, session_key):
         Key used for encryption. Should be at least 16 bytes long.
     """
     if session_key:
-        # Just being defensive, this should never happen.
-        if len(session_key) < 16:  #pragma no cover
-            session_key += '!'*16
-        session_key = session_key[:16]
-        encryptor = AES.new(session_key, AES.MODE_CBC, '?'*AES.block_size)
-        text = cPickle.dumps(obj, cPickle.HIGHEST_PROTOCOL)
-        length = len(text)
-        pad = length % AES.block_size
-        if pad:
-            pad = AES.block_size - pad
-            text += '-'*pad
-        data = encryptor.encrypt(text)
-        return (length, data)
+        return _encrypt_text(cPickle.dumps(obj, cPickle.HIGHEST_PROTOCOL),
+                             session_key)
     else:
         return obj
 
+def _cipher(session_key):
+    """ Return AES cipher for `session_key`. """
+    # Just being defensive, this should never happen.
+    if len(session_key) < 16:  #pragma no cover
+        session_key += '!'*16
+    session_key = session_key[:16]
+    return AES.new(session_key, AES.MODE_CBC, '?'*AES.block_size)
+
+def _encrypt_text(text, session_key):
+    """ Returns ``(length, data)`` of encrypted `text`. """
+    length = len(text)
+    pad = length % AES.block_size
+    if pad:
+        pad = AES.block_size - pad
+        text += '-'*pad
+    return (length, _cipher(session_key).encrypt(text))
+
 def decrypt(msg, session_key):
     """
     If `session_key` is specified, returns object from encrypted pickled data
@@ -242,17 +266,176 @@ def decrypt(msg, session_key):
         # Just being defensive, this should never happen.
         if len(msg) != 2:  #pragma no cover
             raise RuntimeError('_decrypt: msg not encrypted?')
-        # Just being defensive, this should never happen.
-        if len(session_key) < 16:  #pragma no cover
-            session_key += '!'*16
-        session_key = session_key[:16]
-        decryptor = AES.new(session_key, AES.MODE_CBC, '?'*AES.block_size)
-        length, data = msg
-        text = decryptor.decrypt(data)
-        return cPickle.loads(text[:length])
+        return cPickle.loads(_decrypt_text(msg, session_key))
     else:
         return msg
 
+def _decrypt_text(msg, session_key):
+    """ Returns text from ``(length, data)`` encrypted `msg`. """
+    length, data = msg
+    return _cipher(session_key).decrypt(data)[:length]
+
+
+def send_message(conn, obj, session_key, threshold=OOB_THRESHOLD):
+    """
+    Send `obj` on `conn`, encrypted if `session_key` is specified.
+    NumPy arrays of at least `threshold` bytes are not pickled. They are sent
+    as raw frames following the message, encrypted in chunks of
+    :data:`OOB_CHUNK` bytes if `session_key` is specified.
+    The message must be received by :func:`decode_message`.
+
+    conn: :class:`multiprocessing.Connection`
+        Connection to send on.
+
+    obj: object
+        Object to be sent.
+
+    session_key: string
+        Key used for encryption. Should be at least 16 bytes long.
+
+    threshold: int
+        Minimum size of arrays sent out-of-band.
+    """
+    arrays = []
+    if numpy is None:
+        text = cPickle.dumps(obj, cPickle.HIGHEST_PROTOCOL)
+    else:
+        keys = {}  # id(array) -> key, for arrays referenced more than once.
+
+        def persistent_id(obj):
+            if not isinstance(obj, numpy.ndarray) or obj.dtype.hasobject or \
+               obj.nbytes < threshold or \
+               (type(obj) is not numpy.ndarray and
+                not isinstance(obj, numpy.memmap)):
+                return None
+            try:
+                return keys[id(obj)]
+            except KeyError:
+                key = keys[id(obj)] = len(arrays)
+                arrays.append(obj)
+                return key
+
+        out = cStringIO.StringIO()
+        pickler = cPickle.Pickler(out, cPickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = persistent_id
+        pickler.dump(obj)
+        text = out.getvalue()
+
+    if not arrays:
+        if session_key:
+            conn.send(_encrypt_text(text, session_key))
+        else:
+            conn.send_bytes(text)  # Same as conn.send(obj).
+        return
+
+    frames = []
+    specs = []
+    for arr in arrays:
+        if arr.flags.c_contiguous:
+            order = 'C'
+        elif arr.flags.f_contiguous:
+            order = 'F'
+            arr = arr.T  # C-contiguous view.
+        else:
+            order = 'C'
+            arr = numpy.ascontiguousarray(arr)
+        frames.append(arr)
+        specs.append((arr.dtype.str, arr.T.shape if order == 'F' else arr.shape,
+                      order))
+
+    if session_key:
+        # Array specs are sent with the encrypted text.
+        text = cPickle.dumps((specs, text), cPickle.HIGHEST_PROTOCOL)
+        conn.send((_OOB, None, _encrypt_text(text, session_key)))
+        for arr in frames:
+            encryptor = _cipher(session_key)
+            data = buffer(arr)
+            nbytes = len(data)
+            for start in range(0, nbytes, OOB_CHUNK):
+                chunk = data[start:start+OOB_CHUNK]
+                pad = len(chunk) % AES.block_size
+                if pad:
+                    chunk += '-'*(AES.block_size - pad)
+                conn.send_bytes(encryptor.encrypt(chunk))
+    else:
+        conn.send((_OOB, specs, text))
+        for arr in frames:
+            if arr.nbytes:
+                conn.send_bytes(buffer(arr))
+
+def decode_message(conn, msg, session_key):
+    """
+    Return the object sent by :func:`send_message`, given `msg` as
+    received by ``conn.recv()``. Any out-of-band arrays are then received
+    from `conn` directly into newly allocated arrays. RuntimeError is raised
+    for object arrays or arrays totalling more than :data:`OOB_MAX` bytes.
+
+    conn: :class:`multiprocessing.Connection`
+        Connection `msg` was received on.
+
+    msg: object
+        Message received.
+
+    session_key: string
+        Key used for encryption. Should be at least 16 bytes long.
+    """
+    if not (isinstance(msg, tuple) and len(msg) == 3 and msg[0] == _OOB):
+        return decrypt(msg, session_key)
+
+    if session_key:
+        specs, text = cPickle.loads(_decrypt_text(msg[2], session_key))
+    else:
+        specs, text = msg[1:]
+    _check_specs(specs)
+
+    arrays = []
+    for dtype, shape, order in specs:
+        arr = numpy.empty(shape, dtype, order=order)
+        arrays.append(arr)
+        if order == 'F':
+            arr = arr.T
+        if session_key:
+            decryptor = _cipher(session_key)
+            dst = arr.reshape(-1).view(numpy.uint8)
+            nbytes = dst.size
+            for start in range(0, nbytes, OOB_CHUNK):
+                chunk = decryptor.decrypt(conn.recv_bytes())
+                size = min(OOB_CHUNK, nbytes-start)
+                dst[start:start+size] = numpy.frombuffer(chunk, numpy.uint8,
+                                                         size)
+        elif arr.nbytes:
+            conn.recv_bytes_into(arr)
+
+    unpickler = cPickle.Unpickler(cStringIO.StringIO(text))
+    unpickler.persistent_load = lambda key: arrays[key]
+    return unpickler.load()
+
+def _check_specs(specs):
+    """
+    Raise RuntimeError if out-of-band array `specs` aren't valid: arrays must
+    not contain objects, and must total no more than :data:`OOB_MAX` bytes.
+    """
+    total = 0
+    try:
+        for dtype, shape, order in specs:
+            dtype = numpy.dtype(dtype)
+            if dtype.hasobject:
+                raise RuntimeError('object array in message')
+            if order not in ('C', 'F'):
+                raise RuntimeError('invalid array order %r' % order)
+            size = dtype.itemsize
+            for dim in shape:
+                if not isinstance(dim, (int, long)) or dim < 0:
+                    raise RuntimeError('invalid array shape %r' % (shape,))
+                size *= dim
+            total += size
+            if total > OOB_MAX:
+                raise RuntimeError('message arrays exceed %d bytes' % OOB_MAX)
+    except RuntimeError:
+        raise
+    except Exception as exc:
+        raise RuntimeError('invalid array specs: %r' % exc)
+
 
 def public_methods(obj):
     """
@@ -4,6 +4,7 @@ which support various operations such as creating objects, loading models via
 egg files, remote execution, and remote file access.
 """
 
+import cStringIO
 import logging
 import optparse
 import os.path
@@ -13,6 +14,7 @@ import shutil
 import signal
 import socket
 import sys
+import threading
 import time
 
 from multiprocessing import current_process
@@ -38,6 +40,50 @@ from openmdao.util.shellproc import ShellProc, STDOUT, DEV_NULL
 
 _PROXIES = {}
 
+# Pickled model states keyed by template name. Servers are started by
+# forking (except on Windows), so servers started after a template is
+# registered inherit the pickled state along with the modules already
+# imported here. Each server unpickles its own copy of the model.
+_MODEL_TEMPLATES = {}
+
+
+def register_model_template(name, tlo):
+    """
+    Save the state of `tlo` as template `name` for servers started from this
+    process after this call. Those servers can then load the model via
+    :meth:`ObjServer.load_template` without transferring and unpacking an
+    egg or importing the model's modules again. Each server still unpickles
+    a private copy of the model.
+    Not supported on Windows, where servers are not forked.
+
+    name: string
+        Name of the template.
+
+    tlo: :class:`Container`
+        Top-level object to be saved.
+    """
+    if sys.platform == 'win32':
+        raise RuntimeError('model templates require fork()')
+    stream = cStringIO.StringIO()
+    tlo.save(stream)
+    _MODEL_TEMPLATES[name] = stream.getvalue()
+
+
+def unregister_model_template(name):
+    """
+    Remove template `name`. Servers which have already been started retain
+    their copy.
+
+    name: string
+        Name of the template.
+    """
+    _MODEL_TEMPLATES.pop(name, None)
+
+
+def list_model_templates():
+    """ Return a sorted list of the names of registered model templates. """
+    return sorted(_MODEL_TEMPLATES)
+
 
 class ObjServerFactory(Factory):
     """
@@ -329,6 +375,7 @@ class ObjServer(object):
         self.version = __version__
 
         self._root_dir = os.getcwd()
+        self._startup_files = set(os.listdir(self._root_dir))
         self._logger = logging.getLogger(self.name)
         self._logger.info('PID: %d, allow_shell %s',
                           os.getpid(), self._allow_shell)
@@ -340,6 +387,13 @@ class ObjServer(object):
         SimulationRoot.chroot(self._root_dir)
         self.tlo = None
 
+        # Commands started by start_command(): handle -> [thread, result]
+        self._commands = {}
+        self._command_lock = threading.Lock()
+        self._next_command = 0
+        self._last_timing = {}
+        self._local = threading.local()  # Per-thread command timing.
+
         # Ensure Traits Array support is initialized. The code contains
         # globals for numpy symbols that are initialized within
         # AbstractArray.__init__() which won't be executed if we simply
@@ -409,7 +463,11 @@ class ObjServer(object):
 
         The ``HOME_DIRECTORY`` and ``WORKING_DIRECTORY`` placeholders are
         ignored.
+
+        Returns as soon as the command completes. Timing information is
+        available from :meth:`command_timing`.
         """
+        request_time = time.time()
         try:
             job_name = resource_desc['job_name']
         except KeyError:
@@ -455,8 +513,8 @@ class ObjServer(object):
 
         limits = resource_desc.get('resource_limits', {})
         timeout = limits.get('wallclock_time', 0)
-        poll_delay = 1
 
+        start_time = time.time()
         try:
             process = ShellProc(command, stdin, stdout, stderr, env_vars)
         except Exception as exc:
@@ -464,10 +522,110 @@ class ObjServer(object):
             raise
 
         self._logger.debug('    PID = %d', process.pid)
-        return_code, error_msg = process.wait(poll_delay, timeout)
+        return_code, error_msg = process.wait(0, timeout)
+        end_time = time.time()
+        self._record_timing(dict(queue=start_time-request_time,
+                                 run=end_time-start_time))
         self._logger.debug('    returning %s', (return_code, error_msg))
         return (return_code, error_msg)
 
+    @rbac('owner')
+    def start_command(self, resource_desc):
+        """
+        Start :meth:`execute_command` with `resource_desc` in the background,
+        returning a handle for :meth:`wait_command`. This allows a client to
+        overlap other operations, such as sending files for a subsequent
+        command, with command execution.
+
+        resource_desc: dict
+            Contains job description.
+        """
+        self._logger.debug('start_command %r', resource_desc.get('job_name'))
+        return self._start_background(self.execute_command, resource_desc)
+
+    def _start_background(self, func, *args):
+        """
+        Run ``func(*args)`` in a background thread with the caller's
+        credentials, returning a handle for :meth:`wait_command`.
+        """
+        credentials = get_credentials()
+        with self._command_lock:
+            self._next_command += 1
+            handle = self._next_command
+            entry = self._commands[handle] = [None, None, None]
+
+        def _run():
+            set_credentials(credentials)
+            self._local.background = True
+            self._local.timing = None
+            start_time = time.time()
+            try:
+                entry[1] = func(*args)
+            except Exception as exc:
+                entry[1] = exc
+            timing = self._local.timing
+            if timing is None:  # Not recorded by func().
+                timing = dict(queue=0., run=time.time()-start_time)
+            entry[2] = timing
+
+        entry[0] = threading.Thread(target=_run,
+                                    name='%s-command-%d' % (self.name, handle))
+        entry[0].daemon = True
+        entry[0].start()
+        return handle
+
+    def _record_timing(self, timing):
+        """
+        Record `timing` of a completed command. Within a thread started by
+        :meth:`_start_background` it is kept for that command only,
+        otherwise it is returned by :meth:`command_timing`.
+        """
+        if getattr(self._local, 'background', False):
+            self._local.timing = timing
+        else:
+            self._last_timing = timing
+
+    @rbac('owner')
+    def wait_command(self, handle, timeout=None):
+        """
+        Wait for command started by :meth:`start_command` to complete.
+        Returns ``(return_code, error_msg)`` as from :meth:`execute_command`,
+        or raises the exception it raised.
+
+        handle: int
+            Value returned by :meth:`start_command`.
+
+        timeout: float
+            Maximum seconds to wait, None implies no limit. If the command
+            hasn't completed, :class:`RuntimeError` is raised and the command
+            may be waited for again.
+        """
+        with self._command_lock:
+            try:
+                entry = self._commands[handle]
+            except KeyError:
+                raise ValueError('invalid command handle %r' % handle)
+        entry[0].join(timeout)
+        if entry[0].is_alive():
+            raise RuntimeError('command %r still running' % handle)
+        with self._command_lock:
+            self._commands.pop(handle, None)
+        self._last_timing = entry[2]
+        if isinstance(entry[1], Exception):
+            raise entry[1]
+        return entry[1]
+
+    @rbac('owner')
+    def command_timing(self):
+        """
+        Returns a dictionary of timing information for the most recently
+        completed command: 'queue' is the time in seconds from request to
+        command start, 'run' is the time from start to completion.
+        Servers which submit commands to a queuing system may report the
+        entire time as 'run'.
+        """
+        return self._last_timing.copy()
+
     @rbac('owner', proxy_types=[Container])
     def load_model(self, egg_filename):
         """
@@ -488,6 +646,31 @@ class ObjServer(object):
         self.tlo = Container.load_from_eggfile(egg_filename, log=self._logger)
         return self.tlo
 
+    @rbac('owner', proxy_types=[Container])
+    def load_template(self, name):
+        """
+        Load model from template `name` and return top-level object if this
+        server's `allow_shell` attribute is True. The template must have been
+        registered via :meth:`register_model_template` in the process which
+        started this server, before this server was started.
+
+        name: string
+            Name of template to be loaded.
+        """
+        self._logger.debug('load_template %r', name)
+        if not self._allow_shell:
+            self._logger.error('attempt to load template %r by %r', name,
+                               get_credentials().user)
+            raise RuntimeError('shell access is not allowed by this server')
+        try:
+            state = _MODEL_TEMPLATES[name]
+        except KeyError:
+            raise RuntimeError('no model template %r in this server' % name)
+        if self.tlo:
+            self.tlo.pre_delete()
+        self.tlo = Container.load(cStringIO.StringIO(state))
+        return self.tlo
+
     @rbac('owner')
     def pack_zipfile(self, patterns, filename):
         """
@@ -615,6 +798,32 @@ class ObjServer(object):
                                path, os.getcwd(), exc)
             raise
 
+    @rbac('owner')
+    def cleanup_dir(self):
+        """
+        Prepare for reuse: discard the current model and remove files
+        and directories created in the root directory since startup.
+        Log files are retained.
+        """
+        self._logger.debug('cleanup_dir')
+        if self.tlo:
+            self.tlo.pre_delete()
+        self.tlo = None
+        os.chdir(self._root_dir)
+        SimulationRoot.chroot(self._root_dir)
+        for name in os.listdir(self._root_dir):
+            if name in self._startup_files or name.startswith('openmdao_log'):
+                continue
+            path = os.path.join(self._root_dir, name)
+            try:
+                if os.path.isdir(path) and not os.path.islink(path):
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+            except Exception as exc:
+                self._logger.error('cleanup_dir %r failed %s', path, exc)
+                raise
+
     @rbac('owner')
     def stat(self, path):
         """
@@ -470,7 +470,7 @@ class PBS_Server(ObjServer):
             raise
 
         self._logger.debug('    PID = %d', process.pid)
-        return_code, error_msg = process.wait(1)
+        return_code, error_msg = process.wait()
         self._logger.debug('    returning %s', (return_code, error_msg))
         return (return_code, error_msg)
 
@@ -1,6 +1,7 @@
 
 import logging
 import copy
+import cPickle
 import os.path
 
 # these fail to find pkg_resources when run from pylint
@@ -26,6 +27,11 @@ class PkgResourcesFactory(Factory):
         self._search_path = search_path
         self.env = Environment(search_path)
         self.tree_analyser = PythonSourceTreeAnalyser()
+        # Rescan when distributions are added to the working set.
+        working_set.subscribe(self._dist_added)
+
+    def _dist_added(self, dist):
+        self._have_new_types = True
             
     def create(self, typ, version=None, server=None, 
                res_desc=None, **ctor_args):
@@ -68,17 +74,21 @@ class PkgResourcesFactory(Factory):
         return None
             
     def _entry_map_info(self, distiter):
+        dists = [(dist, _EntryPointCache.get_entry_map(dist))
+                 for dist in distiter]
+        _EntryPointCache.save()
         dct = {}
         for group in plugin_groups.keys():
-            for dist in distiter:
-                for name, value in dist.get_entry_map(group).items():
+            for dist, entry_map in dists:
+                for name, module_name in entry_map.get(group, ()):
                     lst = dct.setdefault(name, (dist, [], set()))
                     lst[1].append(group)
-                    lst[2].add(value.module_name)
+                    lst[2].add(module_name)
         return dct
         
     def _get_type_dict(self):
         if self._have_new_types:
+            self._have_new_types = False
             self._entry_pt_classes = self._entry_map_info(working_set)
         return self._entry_pt_classes
             
@@ -139,3 +149,100 @@ class PkgResourcesFactory(Factory):
         
         return ret
 
+
+class _EntryPointCache(object):
+    """ Retains the openmdao plugin entry points of distributions. """
+
+    _cache = None
+    _dirty = False
+
+    @staticmethod
+    def get_entry_map(dist):
+        """
+        Return ``{group: [(name, module_name)]}`` for the openmdao plugin
+        groups defined by `dist`. Entry points are read from the
+        distribution's metadata only if it has changed since they were
+        last recorded.
+        """
+        if _EntryPointCache._cache is None:
+            _EntryPointCache._load()
+        key = _EntryPointCache._key(dist)
+        if key is not None:
+            try:
+                return _EntryPointCache._cache[key]
+            except KeyError:
+                pass
+
+        entry_map = {}
+        for group in plugin_groups.keys():
+            entries = [(name, value.module_name)
+                       for name, value in dist.get_entry_map(group).items()]
+            if entries:
+                entry_map[group] = entries
+
+        if key is not None:
+            _EntryPointCache._cache[key] = entry_map
+            _EntryPointCache._dirty = True
+        return entry_map
+
+    @staticmethod
+    def save():
+        """ Save entry point data to file. """
+        if _EntryPointCache._dirty:
+            try:
+                out = _EntryPointCache._open('wb')
+            except Exception as exc:
+                logging.debug("Can't save entry point cache: %s", exc)
+            else:
+                cPickle.dump(_EntryPointCache._cache, out,
+                             cPickle.HIGHEST_PROTOCOL)
+                out.close()
+            _EntryPointCache._dirty = False
+
+    @staticmethod
+    def _key(dist):
+        """
+        Return ``(project_name, version, path, mod_time)``, where `path` is
+        the distribution's metadata, or None if it can't be determined.
+        """
+        if not dist.location:
+            return None
+        path = getattr(dist, 'egg_info', None)
+        if path:
+            entry_points = os.path.join(path, 'entry_points.txt')
+            if os.path.exists(entry_points):
+                path = entry_points
+        else:
+            path = dist.location
+        try:
+            info = os.stat(path)
+        except OSError:
+            return None
+        return (dist.project_name, dist.version, os.path.realpath(path),
+                info.st_mtime)
+
+    @staticmethod
+    def _load():
+        """ Load entry point data from file. """
+        _EntryPointCache._cache = {}
+        try:
+            inp = _EntryPointCache._open('rb')
+        except Exception:
+            return
+
+        try:
+            _EntryPointCache._cache = cPickle.load(inp)
+        except Exception:
+            return
+        finally:
+            inp.close()
+
+    @staticmethod
+    def _open(mode):
+        """ Return opened file for '~/.openmdao/entrypoints.dat'. """
+        filename = \
+            os.path.expanduser(os.path.join('~', '.openmdao', 'entrypoints.dat'))
+        dirname = os.path.dirname(filename)
+        if not os.path.exists(dirname):
+            os.mkdir(dirname)
+        return open(filename, mode)
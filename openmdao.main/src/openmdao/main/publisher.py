@@ -1,6 +1,23 @@
+"""
+Publishes values to a ZMQ PUB socket.
+
+By default messages are handed to a background sender thread, so the
+caller (typically a component's execution thread) only pays for queueing.
+Variable updates published with ``coalesce=True`` are merged per topic so
+that only the latest value is sent, and optionally rate limited per topic.
+Messages are always sent in the order they were first published; a
+coalesced update takes the place of the pending one for its topic, and a
+rate limited update holds back the messages published after it.
+Numeric NumPy arrays are sent as a small JSON header followed by a raw data
+frame rather than being jsonpickled; use :func:`decode_message` on the
+receiving side.
+"""
+
 import sys
+import time
 
-from threading import RLock
+from collections import deque
+from threading import RLock, Condition, Thread
 
 import jsonpickle
 
@@ -10,6 +27,55 @@ try:
 except ImportError:
     zmq = None
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# dtype kinds that are sent as raw binary frames
+_BINARY_KINDS = 'biufc'
+
+
+def _is_binary_array(value):
+    return numpy is not None and isinstance(value, numpy.ndarray) and \
+           value.dtype.kind in _BINARY_KINDS
+
+
+def _snapshot(value):
+    """Copy values that may be modified in place before they are sent."""
+    if _is_binary_array(value):
+        return value.copy()
+    return value
+
+
+def encode_value(value):
+    """Return a list of message frames (excluding the topic) for `value`."""
+    if _is_binary_array(value):
+        header = jsonpickle.encode({'__ndarray__': {'dtype': value.dtype.str,
+                                                   'shape': value.shape}})
+        return [header, numpy.ascontiguousarray(value)]
+
+    # encode value as json
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return [jsonpickle.encode(value)]
+    else:
+        return [jsonpickle.encode(number)]
+
+
+def decode_message(frames):
+    """Return ``(topic, value)`` from the frames of a published message.
+    Binary array messages are returned as (read-only) NumPy arrays.
+    """
+    topic = frames[0]
+    value = jsonpickle.decode(frames[1])
+    if len(frames) > 2 and isinstance(value, dict) and '__ndarray__' in value:
+        meta = value['__ndarray__']
+        value = numpy.frombuffer(frames[2], dtype=meta['dtype'])
+        value = value.reshape(meta['shape'])
+    return (topic, value)
+
 
 class Publisher(object):
 
@@ -17,7 +83,8 @@ class Publisher(object):
     __enabled = True
     silent = False
 
-    def __init__(self, context, url, use_stream=True):
+    def __init__(self, context, url, use_stream=True, background=True,
+                 min_interval=0.):
         # Socket to talk to pub socket
         sock = context.socket(zmq.PUB)
         sock.bind(url)
@@ -28,62 +95,134 @@ class Publisher(object):
         self._lock = RLock()
         self.enc = sys.getdefaultencoding()
 
-    def publish(self, topic, value):
+        # Minimum number of seconds between sends of a coalesced topic.
+        self.min_interval = min_interval
+
+        self._cond = Condition()
+        self._queue = deque()   # [topic, value, coalesced], sent in order
+        self._pending = {}      # topic -> unsent coalesced queue entry
+        self._last_sent = {}    # topic -> time of last coalesced send
+        self._sending = False
+        self._thread = None
+        if background:
+            self._thread = Thread(target=self._send_loop, name='Publisher')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _topic(self, topic):
+        if isinstance(topic, unicode):
+            # zmq doesn't like unicode
+            topic = topic.encode(self.enc)
+        return topic
+
+    def publish(self, topic, value, coalesce=False):
+        """Publish `value` under `topic`. If `coalesce` is True, a value
+        for `topic` that hasn't been sent yet is replaced rather than
+        sent separately.
+        """
+        self.publish_list([(topic, value)], coalesce)
+
+    def publish_list(self, items, coalesce=False):
+        """Publish a list of ``(topic, value)`` pairs. See :meth:`publish`.
+        """
         if Publisher.__enabled:
-            if isinstance(topic, unicode):
-                # zmq doesn't like unicode
-                topic = topic.encode(self.enc)
-
-            # encode value as json
+            items = [(self._topic(topic), _snapshot(value))
+                     for topic, value in items]
+            if self._thread is None:
+                self._send(items)
+                return
+            with self._cond:
+                for topic, value in items:
+                    if coalesce:
+                        entry = self._pending.get(topic)
+                        if entry is not None:
+                            entry[1] = value
+                            continue
+                        entry = [topic, value, True]
+                        self._pending[topic] = entry
+                    else:
+                        # later updates must not be merged into an entry
+                        # that precedes this message
+                        self._pending.pop(topic, None)
+                        entry = [topic, value, False]
+                    self._queue.append(entry)
+                self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """Wait until all pending messages have been sent. Returns False
+        if `timeout` expired first.
+        """
+        if self._thread is None:
+            return True
+        if timeout is not None:
+            deadline = time.time() + timeout
+        with self._cond:
+            while self._queue or self._sending:
+                if timeout is None:
+                    self._cond.wait()
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+        return True
+
+    def _next_batch(self):
+        """Wait for and return the next list of messages to be sent.
+        Must be called with self._cond held."""
+        while True:
+            items = []
+            now = time.time()
+            wait = None
+            while self._queue:
+                entry = self._queue[0]
+                topic, value, coalesced = entry
+                if coalesced:
+                    if self.min_interval > 0:
+                        elapsed = now - self._last_sent.get(topic, 0.)
+                        if elapsed < self.min_interval:
+                            wait = self.min_interval - elapsed
+                            break
+                        self._last_sent[topic] = now
+                    if self._pending.get(topic) is entry:
+                        del self._pending[topic]
+                self._queue.popleft()
+                items.append((topic, value))
+            if items:
+                return items
+            self._cond.wait(wait)
+
+    def _send_loop(self):
+        while True:
+            with self._cond:
+                self._sending = False
+                self._cond.notify_all()
+                items = self._next_batch()
+                self._sending = True
+            self._send(items)
+
+    def _send(self, items):
+        with self._lock:
+            topic = None
             try:
-                number = float(value)
-            except (ValueError, TypeError):
-                value = jsonpickle.encode(value)
-            else:
-                value = jsonpickle.encode(number)
-
-            with self._lock:
-                try:
-                    self._sender.send_multipart([topic, value])
-                    if hasattr(self._sender, 'flush'):
-                        self._sender.flush()
-                except Exception, err:
-                    print 'Publisher - Error publishing message %s: %s, %s' % \
-                          (topic, value, err)
-
-    def publish_list(self, items):
-        if Publisher.__enabled:
-            with self._lock:
-                try:
-                    for topic, value in items:
-                        if isinstance(topic, unicode):
-                            # zmq doesn't like unicode
-                            topic = topic.encode(self.enc)
-
-                        # encode value as json
-                        try:
-                            number = float(value)
-                        except (ValueError, TypeError):
-                            value = jsonpickle.encode(value)
-                        else:
-                            value = jsonpickle.encode(number)
-
-                        self._sender.send_multipart([topic, value])
-                        if hasattr(self._sender, 'flush'):
-                            self._sender.flush()
-                except Exception, err:
-                    print 'Publisher - Error publishing list %s, %s' % \
-                          (topic, err)
+                for topic, value in items:
+                    self._sender.send_multipart([topic]+encode_value(value))
+                if hasattr(self._sender, 'flush'):
+                    self._sender.flush()
+            except Exception, err:
+                print 'Publisher - Error publishing list %s, %s' % \
+                      (topic, err)
 
     @staticmethod
     def get_instance():
         return Publisher.__publisher
 
     @staticmethod
-    def init(context, url, use_stream=True):
+    def init(context, url, use_stream=True, background=True, min_interval=0.):
         if Publisher.__publisher is not None:
             raise RuntimeError("publisher already exists")
-        Publisher.__publisher = Publisher(context, url, use_stream)
+        Publisher.__publisher = Publisher(context, url, use_stream,
+                                          background, min_interval)
         return Publisher.__publisher
 
     @staticmethod
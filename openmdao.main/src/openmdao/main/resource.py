@@ -21,7 +21,8 @@ import traceback
 
 from openmdao.main import mp_distributing
 from openmdao.main.mp_support import register
-from openmdao.main.objserverfactory import ObjServerFactory
+from openmdao.main.objserverfactory import ObjServerFactory, \
+                                          list_model_templates
 from openmdao.main.rbac import get_credentials, set_credentials, rbac
 
 from openmdao.util.eggloader import check_requirements
@@ -103,9 +104,19 @@ class ResourceAllocationManager(object):
     By default ``~/.openmdao/resources.cfg`` will be used for additional
     configuration information. To avoid this, call :meth:`configure` before
     any other allocation routines.
+
+    Released servers may be kept in a pool of idle servers for reuse by
+    later requests with the same resource description, avoiding the cost of
+    starting a new server. The pool is disabled by default, see
+    :meth:`configure_pool`.
+
+    Allocator time estimates are obtained concurrently and cached for a short
+    time (see :meth:`set_estimate_ttl`). Requests which can't be satisfied
+    immediately are queued in order and retried when a server is released.
     """
 
     _lock = threading.Lock()
+    _released = threading.Condition(_lock)  # Notified when servers released.
     _RAM = None  # Singleton.
 
     def __init__(self, config_filename=None):
@@ -114,6 +125,22 @@ class ResourceAllocationManager(object):
         self._allocations = 0
         self._allocators = []
         self._deployed_servers = {}
+
+        # Idle server pool: [(key, allocator, server, server_info, released)]
+        self._pool = []
+        self._expiring = []  # Pool entries to be shut down.
+        self._pool_size = 0
+        self._pool_timeout = 60.
+        self._pool_hits = 0
+        self._pool_misses = 0
+        self._pool_expired = 0
+
+        # Cached estimates: (id(allocator), desc_key) -> (time, est, criteria)
+        self._estimates = {}
+        self._estimate_ttl = 1.
+        self._waiting = []  # Tickets of queued allocation requests.
+        self._retry_delay = 1.  # Max wait before retrying an allocation.
+
         self._allocators.append(LocalAllocator('LocalHost',
                                                authkey='PublicKey',
                                                allow_shell=True))
@@ -201,6 +228,7 @@ class ResourceAllocationManager(object):
         ram = ResourceAllocationManager._get_instance()
         with ResourceAllocationManager._lock:
             ram._allocators.append(allocator)
+            ram._estimates.clear()
 
     @staticmethod
     def insert_allocator(index, allocator):
@@ -216,6 +244,7 @@ class ResourceAllocationManager(object):
         ram = ResourceAllocationManager._get_instance()
         with ResourceAllocationManager._lock:
             ram._allocators.insert(index, allocator)
+            ram._estimates.clear()
 
     @staticmethod
     def get_allocator(selector):
@@ -245,6 +274,7 @@ class ResourceAllocationManager(object):
         """
         ram = ResourceAllocationManager._get_instance()
         with ResourceAllocationManager._lock:
+            ram._estimates.clear()
             if isinstance(selector, basestring):
                 for i, allocator in enumerate(ram._allocators):
                     if allocator.name == selector:
@@ -302,14 +332,94 @@ class ResourceAllocationManager(object):
         """
         ResourceAllocationManager.validate_resources(resource_desc)
         ram = ResourceAllocationManager._get_instance()
-        with ResourceAllocationManager._lock:
-            return ram._allocate(resource_desc)
+        try:
+            with ResourceAllocationManager._lock:
+                return ram._allocate(resource_desc)
+        finally:
+            ram._shutdown_expired()
+
+    @staticmethod
+    def allocate_many(resource_desc, count):
+        """
+        Allocate up to `count` servers for `resource_desc`, stopping early
+        if resources aren't currently available. Unlike repeated calls to
+        :meth:`allocate`, only the estimate of the allocator last deployed on
+        needs to be updated between deployments. Since this never waits,
+        nothing is allocated while :meth:`allocate` requests are queued
+        waiting for a release, so they keep their priority.
+        Returns a list of ``(proxy-object, server-dict)``.
+
+        resource_desc: dict
+            Description of required resources.
+
+        count: int
+            Number of servers requested.
+        """
+        ResourceAllocationManager.validate_resources(resource_desc)
+        ram = ResourceAllocationManager._get_instance()
+        try:
+            with ResourceAllocationManager._lock:
+                allocated = []
+                if ram._waiting:
+                    return allocated
+                while len(allocated) < count:
+                    result = ram._try_allocate(resource_desc)
+                    if result is None or result[0] is None:
+                        break
+                    allocated.append(result)
+                return allocated
+        finally:
+            ram._shutdown_expired()
 
     def _allocate(self, resource_desc):
-        """ Do the allocation. """
+        """
+        Do the allocation. If resources aren't currently available, wait
+        for a release, with earlier requests having priority.
+        Must be called with the lock held.
+        """
+        ticket = None
+        try:
+            while True:
+                if ticket is None and self._waiting:
+                    ticket = object()  # Get in line.
+                    self._waiting.append(ticket)
+                if ticket is None or self._waiting[0] is ticket:
+                    result = self._try_allocate(resource_desc)
+                    if result is not None:
+                        return result
+                    if ticket is None:
+                        ticket = object()
+                        self._waiting.append(ticket)
+                ResourceAllocationManager._released.wait(self._retry_delay)
+        finally:
+            if ticket is not None:
+                self._waiting.remove(ticket)
+                ResourceAllocationManager._released.notify_all()
+
+    def _try_allocate(self, resource_desc):
+        """
+        Try to allocate from the pool or deploy a new server.
+        Returns ``(server, server_info)``, ``(None, None)`` if resources
+        will never be available, or None if they aren't available now.
+        """
+        if self._pool_size:
+            self._expire_idle()
+            key = self._pool_key(resource_desc)
+            for i in range(len(self._pool)-1, -1, -1):  # Most recent first.
+                if self._pool[i][0] == key:
+                    key, allocator, server, server_info, released = \
+                        self._pool.pop(i)
+                    self._pool_hits += 1
+                    self._logger.info('allocated %r pid %d on %s from pool',
+                                      server_info['name'], server_info['pid'],
+                                      server_info['host'])
+                    self._deployed_servers[id(server)] = \
+                        (allocator, server, server_info)
+                    return (server, server_info)
+            self._pool_misses += 1
+
         deployment_retries = 0
-        best_estimate = -1
-        while best_estimate == -1:
+        while True:
             best_estimate, best_criteria, best_allocator = \
                 self._get_estimates(resource_desc)
             if best_estimate >= 0:
@@ -318,11 +428,13 @@ class ResourceAllocationManager(object):
                 self._logger.debug('deploying on %r', best_allocator._name)
                 server = best_allocator.deploy(name, resource_desc,
                                                best_criteria)
+                self._invalidate_estimates(best_allocator)
                 if server is not None:
                     server_info = {
                         'name': name,
                         'pid':  server.pid,
-                        'host': server.host
+                        'host': server.host,
+                        'key':  self._pool_key(resource_desc)
                     }
                     self._logger.info('allocated %r pid %d on %s',
                                       name, server_info['pid'],
@@ -337,12 +449,11 @@ class ResourceAllocationManager(object):
                         self._logger.error('deployment failed too many times.')
                         return (None, None)
                     self._logger.warning('deployment failed, retrying.')
-                    best_estimate = -1
             elif best_estimate != -1:
                 return (None, None)
             # Difficult to generate deployable request that won't deploy...
             else:  #pragma no cover
-                time.sleep(1)  # Wait a bit between retries.
+                return None
 
     @staticmethod
     def get_hostnames(resource_desc):
@@ -373,7 +484,8 @@ class ResourceAllocationManager(object):
                 return None
             # Difficult to generate deployable request that won't deploy...
             else:  #pragma no cover
-                time.sleep(1)  # Wait a bit between retries.
+                # Wait for a release (or a bit) before retrying.
+                ResourceAllocationManager._released.wait(self._retry_delay)
 
     def _get_estimates(self, resource_desc, need_hostnames=False):
         """ Return best (estimate, criteria, allocator). """
@@ -381,13 +493,16 @@ class ResourceAllocationManager(object):
         best_criteria = None
         best_allocator = None
 
-        for allocator in self._allocators:
-            estimate, criteria = allocator.time_estimate(resource_desc)
+        for allocator, estimate, criteria in \
+                self._gather_estimates(resource_desc):
             if estimate == -2:
-                key = criteria.keys()[0]
-                info = criteria[key]
-                self._logger.debug('%r incompatible: key %r: %s',
-                                   allocator.name, key, info)
+                if criteria:
+                    key = criteria.keys()[0]
+                    info = criteria[key]
+                    self._logger.debug('%r incompatible: key %r: %s',
+                                       allocator.name, key, info)
+                else:
+                    self._logger.debug('%r incompatible', allocator.name)
             else:
                 msg = 'OK' if estimate == 0 else 'returned %g' % estimate
                 self._logger.debug('%r %s', allocator.name, msg)
@@ -407,6 +522,86 @@ class ResourceAllocationManager(object):
 
         return (best_estimate, best_criteria, best_allocator)
 
+    def _gather_estimates(self, resource_desc):
+        """
+        Return list of ``(allocator, estimate, criteria)`` in allocator order.
+        Cached estimates are used if recent enough, otherwise estimates are
+        obtained concurrently.
+        """
+        desc_key = repr(sorted(resource_desc.items()))
+        now = time.time()
+        results = []
+        stale = []
+        for allocator in self._allocators:
+            try:
+                stamp, estimate, criteria = \
+                    self._estimates[(id(allocator), desc_key)]
+            except KeyError:
+                stamp = None
+            if stamp is None or now - stamp >= self._estimate_ttl:
+                stale.append(len(results))
+                estimate = criteria = None
+            results.append([allocator, estimate, criteria])
+
+        if len(stale) == 1:
+            entry = results[stale[0]]
+            entry[1:] = entry[0].time_estimate(resource_desc)
+        elif stale:
+            reply_q = Queue.Queue()
+            credentials = get_credentials()
+            for index in stale:
+                worker_q = WorkerPool.get()
+                worker_q.put((self._get_estimate,
+                              (index, results[index][0], resource_desc,
+                               credentials), {}, reply_q))
+            error = None
+            for index in stale:
+                worker_q, retval, exc, trace = reply_q.get()
+                WorkerPool.release(worker_q)
+                if exc:
+                    self._logger.error(trace)
+                    error = error or exc
+                else:
+                    index, estimate, criteria = retval
+                    results[index][1:] = (estimate, criteria)
+            if error is not None:
+                raise error
+
+        now = time.time()
+        for index in stale:
+            allocator, estimate, criteria = results[index]
+            self._estimates[(id(allocator), desc_key)] = \
+                (now, estimate, criteria)
+        return results
+
+    @staticmethod
+    def _get_estimate(index, allocator, resource_desc, credentials):
+        """ Get estimate from `allocator` (in a worker thread). """
+        set_credentials(credentials)
+        estimate, criteria = allocator.time_estimate(resource_desc)
+        return (index, estimate, criteria)
+
+    def _invalidate_estimates(self, allocator):
+        """ Discard cached estimates from `allocator`. """
+        ident = id(allocator)
+        for key in [key for key in self._estimates if key[0] == ident]:
+            del self._estimates[key]
+
+    @staticmethod
+    def set_estimate_ttl(ttl):
+        """
+        Set the time cached allocator estimates remain valid.
+        Estimates from an allocator are also discarded whenever it deploys
+        or releases a server.
+
+        ttl: float
+            Time in seconds, zero disables caching.
+        """
+        ram = ResourceAllocationManager._get_instance()
+        with ResourceAllocationManager._lock:
+            ram._estimate_ttl = ttl
+            ram._estimates.clear()
+
     @staticmethod
     def release(server):
         """
@@ -429,7 +624,37 @@ class ResourceAllocationManager(object):
                 self._logger.error('server %r not found', server)
                 return
             del self._deployed_servers[id(server)]
+            pool_size = self._pool_size
+
+        if pool_size:
+            try:
+                server.cleanup_dir()
+            except Exception as exc:
+                self._logger.warning("Can't cleanup %r for reuse: %r",
+                                     server_info['name'], exc)
+            else:
+                with ResourceAllocationManager._lock:
+                    self._expire_idle()
+                    pooled = len(self._pool) < self._pool_size
+                    if pooled:
+                        self._logger.info('release %r pid %d on %s to pool',
+                                          server_info['name'],
+                                          server_info['pid'],
+                                          server_info['host'])
+                        self._pool.append((server_info['key'], allocator,
+                                           server, server_info, time.time()))
+                        ResourceAllocationManager._released.notify_all()
+                self._shutdown_expired()
+                if pooled:
+                    return
+
+        self._shutdown(allocator, server, server_info)
+        with ResourceAllocationManager._lock:
+            self._invalidate_estimates(allocator)
+            ResourceAllocationManager._released.notify_all()
 
+    def _shutdown(self, allocator, server, server_info):
+        """ Have `allocator` shut down `server`. """
         self._logger.info('release %r pid %d on %s', server_info['name'],
                           server_info['pid'], server_info['host'])
         try:
@@ -439,6 +664,95 @@ class ResourceAllocationManager(object):
             self._logger.error("Can't release %r: %r", server_info['name'], exc)
         server._close.cancel()
 
+    @staticmethod
+    def _pool_key(resource_desc):
+        """
+        Return key for pooled servers compatible with `resource_desc`.
+        Servers forked from this process only have the model templates
+        registered when they were started, so those are part of the key.
+        """
+        return (get_credentials().user, repr(sorted(resource_desc.items())),
+                tuple(list_model_templates()))
+
+    def _expire_idle(self):
+        """ Move pooled servers idle for more than the pool's idle timeout
+        to the list of servers to be shut down by :meth:`_shutdown_expired`.
+        Must be called with the lock held. """
+        limit = time.time() - self._pool_timeout
+        keep = []
+        for entry in self._pool:
+            if entry[4] <= limit:
+                self._pool_expired += 1
+                self._expiring.append(entry)
+            else:
+                keep.append(entry)
+        self._pool = keep
+
+    def _shutdown_expired(self):
+        """ Shut down servers removed from the pool. Must be called without
+        the lock held, since shutting down a server is a remote call. """
+        with ResourceAllocationManager._lock:
+            entries = self._expiring
+            self._expiring = []
+        if not entries:
+            return
+        for entry in entries:
+            self._shutdown(*entry[1:4])
+        with ResourceAllocationManager._lock:
+            for entry in entries:
+                self._invalidate_estimates(entry[1])
+            ResourceAllocationManager._released.notify_all()
+
+    @staticmethod
+    def configure_pool(size, idle_timeout=60.):
+        """
+        Configure the pool of idle servers. Servers released while the pool
+        has fewer than `size` servers are kept for reuse rather than shut
+        down. A released server is reused only for an identical resource
+        description from the same user, made while the same model templates
+        are registered. Its model is discarded and its working directory is
+        cleaned when it is released.
+
+        size: int
+            Maximum number of idle servers. Zero disables the pool, shutting
+            down any idle servers.
+
+        idle_timeout: float
+            Idle servers are shut down after this many seconds.
+        """
+        if size < 0:
+            raise ValueError('pool size must be >= 0')
+        ram = ResourceAllocationManager._get_instance()
+        with ResourceAllocationManager._lock:
+            ram._pool_size = size
+            ram._pool_timeout = idle_timeout
+            ram._expire_idle()
+            while len(ram._pool) > size:
+                ram._expiring.append(ram._pool.pop(0))
+        ram._shutdown_expired()
+
+    @staticmethod
+    def drain_pool():
+        """ Shut down all idle servers in the pool. """
+        ram = ResourceAllocationManager._get_instance()
+        with ResourceAllocationManager._lock:
+            ram._expiring.extend(ram._pool)
+            ram._pool = []
+        ram._shutdown_expired()
+
+    @staticmethod
+    def get_pool_stats():
+        """
+        Return a dictionary of idle server pool statistics:
+        `size`, `idle_timeout`, `idle` (servers currently in the pool),
+        `hits`, `misses`, and `expired` (servers shut down after timing out).
+        """
+        ram = ResourceAllocationManager._get_instance()
+        with ResourceAllocationManager._lock:
+            return dict(size=ram._pool_size, idle_timeout=ram._pool_timeout,
+                        idle=len(ram._pool), hits=ram._pool_hits,
+                        misses=ram._pool_misses, expired=ram._pool_expired)
+
     @staticmethod
     def add_remotes(server, prefix=''):
         """
@@ -1013,6 +1327,15 @@ class LocalAllocator(FactoryAllocator):
         If True, :meth:`execute_command` and :meth:`load_model` are allowed
         in created servers. Use with caution!
 
+    fork_models: bool
+        If True (and not on Windows), drivers replicating a model to servers
+        from this allocator may register the model as a template (see
+        :func:`objserverfactory.register_model_template`) rather than saving
+        it to an egg. Servers are forked from the registering process, so
+        they start with the model's modules imported and its pickled state
+        in memory, from which each server loads its own copy of the model.
+        The model's external files are not copied.
+
     Resource configuration file entry equivalent to the default
     ``LocalHost`` allocator::
 
@@ -1022,12 +1345,14 @@ class LocalAllocator(FactoryAllocator):
         max_load: 1.0
         authkey: PublicKey
         allow_shell: True
+        fork_models: False
 
     """
 
     def __init__(self, name='LocalAllocator', total_cpus=0, max_load=1.0,
-                 authkey=None, allow_shell=False):
+                 authkey=None, allow_shell=False, fork_models=False):
         super(LocalAllocator, self).__init__(name, authkey, allow_shell)
+        self.fork_models = fork_models and sys.platform != 'win32'
         if total_cpus > 0:
             self.total_cpus = total_cpus
         else:
@@ -1060,10 +1385,16 @@ class LocalAllocator(FactoryAllocator):
             Configuration data is located under the section matching
             this allocator's `name`.
 
-        Allows modifying factory options, `total_cpus`, and `max_load`.
+        Allows modifying factory options, `total_cpus`, `max_load`, and
+        `fork_models`.
         """
         super(LocalAllocator, self).configure(cfg)
 
+        if cfg.has_option(self.name, 'fork_models'):
+            value = cfg.getboolean(self.name, 'fork_models')
+            self._logger.debug('    fork_models: %s', value)
+            self.fork_models = value and sys.platform != 'win32'
+
         if cfg.has_option(self.name, 'total_cpus'):
             value = cfg.getint(self.name, 'total_cpus')
             self._logger.debug('    total_cpus: %s', value)
@@ -1,4 +1,5 @@
 
+from openmdao.main.component import ConfigGeneration
 from openmdao.main.workflow import Workflow
 from openmdao.main.interfaces import implements, IComponent
 from openmdao.main.exceptions import RunStopped
@@ -56,6 +57,7 @@ class SequentialWorkflow(Workflow):
                     index += 1
             else:
                 raise TypeError("Components must be added by name to a workflow.")
+        ConfigGeneration.bump()
         
     def remove(self, compname):
         """Remove a component from the workflow by name. Do not report an
@@ -67,7 +69,10 @@ class SequentialWorkflow(Workflow):
             self._names.remove(compname)
         except ValueError:
             pass
+        else:
+            ConfigGeneration.bump()
 
     def clear(self):
         """Remove all components from this workflow."""
         self._names = []
+        ConfigGeneration.bump()
@@ -2,6 +2,7 @@
 Fake 'qsub' for testing.
 """
 
+import os
 import subprocess
 import sys
 
@@ -13,6 +14,7 @@ def main():
     stdout = 'qsub.stdout'
     stderr = 'qsub.stderr'
     join_eo = False
+    tasks = None
 
     print ' '.join(sys.argv[1:])
 
@@ -55,6 +57,13 @@ def main():
             resource_value = sys.argv[i]
             i += 1
             print opt, 'resource',  resource_value
+        elif opt == '-t':
+            task_range = sys.argv[i]
+            i += 1
+            print opt, 'tasks', task_range
+            first, last = task_range.split(':')[0].split('-')
+            step = int(task_range.split(':')[1]) if ':' in task_range else 1
+            tasks = range(int(first), int(last)+1, step)
         else:
             cmd = opt
             args = sys.argv[i:]
@@ -64,16 +73,30 @@ def main():
     cmdlist.extend(args)
     print ' '.join(cmdlist)
 
+    if tasks is None:
+        sys.exit(run(cmdlist, stdin, stdout, stderr, join_eo, 'w'))
+
+    # Job array, run tasks sequentially.
+    retcode = 0
+    for task_id in tasks:
+        os.environ['SGE_TASK_ID'] = str(task_id)
+        task_out = stdout.replace('$TASK_ID', str(task_id))
+        task_err = stderr.replace('$TASK_ID', str(task_id))
+        retcode = run(cmdlist, stdin, task_out, task_err, join_eo, 'a') \
+                  or retcode
+    sys.exit(retcode)
+
+
+def run(cmdlist, stdin, stdout, stderr, join_eo, mode):
     inp = open(stdin, 'r')
-    out = open(stdout, 'w')
+    out = open(stdout, mode)
     if join_eo:
         err = subprocess.STDOUT
     else:
         err = open(stderr, 'w')
 
-    retcode = subprocess.call(cmdlist, stdin=inp, stdout=out, stderr=err,
-                              shell=sys.platform=='win32')
-    sys.exit(retcode)
+    return subprocess.call(cmdlist, stdin=inp, stdout=out, stderr=err,
+                           shell=sys.platform=='win32')
 
 
 if __name__ == '__main__':
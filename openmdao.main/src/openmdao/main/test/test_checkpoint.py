@@ -0,0 +1,79 @@
+"""
+Test checkpoint.py
+"""
+
+import os.path
+import shutil
+import tempfile
+import unittest
+
+from nose import SkipTest
+
+from openmdao.main import checkpoint
+from openmdao.main.checkpoint import Checkpointer
+
+
+class _State(object):
+    pass
+
+
+class CheckpointTestCase(unittest.TestCase):
+
+    def setUp(self):
+        if checkpoint.numpy is None:
+            raise SkipTest('numpy is not installed')
+        self.tempdir = tempfile.mkdtemp()
+        self.directory = os.path.join(self.tempdir, 'ckpt')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _arrays(self):
+        return sorted(name for name in os.listdir(self.directory)
+                           if name.endswith('.npy'))
+
+    def test_incremental(self):
+        numpy = checkpoint.numpy
+        state = _State()
+        state.big = numpy.arange(100000.)
+        state.alias = state.big
+        state.other = numpy.ones((100, 100))
+        state.small = numpy.zeros(3)
+        state.x = 42
+
+        ckpt = Checkpointer(self.directory)
+        self.assertFalse(ckpt.exists())
+        ckpt.save(state)
+        self.assertTrue(ckpt.exists())
+        self.assertEqual(ckpt.arrays_written, 2)
+        self.assertEqual(len(self._arrays()), 2)
+
+        # Unchanged arrays are not rewritten.
+        state.x = 43
+        ckpt.save(state)
+        self.assertEqual((ckpt.arrays_written, ckpt.arrays_reused), (0, 2))
+
+        # Changed array replaces old file.
+        old = self._arrays()
+        state.other[0, 0] = 2.
+        ckpt.save(state)
+        self.assertEqual((ckpt.arrays_written, ckpt.arrays_reused), (1, 1))
+        self.assertEqual(len(self._arrays()), 2)
+        self.assertNotEqual(self._arrays(), old)
+
+        restored = Checkpointer(self.directory).load()
+        self.assertEqual(restored.x, 43)
+        self.assertTrue(restored.alias is restored.big)
+        self.assertTrue(numpy.all(restored.big == state.big))
+        self.assertEqual(restored.other[0, 0], 2.)
+        self.assertTrue(isinstance(restored.big, numpy.memmap))
+        self.assertFalse(isinstance(restored.small, numpy.memmap))
+
+        # Mapped copy-on-write, so the checkpoint isn't modified.
+        restored.big[0] = -1.
+        again = Checkpointer(self.directory).load()
+        self.assertEqual(again.big[0], 0.)
+
+
+if __name__ == '__main__':
+    unittest.main()
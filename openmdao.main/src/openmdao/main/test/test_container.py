@@ -120,6 +120,19 @@ class ContainerTestCase(unittest.TestCase):
         cont.disconnect('parent.foo', 'dyntrait')
         self.assertEqual(cont._depgraph.get_source('dyntrait'), None)
 
+    def test_set_src_cache(self):
+        self.root.c1.add('x', Float(1., iotype='out'))
+        self.root.set('c2.c22.c221.number', 2., src='c1.x', force=True)
+        self.assertEqual(self.root.c2.c22.c221.number, 2.)
+        self.assertEqual(self.root._src_xforms, {('c2', 'c1.x'): 'parent.c1.x'})
+        self.assertEqual(self.root.c2._src_xforms,
+                         {('c22', 'parent.c1.x'): 'parent.parent.c1.x'})
+        self.root.set('c2.c22.c221.number', 3., src='c1.x', force=True)
+        self.assertEqual(self.root.c2.c22.c221.number, 3.)
+        self.assertEqual(len(self.root._src_xforms), 1)
+        self.root.add('y', Float(1., iotype='in'))
+        self.assertEqual(self.root._src_xforms, {})
+
     def test_find_trait_and_value(self):
         class MyClass(object):
             pass
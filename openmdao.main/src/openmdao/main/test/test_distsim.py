@@ -25,7 +25,8 @@ from openmdao.main.container import get_closest_proxy
 from openmdao.main.hasobjective import HasObjectives
 from openmdao.main.hasparameters import HasParameters
 from openmdao.main.interfaces import IComponent
-from openmdao.main.mp_support import has_interface, is_instance
+from openmdao.main.mp_support import has_interface, is_instance, \
+                                    wait_for_calls
 from openmdao.main.mp_util import read_server_config
 from openmdao.main.objserverfactory import connect, start_server, RemoteFile
 from openmdao.main.rbac import Credentials, get_credentials, set_credentials, \
@@ -705,6 +706,54 @@ class TestCase(unittest.TestCase):
                       globals(), locals(), RuntimeError,
                       'Server startup failed')
 
+    def test_6_async(self):
+        logging.debug('')
+        logging.debug('test_async')
+
+        factory = self.start_factory()
+        server = factory.create('')
+        box = factory.create(_MODULE+'.Box')
+
+        # Several requests outstanding on one connection.
+        calls = [server.call_async('echo', i) for i in range(10)]
+        self.assertEqual(calls[-1].result(), (9,))
+        self.assertTrue(all(call.done() for call in calls))
+        self.assertEqual([call.result() for call in calls],
+                         [(i,) for i in range(10)])
+
+        # Synchronous call with asynchronous calls outstanding.
+        call = box.call_async('set', 'width', 2.)
+        self.assertEqual(box.get('width'), 2.)
+        self.assertTrue(call.done())
+        box.set('height', 3.)
+
+        # Calls on different connections.
+        run = box.call_async('run')
+        echo = factory.call_async('echo', 'hello')
+        done = []
+        while len(done) < 2:
+            done.extend(wait_for_calls([call for call in (run, echo)
+                                             if call not in done]))
+        self.assertEqual(echo.result(), ('hello',))
+        self.assertEqual(run.result(), None)
+        self.assertEqual(box.get('surface_area'), 12.)
+
+        # Remote errors are raised by result().
+        call = box.call_async('no_rbac')
+        self.assertEqual(wait_for_calls([call]), [call])
+        try:
+            call.result()
+        except RemoteError as exc:
+            msg = "AttributeError: method 'no_rbac' of"
+            self.assertTrue(msg in str(exc))
+        else:
+            self.fail('Expected RemoteError')
+
+        # Proxy results.
+        call = factory.call_async('create', '')
+        self.assertEqual(call.result().echo('x'), ('x',))
+        factory.release(call.result())
+
 
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.DEBUG)
@@ -5,6 +5,13 @@ import unittest
 from enthought.traits.api import Event
 from openmdao.main.api import Assembly, Component, Driver, set_as_top
 from openmdao.main.container import _get_entry_group
+from openmdao.main.evalcache import EvalCache
+from openmdao.main.hasparameters import HasParameters
+from openmdao.main.hasobjective import HasObjective
+from openmdao.main.hasconstraints import HasConstraints
+from openmdao.main.interfaces import implements, ICaseRecorder
+from openmdao.util.decorators import add_delegate
+from openmdao.test.execcomp import ExecComp
 
 
 class EventComp(Component):
@@ -20,6 +27,38 @@ class EventComp(Component):
     def execute(self):
         pass
 
+@add_delegate(HasParameters, HasObjective, HasConstraints)
+class PointsDriver(Driver):
+    """ Evaluates a fixed sequence of points. """
+
+    def __init__(self, points):
+        super(PointsDriver, self).__init__()
+        self.points = points
+        self.results = []
+
+    def execute(self):
+        for point in self.points:
+            self.results.append(self.run_point(point))
+
+
+class ListRecorder(object):
+    """ Keeps recorded cases in a list. """
+
+    implements(ICaseRecorder)
+
+    def __init__(self):
+        self.cases = []
+
+    def record(self, case):
+        self.cases.append(case)
+
+    def get_iterator(self):
+        return iter(self.cases)
+
+    def close(self):
+        pass
+
+
 class DriverTestCase(unittest.TestCase):
 
     def setUp(self):
@@ -48,7 +87,140 @@ class DriverTestCase(unittest.TestCase):
     def test_default_value_force(self):
         #driver default value should be True
         self.assertTrue(self.asm.driver.force_execute)
-        
+
+    def test_eval_cache(self):
+        top = set_as_top(Assembly())
+        top.add('comp', ExecComp(exprs=['y = x*x']))
+        driver = top.add('driver', PointsDriver([[1.], [2.], [1.], [2.+1e-12]]))
+        driver.workflow.add('comp')
+        driver.add_parameter('comp.x', low=-10., high=10.)
+        driver.add_objective('comp.y')
+        driver.add_constraint('comp.y < 3.')
+
+        top.run()
+        self.assertEqual(top.comp.exec_count, 4)
+        self.assertEqual([res[0]['comp.y'] for res in driver.results],
+                         [1., 4., 1., (2.+1e-12)**2])
+
+        cache = driver.eval_cache = EvalCache(size=10, tolerance=1e-9)
+        driver.results = []
+        top.run()
+        # The last point is within tolerance of where the model was last run,
+        # so the model doesn't need to be run again at the end.
+        self.assertEqual(top.comp.exec_count, 6)
+        self.assertEqual(cache.stats()['hits'], 2)
+        self.assertEqual(cache.stats()['misses'], 2)
+        self.assertEqual([res[0]['comp.y'] for res in driver.results],
+                         [1., 4., 1., 4.])
+        self.assertEqual(driver.results[0][1].values()[0][:3], (1., 3., '<'))
+        self.assertEqual(top.comp.y, 4.)
+
+        # Entries don't survive to the next run.
+        driver.points = [[2.], [1.], [2.]]
+        top.run()
+        self.assertEqual(cache.stats()['misses'], 4)
+        # The first point is where the model already is, so comp isn't
+        # invalidated and doesn't execute. The model is brought back to the
+        # last point requested.
+        self.assertEqual(top.comp.exec_count, 8)
+        self.assertEqual(top.comp.y, 4.)
+
+    def test_iteration_cache(self):
+        top = set_as_top(Assembly())
+        top.add('c1', ExecComp(exprs=['y = x*2']))
+        top.add('c2', ExecComp(exprs=['y = x*3']))
+        top.add('c3', ExecComp(exprs=['y = x*4']))
+        top.connect('c1.y', 'c2.x')
+        top.connect('c2.y', 'c3.x')
+        inner = top.add('inner', PointsDriver([[1.]]))
+        inner.add_parameter('c1.x', low=-10., high=10.)
+        inner.add_objective('c3.y')
+        top.driver.workflow.add('inner')
+
+        self.assertEqual(inner._get_required_compnames(),
+                         set(['c1', 'c2', 'c3']))
+        self.assertEqual(sorted(c.name for c in top.driver.iteration_set()),
+                         ['c1', 'c2', 'c3', 'inner'])
+        self.assertTrue('iteration_set' in top.driver._iter_cache)
+
+        # Returned sets may be modified without affecting the cache.
+        top.driver.iteration_set().clear()
+        self.assertEqual(len(top.driver.iteration_set()), 4)
+
+        # Workflow changes invalidate cached sets.
+        top.add('c4', ExecComp(exprs=['y = x']))
+        inner.workflow.add('c4')
+        self.assertEqual(sorted(c.name for c in top.driver.iteration_set()),
+                         ['c1', 'c2', 'c3', 'c4', 'inner'])
+        inner.workflow.remove('c4')
+        self.assertEqual(len(top.driver.iteration_set()), 4)
+
+        # So do objective changes.
+        inner.clear_objectives()
+        inner.add_objective('c2.y')
+        self.assertEqual(inner._get_required_compnames(), set(['c1', 'c2']))
+
+        # Validity follows the workflow components.
+        top.run()
+        self.assertTrue(inner.is_valid())
+        top.c1.x = 5.
+        self.assertFalse(inner.is_valid())
+        self.assertTrue(inner._last_invalid is top.c1)
+        top.run()
+        self.assertTrue(inner.is_valid())
+        self.assertTrue(inner._last_invalid is None)
+
+    def test_printvars_cache(self):
+        top = set_as_top(Assembly())
+        top.add('comp', ExecComp(exprs=['y = x*x', 'z = x+1']))
+        driver = top.add('driver', PointsDriver([[3.]]))
+        driver.workflow.add('comp')
+        driver.add_parameter('comp.x', low=-10., high=10.)
+        driver.add_objective('comp.y')
+        driver.recorders = [ListRecorder()]
+        driver.printvars = ['comp.y*', 'comp.z', 'comp.x']
+        top.run()
+
+        driver.record_case()
+        case = driver.recorders[0].cases[-1]
+        self.assertEqual(case.get_input('comp.x'), 3.)
+        self.assertEqual(case.get_output('comp.y'), 9.)
+        self.assertEqual(case.get_output('comp.z'), 4.)
+        resolved = driver._get_printvars()
+        self.assertTrue(resolved is driver._get_printvars())
+        self.assertEqual(sorted([var for var, iotype, getter in resolved]),
+                         ['comp.x', 'comp.y', 'comp.z'])
+
+        # Getters are reused but return current values.
+        top.comp.x = 4.
+        top.comp.run()
+        driver.record_case()
+        case = driver.recorders[0].cases[-1]
+        self.assertEqual(case.get_output('comp.y'), 16.)
+        self.assertTrue(resolved is driver._get_printvars())
+
+        # Changing printvars or the configuration resolves them again.
+        driver.printvars = ['comp.y']
+        self.assertEqual([var for var, iotype, getter in driver._get_printvars()],
+                         ['comp.y'])
+        top.add('comp2', ExecComp(exprs=['y = x']))
+        driver.workflow.add('comp2')
+        driver.printvars = ['comp*.y']
+        driver.record_case()
+        case = driver.recorders[0].cases[-1]
+        self.assertEqual(case.get_output('comp2.y'), 0.)
+
+        driver.printvars = ['comp.nosuchvar']
+        self.assertRaises(ValueError, driver.record_case)
+
+        # Without the iotype check any expression may be used.
+        driver.printvars = ['comp.x*2']
+        self.assertRaises(ValueError, driver.record_case)
+        resolved = driver._get_printvars(check_iotype=False)
+        self.assertEqual([(var, iotype) for var, iotype, getter in resolved],
+                         [('comp.x*2', None)])
+        self.assertEqual(resolved[0][2](), 8.)
+
 if __name__ == "__main__":
     unittest.main()
 
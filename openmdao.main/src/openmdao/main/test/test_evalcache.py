@@ -0,0 +1,48 @@
+"""
+Test evalcache.py
+"""
+
+import unittest
+
+from openmdao.main.evalcache import EvalCache
+
+
+class EvalCacheTestCase(unittest.TestCase):
+
+    def test_lru(self):
+        cache = EvalCache(size=2)
+        for i in range(3):
+            cache.put(cache.key([float(i)]), i)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(cache.key([0.])), None)
+        self.assertEqual(cache.get(cache.key([1.])), 1)
+        cache.put(cache.key([3.]), 3)  # Evicts 2., 1. was used more recently.
+        self.assertEqual(cache.get(cache.key([2.])), None)
+        self.assertEqual(cache.get(cache.key([1.])), 1)
+
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']),
+                         (2, 2, 2))
+        self.assertEqual(stats['hit_rate'], 0.5)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 2)
+        cache.reset_stats()
+        self.assertEqual(cache.stats()['hit_rate'], 0.)
+
+    def test_key(self):
+        cache = EvalCache()
+        self.assertNotEqual(cache.key([1.]), cache.key([1.+1e-12]))
+        self.assertEqual(cache.key([1, 'a']), (1, 'a'))
+        self.assertEqual(cache.key([[1.]]), None)
+
+        cache = EvalCache(tolerance=1e-6)
+        self.assertEqual(cache.key([1., 2]), cache.key([1.+1e-9, 2]))
+        self.assertNotEqual(cache.key([1.]), cache.key([1.+1e-5]))
+
+        self.assertRaises(ValueError, EvalCache, size=0)
+        self.assertRaises(ValueError, EvalCache, tolerance=-1.)
+
+
+if __name__ == '__main__':
+    unittest.main()
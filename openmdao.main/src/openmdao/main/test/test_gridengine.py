@@ -39,6 +39,9 @@ class TestCase(unittest.TestCase):
                 os.remove(name)
         for name in glob.glob('GridEngineTestServer*'):
             shutil.rmtree(name)
+        for pattern in ('TestArray-*', 'echo?.out', 'no-such-command.std*'):
+            for name in glob.glob(pattern):
+                os.remove(name)
 
     def test_allocator(self):
         logging.debug('')
@@ -222,6 +225,49 @@ echo hello world
         code = "server.execute_command(dict(remote_command='echo'))"
         assert_raises(self, code, globals(), locals(), OSError, '')
 
+
+    def test_array(self):
+        logging.debug('')
+        logging.debug('test_array')
+
+        server = GridEngineServer()
+        tasks = [dict(remote_command='echo', args=['task', str(i)],
+                      output_path='echo%d.out' % i) for i in range(1, 4)]
+        tasks.append(dict(remote_command='no-such-command'))
+
+        results = server.execute_array(dict(job_name='TestArray',
+                                            queue_name='debug_q'), tasks)
+        self.assertEqual(len(results), 4)
+        for i in range(1, 4):
+            self.assertEqual(results[i-1], (0, ''))
+            with open('echo%d.out' % i, 'r') as inp:
+                self.assertEqual(inp.read().replace('"', ''), 'task %d\n' % i)
+        self.assertEqual(results[3][0], 127)
+
+        # Submitted as a single array job.
+        qsub_out = glob.glob('TestArray-*.qsub')
+        self.assertEqual(len(qsub_out), 1)
+        with open(qsub_out[0], 'r') as inp:
+            lines = inp.readlines()
+        self.assertTrue('-t tasks 1-4\n' in lines)
+        self.assertTrue('-q arg debug_q\n' in lines)
+        self.assertEqual(glob.glob('TestArray-*.tasks*'), [])
+
+        # In the background, with per-task status.
+        handle = server.start_array(dict(job_name='TestArray'), tasks[:2])
+        status = server.array_status(handle)
+        self.assertEqual(len(status), 2)
+        self.assertEqual(server.wait_command(handle), [(0, ''), (0, '')])
+        assert_raises(self, 'server.array_status(handle)',
+                      globals(), locals(), ValueError,
+                      'invalid array handle %r' % handle)
+
+        assert_raises(self, 'server.execute_array({}, [])',
+                      globals(), locals(), ValueError, 'no tasks specified')
+        assert_raises(self, "server.execute_array({}, [dict(args=['x'])])",
+                      globals(), locals(), KeyError,
+                      "\"task 1: 'remote_command' required\"")
+
         
 if __name__ == '__main__':
     sys.argv.append('--cover-package=grid_engine.')
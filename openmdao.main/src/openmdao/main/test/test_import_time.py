@@ -0,0 +1,67 @@
+"""
+Guard against regressions in the time it takes to import the api modules.
+Each import is timed in a fresh interpreter.
+"""
+
+import logging
+import subprocess
+import sys
+import unittest
+
+# Maximum time (seconds) for the import, generous to allow for slow hosts.
+MAX_TIME = 5.
+
+# Modules which shouldn't be loaded just by importing an api module.
+_SCRIPT = """
+import sys, time
+start = time.time()
+import %(module)s
+elapsed = time.time() - start
+print elapsed
+print ' '.join(name for name in %(unexpected)r if name in sys.modules)
+"""
+
+
+def time_import(module, unexpected=()):
+    """
+    Return ``(seconds, loaded)`` for importing `module` in a new
+    interpreter, where `loaded` is a list of the modules in `unexpected`
+    which were loaded as a side effect.
+    """
+    script = _SCRIPT % dict(module=module, unexpected=tuple(unexpected))
+    proc = subprocess.Popen([sys.executable, '-c', script],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = proc.communicate()
+    if proc.returncode:
+        raise RuntimeError('import %s failed: %s' % (module, stderr))
+    lines = stdout.splitlines()
+    return (float(lines[-2]), lines[-1].split())
+
+
+class ImportTimeTestCase(unittest.TestCase):
+
+    def _check(self, module, unexpected):
+        elapsed, loaded = time_import(module, unexpected)
+        logging.debug('import %s: %.3f sec', module, elapsed)
+        self.assertEqual(loaded, [])
+        self.assertTrue(elapsed < MAX_TIME,
+                        'import %s took %.3f sec' % (module, elapsed))
+
+    def test_main_api(self):
+        self._check('openmdao.main.api',
+                    ('enthought.traits.api', 'networkx', 'zope.interface',
+                     'openmdao.main.container', 'openmdao.main.assembly',
+                     'openmdao.units'))
+
+    def test_lib_api(self):
+        self._check('openmdao.lib.drivers.api',
+                    ('openmdao.lib.drivers.conmindriver',
+                     'openmdao.lib.drivers.genetic', 'numpy'))
+        self._check('openmdao.lib.components.api',
+                    ('openmdao.lib.components.metamodel',
+                     'openmdao.lib.components.external_code'))
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or ('openmdao.main.api',):
+        print '%s: %.3f sec' % (name, time_import(name)[0])
@@ -2,6 +2,7 @@
 Test mp_util.py
 """
 
+import cPickle
 import logging
 import os.path
 import socket
@@ -9,8 +10,13 @@ import sys
 import unittest
 import nose
 
+from multiprocessing import Pipe
+import threading
+
+from openmdao.main import mp_util
 from openmdao.main.mp_util import read_server_config, read_allowed_hosts, \
-                                  is_legal_connection
+                                  is_legal_connection, send_message, \
+                                  decode_message, decrypt
 
 from openmdao.util.publickey import make_private, HAVE_PYWIN32
 from openmdao.util.testutil import assert_raises
@@ -28,6 +34,72 @@ class TestCase(unittest.TestCase):
                       globals(), locals(), IOError,
                       "No such file 'no-such-file'")
 
+    def test_messages(self):
+        logging.debug('')
+        logging.debug('test_messages')
+
+        numpy = mp_util.numpy
+        if numpy is None:
+            raise nose.SkipTest('numpy is not installed')
+
+        big = numpy.arange(300000.)
+        fortran = numpy.asfortranarray(numpy.arange(20000.).reshape(100, 200))
+        obj = {'big': big, 'alias': big, 'fortran': fortran,
+               'strided': big[::3], 'small': numpy.ones(3),
+               'bytes': numpy.arange(100001, dtype=numpy.int8), 'x': 'y'}
+
+        send_conn, recv_conn = Pipe()
+        for session_key in ('', 'x'*16):
+            # Run sender in a thread so the pipe can't fill up.
+            sender = threading.Thread(target=send_message,
+                                      args=(send_conn, obj, session_key))
+            sender.start()
+            msg = recv_conn.recv()
+            self.assertEqual(msg[0], '#OOB')
+            if session_key:
+                self.assertEqual(msg[1], None)  # Specs are encrypted.
+            result = decode_message(recv_conn, msg, session_key)
+            sender.join()
+
+            self.assertTrue(result['alias'] is result['big'])
+            self.assertTrue(result['fortran'].flags.f_contiguous)
+            for name, value in obj.items():
+                self.assertEqual(type(result[name]), type(value))
+                if name != 'x':
+                    self.assertEqual(result[name].dtype, value.dtype)
+                    self.assertTrue(numpy.all(result[name] == value))
+            self.assertEqual(result['x'], 'y')
+
+            # Small messages are compatible with recv() and decrypt().
+            send_message(send_conn, ('#RETURN', numpy.ones(3)), session_key)
+            kind, value = decrypt(recv_conn.recv(), session_key)
+            self.assertEqual(kind, '#RETURN')
+            self.assertTrue(numpy.all(value == numpy.ones(3)))
+
+    def test_bad_messages(self):
+        logging.debug('')
+        logging.debug('test_bad_messages')
+
+        numpy = mp_util.numpy
+        if numpy is None:
+            raise nose.SkipTest('numpy is not installed')
+
+        text = cPickle.dumps(None)
+        for specs, err in (([('|O8', (3,), 'C')], 'object array in message'),
+                           ([('<f8', (1 << 40,), 'C')],
+                            'message arrays exceed %d bytes' % mp_util.OOB_MAX),
+                           ([('<f8', (-1,), 'C')], 'invalid array shape (-1,)'),
+                           ([('<f8', (3,), 'X')], "invalid array order 'X'")):
+            for session_key in ('', 'x'*16):
+                if session_key:
+                    payload = cPickle.dumps((specs, text))
+                    msg = ('#OOB', None,
+                           mp_util._encrypt_text(payload, session_key))
+                else:
+                    msg = ('#OOB', specs, text)
+                assert_raises(self, 'decode_message(None, msg, session_key)',
+                              globals(), locals(), RuntimeError, err)
+
     def test_allowed_hosts(self):
         logging.debug('')
         logging.debug('test_allowed_hosts')
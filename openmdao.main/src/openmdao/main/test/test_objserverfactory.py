@@ -16,7 +16,9 @@ import nose
 from openmdao.main.component import SimulationRoot
 from openmdao.main.objserverfactory import ObjServerFactory, ObjServer, \
                                            start_server, stop_server, \
-                                           connect_to_server, _PROXIES
+                                           connect_to_server, _PROXIES, \
+                                           register_model_template, \
+                                           unregister_model_template
 from openmdao.main.resource import ResourceAllocationManager as RAM
 from openmdao.util.testutil import assert_raises
 
@@ -128,6 +130,9 @@ class TestCase(unittest.TestCase):
             assert_raises(self, 'server.load_model(egg_info[0])',
                           globals(), locals(), RuntimeError,
                           'shell access is not allowed by this server')
+            assert_raises(self, "server.load_template('exec_comp')",
+                          globals(), locals(), RuntimeError,
+                          'shell access is not allowed by this server')
 
             # Bogus file accesses.
             assert_raises(self, "server.open('../xyzzy', 'r')", globals(), locals(),
@@ -244,6 +249,29 @@ class TestCase(unittest.TestCase):
                      'output_path': 'cmd.out'}
             return_code, error_msg = server.execute_command(rdesc)
             self.assertEqual(return_code, 0)
+            timing = server.command_timing()
+            self.assertTrue(timing['run'] < 1)  # No polling delay.
+
+            # Execute in the background.
+            handle = server.start_command(rdesc)
+            self.assertEqual(server.wait_command(handle), (0, ''))
+            self.assertEqual(sorted(server.command_timing().keys()),
+                             ['queue', 'run'])
+            assert_raises(self, 'server.wait_command(handle)',
+                          globals(), locals(), ValueError,
+                          'invalid command handle %r' % handle)
+
+            # Concurrent commands keep their own timing.
+            if sys.platform != 'win32':
+                slow = server.start_command({'remote_command': 'sleep',
+                                             'args': ['1']})
+                fast = server.start_command(rdesc)
+                server.execute_command(rdesc)
+                self.assertTrue(server.command_timing()['run'] < 1)
+                self.assertEqual(server.wait_command(fast), (0, ''))
+                self.assertTrue(server.command_timing()['run'] < 1)
+                self.assertEqual(server.wait_command(slow), (0, ''))
+                self.assertTrue(server.command_timing()['run'] >= 0.9)
 
             # Bad command, specify lots of resources.
             with open('stdin1', 'w') as out:
@@ -259,6 +287,9 @@ class TestCase(unittest.TestCase):
                 msg = '[Errno 2] No such file or directory'
             assert_raises(self, 'server.execute_command(rdesc)',
                           globals(), locals(), OSError, msg)
+            handle = server.start_command(rdesc)
+            assert_raises(self, 'server.wait_command(handle)',
+                          globals(), locals(), OSError, msg)
 
             # Load a model.
             exec_comp = server.create('openmdao.test.execcomp.ExecComp')
@@ -270,6 +301,21 @@ class TestCase(unittest.TestCase):
             assert_raises(self, "server.load_model('no-such-egg')",
                           globals(), locals(), ValueError,
                           "'no-such-egg' not found.")
+
+            # Load a model from a template.
+            if sys.platform != 'win32':
+                exec_comp.sleep = 0.01
+                register_model_template('exec_comp', exec_comp)
+                try:
+                    obj = server.load_template('exec_comp')
+                    self.assertFalse(obj is exec_comp)
+                    self.assertEqual(obj.sleep, 0.01)
+                    obj.run()
+                finally:
+                    unregister_model_template('exec_comp')
+                assert_raises(self, "server.load_template('exec_comp')",
+                              globals(), locals(), RuntimeError,
+                              "no model template 'exec_comp' in this server")
         finally:
             SimulationRoot.chroot('..')
             shutil.rmtree(testdir)
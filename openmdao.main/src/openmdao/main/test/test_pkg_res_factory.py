@@ -4,13 +4,18 @@ pkg_res_factory test
 
 import logging
 import os
+import shutil
+import tempfile
+import time
 import unittest
 
 # pylint: disable-msg=F0401
 from pkg_resources import DistributionNotFound, VersionConflict
 from pkg_resources import Requirement, Environment, working_set
+from pkg_resources import find_distributions
 
-from openmdao.main.pkg_res_factory import PkgResourcesFactory
+from openmdao.main.pkg_res_factory import PkgResourcesFactory, \
+                                          _EntryPointCache
 from openmdao.main.api import Component, get_available_types
 
 
@@ -63,6 +68,48 @@ class PkgResFactoryTestCase(unittest.TestCase):
                 self.fail("the metadata for %s did not contain 'version'" % typ)
             if 'ifaces' not in meta:
                 self.fail("the metadata for %s did not contain 'ifaces'" % typ)
+
+    def test_entry_point_cache(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            egg_info = os.path.join(tmpdir, 'myplugin.egg-info')
+            os.mkdir(egg_info)
+            with open(os.path.join(egg_info, 'PKG-INFO'), 'w') as out:
+                out.write('Metadata-Version: 1.0\nName: myplugin\n'
+                          'Version: 0.1\n')
+            entry_points = os.path.join(egg_info, 'entry_points.txt')
+            with open(entry_points, 'w') as out:
+                out.write('[openmdao.component]\n'
+                          'myplugin.Comp = myplugin:Comp\n')
+
+            dist = list(find_distributions(tmpdir))[0]
+            entry_map = _EntryPointCache.get_entry_map(dist)
+            self.assertEqual(entry_map,
+                             {'openmdao.component': [('myplugin.Comp',
+                                                      'myplugin')]})
+            # Cached while entry_points.txt is unchanged.
+            dist = list(find_distributions(tmpdir))[0]
+            self.assertTrue(_EntryPointCache.get_entry_map(dist) is entry_map)
+
+            with open(entry_points, 'w') as out:
+                out.write('[openmdao.driver]\n'
+                          'myplugin.Drv = myplugin.drv:Drv\n')
+            mtime = time.time() + 10
+            os.utime(entry_points, (mtime, mtime))
+            dist = list(find_distributions(tmpdir))[0]
+            self.assertEqual(_EntryPointCache.get_entry_map(dist),
+                             {'openmdao.driver': [('myplugin.Drv',
+                                                   'myplugin.drv')]})
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_rescan(self):
+        fact = PkgResourcesFactory(['openmdao.component'], None)
+        classes = fact._get_type_dict()
+        self.assertTrue(fact._get_type_dict() is classes)
+        fact._dist_added(None)
+        self.assertFalse(fact._get_type_dict() is classes)
+
         
 if __name__ == "__main__":
     unittest.main()
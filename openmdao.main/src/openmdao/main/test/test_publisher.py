@@ -0,0 +1,126 @@
+"""
+Test publisher.py
+"""
+
+import threading
+import time
+import unittest
+
+from nose import SkipTest
+
+from numpy import array
+
+from openmdao.main import publisher
+from openmdao.main.publisher import Publisher, decode_message
+
+
+class _Socket(object):
+    """Records the messages sent to it."""
+
+    def __init__(self):
+        self.sent = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def bind(self, url):
+        pass
+
+    def send_multipart(self, frames):
+        self.gate.wait()
+        self.sent.append([str(buffer(frame)) for frame in frames])
+
+
+class _Context(object):
+
+    def __init__(self):
+        self.sock = _Socket()
+
+    def socket(self, kind):
+        return self.sock
+
+
+class PublisherTestCase(unittest.TestCase):
+
+    def setUp(self):
+        if publisher.zmq is None:
+            raise SkipTest('zmq is not installed')
+        self.context = _Context()
+        self.sock = self.context.sock
+
+    def test_ordered(self):
+        pub = Publisher(self.context, 'inproc://test', use_stream=False)
+        pub.publish('log_msgs', 'a')
+        pub.publish('log_msgs', 'b')
+        pub.publish_list([('x', 1.5), ('log_msgs', 'c')])
+        self.assertTrue(pub.flush(5))
+        msgs = [decode_message(frames) for frames in self.sock.sent]
+        self.assertEqual(msgs, [('log_msgs', 'a'), ('log_msgs', 'b'),
+                                ('x', 1.5), ('log_msgs', 'c')])
+
+    def test_coalesce(self):
+        pub = Publisher(self.context, 'inproc://test', use_stream=False)
+        self.sock.gate.clear()  # block the sender on the first message
+        pub.publish('comp.x', 0., coalesce=True)
+        time.sleep(0.1)
+        for i in range(1, 100):
+            pub.publish_list([('comp.x', float(i)), ('comp.y', -i)],
+                             coalesce=True)
+        self.sock.gate.set()
+        self.assertTrue(pub.flush(5))
+        msgs = [decode_message(frames) for frames in self.sock.sent]
+        self.assertEqual(msgs, [('comp.x', 0.), ('comp.x', 99.),
+                                ('comp.y', -99.)])
+
+    def test_coalesce_order(self):
+        pub = Publisher(self.context, 'inproc://test', use_stream=False)
+        self.sock.gate.clear()
+        pub.publish('log_msgs', 'a')
+        time.sleep(0.1)
+        pub.publish('comp.x', 1., coalesce=True)
+        pub.publish('log_msgs', 'b')
+        pub.publish('comp.x', 2., coalesce=True)
+        pub.publish('comp.y', 3., coalesce=True)
+        pub.publish('comp.x', 4.)
+        pub.publish('comp.x', 5., coalesce=True)
+        self.sock.gate.set()
+        self.assertTrue(pub.flush(5))
+        msgs = [decode_message(frames) for frames in self.sock.sent]
+        self.assertEqual(msgs, [('log_msgs', 'a'), ('comp.x', 2.),
+                                ('log_msgs', 'b'), ('comp.y', 3.),
+                                ('comp.x', 4.), ('comp.x', 5.)])
+
+    def test_rate_limit(self):
+        pub = Publisher(self.context, 'inproc://test', use_stream=False,
+                        min_interval=0.5)
+        pub.publish('comp.x', 1., coalesce=True)
+        self.assertTrue(pub.flush(5))
+        start = time.time()
+        pub.publish('comp.x', 2., coalesce=True)
+        pub.publish('comp.x', 3., coalesce=True)
+        self.assertTrue(pub.flush(5))
+        self.assertTrue(time.time()-start > 0.3)
+        msgs = [decode_message(frames) for frames in self.sock.sent]
+        self.assertEqual(msgs, [('comp.x', 1.), ('comp.x', 3.)])
+
+    def test_array(self):
+        pub = Publisher(self.context, 'inproc://test', use_stream=False)
+        arr = array([[1., 2., 3.], [4., 5., 6.]])
+        pub.publish('comp.arr', arr, coalesce=True)
+        arr[0, 0] = 99.  # publisher must have taken a copy
+        self.assertTrue(pub.flush(5))
+        self.assertEqual(len(self.sock.sent[0]), 3)
+        topic, value = decode_message(self.sock.sent[0])
+        self.assertEqual(topic, 'comp.arr')
+        self.assertEqual(value.shape, (2, 3))
+        self.assertEqual(value.tolist(), [[1., 2., 3.], [4., 5., 6.]])
+
+    def test_synchronous(self):
+        pub = Publisher(self.context, 'inproc://test', use_stream=False,
+                        background=False)
+        pub.publish(u'comp.x', {'a': 1})
+        self.assertEqual(decode_message(self.sock.sent[0]),
+                         ('comp.x', {'a': 1}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,6 +35,19 @@ class ExtCode(Component):
                      desc='Resources required to run this component.')
 
 
+class CountingAllocator(ResourceAllocator):
+    """ Never usable, counts estimate requests. """
+
+    def __init__(self, name):
+        super(CountingAllocator, self).__init__(name)
+        self.count = 0
+        self.criteria = {'counter': 'never usable'}
+
+    def time_estimate(self, resource_desc):
+        self.count += 1
+        return (-2, self.criteria)
+
+
 class TestCase(unittest.TestCase):
     """ Test resource allocation. """
 
@@ -131,6 +144,93 @@ class TestCase(unittest.TestCase):
             self.local.max_servers({'python_version':'bad-version'})
         self.assertEqual(n_servers, 0)
 
+    def test_pool(self):
+        logging.debug('')
+        logging.debug('test_pool')
+
+        RAM.configure_pool(1, idle_timeout=600.)
+        try:
+            desc = {'python_version':sys.version[:3]}
+            server, info = RAM.allocate(desc)
+            self.assertNotEqual(server, None)
+            pid = info['pid']
+            with server.open('junk.dat', 'w') as out:
+                out.write('junk\n')
+            RAM.release(server)
+            stats = RAM.get_pool_stats()
+            self.assertEqual((stats['idle'], stats['misses']), (1, 1))
+
+            # Reused with a clean directory.
+            server, info = RAM.allocate(desc)
+            self.assertEqual(info['pid'], pid)
+            self.assertFalse('junk.dat' in server.listdir('.'))
+            stats = RAM.get_pool_stats()
+            self.assertEqual((stats['idle'], stats['hits']), (0, 1))
+
+            # Different description misses.
+            other, other_info = RAM.allocate({})
+            self.assertNotEqual(other_info['pid'], pid)
+            RAM.release(server)
+            RAM.release(other)  # Pool is full.
+            stats = RAM.get_pool_stats()
+            self.assertEqual((stats['idle'], stats['misses']), (1, 2))
+
+            RAM.drain_pool()
+            stats = RAM.get_pool_stats()
+            self.assertEqual((stats['idle'], stats['expired']), (0, 0))
+
+            # Idle servers time out.
+            server, info = RAM.allocate(desc)
+            RAM.release(server)
+            RAM.configure_pool(1, idle_timeout=0.)
+            stats = RAM.get_pool_stats()
+            self.assertEqual((stats['idle'], stats['expired']), (0, 1))
+        finally:
+            RAM.configure_pool(0)
+
+        code = 'RAM.configure_pool(-1)'
+        assert_raises(self, code, globals(), locals(), ValueError,
+                      'pool size must be >= 0')
+
+    def test_allocate_many(self):
+        logging.debug('')
+        logging.debug('test_allocate_many')
+
+        counter = CountingAllocator('Counter')
+        RAM.add_allocator(counter)
+        RAM.set_estimate_ttl(600.)
+        try:
+            desc = {'python_version':sys.version[:3]}
+            servers = RAM.allocate_many(desc, 2)
+            self.assertEqual(len(servers), 2)
+            self.assertNotEqual(servers[0][1]['pid'], servers[1][1]['pid'])
+            # Only the deploying allocator is asked again.
+            self.assertEqual(counter.count, 1)
+            for server, info in servers:
+                RAM.release(server)
+
+            # Nothing is taken ahead of queued requests.
+            ram = RAM._get_instance()
+            ticket = object()
+            ram._waiting.append(ticket)
+            try:
+                self.assertEqual(RAM.allocate_many(desc, 2), [])
+            finally:
+                ram._waiting.remove(ticket)
+            self.assertEqual(counter.count, 1)
+
+            self.assertEqual(RAM.allocate_many({'localhost':False}, 2), [])
+            self.assertEqual(counter.count, 2)
+
+            # Allocators may not give a reason for being incompatible.
+            counter.criteria = {}
+            RAM.set_estimate_ttl(0.)
+            self.assertEqual(RAM.allocate_many({'localhost':False}, 2), [])
+            self.assertEqual(counter.count, 3)
+        finally:
+            RAM.set_estimate_ttl(1.)
+            RAM.remove_allocator('Counter')
+
     def test_hostnames(self):
         logging.debug('')
         logging.debug('test_hostnames')
@@ -0,0 +1,89 @@
+"""
+Test the transformed source cache used when Container.set passes a nested
+input that has a source down to a child. Run as a script to compare the
+per-set overhead with and without the cache.
+"""
+
+import sys
+import time
+import unittest
+
+from openmdao.main.container import Container
+from openmdao.main.datatypes.api import Float
+
+# Number of sets timed in each case.
+NSETS = 2000
+
+
+def _make_tree(depth):
+    """Return ``(root, path, containers)`` for a chain of `depth` nested
+    containers under `root`, where `path` names a Float input at the bottom
+    and `containers` lists the containers the set passes through."""
+    root = Container()
+    root.add('src', Container())
+    root.src.add('x', Float(1., iotype='out'))
+    obj = root
+    names = []
+    containers = [root]
+    for i in range(depth):
+        name = 'c%d' % i
+        obj = obj.add(name, Container())
+        names.append(name)
+        containers.append(obj)
+    obj.add('x', Float(0., iotype='in'))
+    names.append('x')
+    return (root, '.'.join(names), containers[:-1])
+
+
+def time_sets(depth=3, nsets=NSETS, cached=True):
+    """Return the average time (seconds) per set of a nested input
+    `depth` containers deep with a source. If `cached` is False, the
+    transformed source cache is cleared before every set, which is what
+    each set cost before the cache was added."""
+    root, path, containers = _make_tree(depth)
+    start = time.time()
+    for i in xrange(nsets):
+        if not cached:
+            for cont in containers:
+                cont._src_xforms.clear()
+        root.set(path, float(i), src='src.x', force=True)
+    return (time.time() - start) / nsets
+
+
+class SetOverheadTestCase(unittest.TestCase):
+
+    def test_src_cache(self):
+        root, path, containers = _make_tree(3)
+        root.set(path, 1., src='src.x', force=True)
+        entries = []
+        for cont in containers:
+            self.assertEqual(len(cont._src_xforms), 1)
+            entries.append(cont._src_xforms.items()[0])
+        self.assertEqual(entries[0], (('c0', 'src.x'), 'parent.src.x'))
+
+        # Later sets reuse the transformed sources.
+        root.set(path, 2., src='src.x', force=True)
+        self.assertEqual(root.get(path), 2.)
+        for cont, (key, xform) in zip(containers, entries):
+            self.assertEqual(cont._src_xforms.keys(), [key])
+            self.assertTrue(cont._src_xforms[key] is xform)
+
+    def test_cache_cleared(self):
+        root, path, containers = _make_tree(1)
+        root.set(path, 1., src='src.x', force=True)
+        self.assertEqual(len(root._src_xforms), 1)
+        root.add_trait('y', Float(0., iotype='in'))
+        self.assertEqual(root._src_xforms, {})
+
+        root.set(path, 1., src='src.x', force=True)
+        self.assertEqual(len(root._src_xforms), 1)
+        root.remove_trait('y')
+        self.assertEqual(root._src_xforms, {})
+
+
+if __name__ == '__main__':
+    for depth in [int(arg) for arg in sys.argv[1:]] or (1, 3, 5):
+        before = time_sets(depth, cached=False)
+        after = time_sets(depth, cached=True)
+        print 'depth %d: %.1f usec/set uncached, %.1f usec/set cached' \
+              % (depth, before*1e6, after*1e6)
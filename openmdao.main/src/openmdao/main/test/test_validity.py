@@ -0,0 +1,72 @@
+"""
+Test validity.py
+"""
+
+import copy
+import cPickle
+import unittest
+
+from openmdao.main.validity import ValidityMap
+
+
+class ValidityMapTestCase(unittest.TestCase):
+
+    def test_dict_api(self):
+        valids = ValidityMap([('a', True), ('b', False)])
+        self.assertEqual(len(valids), 2)
+        self.assertEqual(valids.num_invalid, 1)
+        self.assertTrue(valids['a'] is True)
+        self.assertTrue(valids['b'] is False)
+        self.assertTrue(valids.get('c') is None)
+        self.assertTrue('a' in valids)
+        self.assertFalse('c' in valids)
+        self.assertEqual(sorted(valids.keys()), ['a', 'b'])
+        self.assertEqual(sorted(valids.items()), [('a', True), ('b', False)])
+        self.assertTrue(False in valids.values())
+        self.assertRaises(KeyError, valids.__getitem__, 'c')
+
+        valids['c'] = False
+        valids['b'] = True
+        self.assertEqual(valids.num_invalid, 1)
+        del valids['c']
+        self.assertEqual(valids.num_invalid, 0)
+        self.assertEqual(sorted(valids), ['a', 'b'])
+
+        # freed slots are reused
+        layout = valids.layout
+        valids['d'] = False
+        self.assertNotEqual(valids.layout, layout)
+        self.assertEqual(valids.num_invalid, 1)
+        self.assertEqual(len(valids._flags), 3)
+
+    def test_bulk(self):
+        names = ['x%d' % i for i in range(10)]
+        valids = ValidityMap([(name, True) for name in names])
+        slots = valids.indices(names[:4])
+        valids.set_indices(slots, False)
+        self.assertEqual(valids.num_invalid, 4)
+        valids.set_indices(slots + slots, False)
+        self.assertEqual(valids.num_invalid, 4)
+        self.assertEqual(valids.get_indices(valids.indices(names[3:5])),
+                         [False, True])
+
+        valids.update_many(names[2:6] + ['new'], False)
+        self.assertEqual(valids.num_invalid, 7)
+        self.assertFalse(valids['new'])
+
+        valids.set_all(True)
+        self.assertEqual(valids.num_invalid, 0)
+        self.assertFalse(False in valids.values())
+        valids.set_all(False)
+        self.assertEqual(valids.num_invalid, 11)
+
+    def test_copy(self):
+        valids = ValidityMap([('a', True), ('b', False)])
+        for dup in (copy.deepcopy(valids),
+                    cPickle.loads(cPickle.dumps(valids, -1))):
+            self.assertEqual(sorted(dup.items()), [('a', True), ('b', False)])
+            self.assertEqual(dup.num_invalid, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
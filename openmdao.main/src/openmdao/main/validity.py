@@ -0,0 +1,142 @@
+"""
+Storage for the validity flags of a Component's variables.
+"""
+
+#public symbols
+__all__ = ['ValidityMap']
+
+
+class ValidityMap(object):
+    """A dict-like mapping of variable name to validity flag.
+
+    Flags are stored one byte per slot in a :class:`bytearray` and each name
+    is assigned a fixed slot, so groups of variables can be looked up once
+    with :meth:`indices` and then read or updated by slot. The number of
+    invalid entries is kept up to date so that checking whether anything is
+    invalid doesn't require a scan.
+    """
+
+    def __init__(self, items=()):
+        self._flags = bytearray()
+        self._slots = {}   # name -> slot
+        self._names = []   # slot -> name, None for free slots
+        self._free = []
+        self._ninvalid = 0
+        # incremented whenever slots are assigned or freed so that
+        # callers can tell when cached indices are out of date
+        self.layout = 0
+        for name, valid in items:
+            self[name] = valid
+
+    @property
+    def num_invalid(self):
+        """Number of entries that are currently invalid."""
+        return self._ninvalid
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, name):
+        return name in self._slots
+
+    def __iter__(self):
+        return iter(self._slots)
+
+    def __getitem__(self, name):
+        return self._flags[self._slots[name]] == 1
+
+    def __setitem__(self, name, valid):
+        valid = 1 if valid else 0
+        try:
+            slot = self._slots[name]
+        except KeyError:
+            if self._free:
+                slot = self._free.pop()
+                self._names[slot] = name
+                self._flags[slot] = valid
+            else:
+                slot = len(self._names)
+                self._names.append(name)
+                self._flags.append(valid)
+            self._slots[name] = slot
+            self.layout += 1
+            if not valid:
+                self._ninvalid += 1
+        else:
+            old = self._flags[slot]
+            if old != valid:
+                self._flags[slot] = valid
+                self._ninvalid += old - valid
+
+    def __delitem__(self, name):
+        slot = self._slots.pop(name)
+        if not self._flags[slot]:
+            self._ninvalid -= 1
+        self._flags[slot] = 1
+        self._names[slot] = None
+        self._free.append(slot)
+        self.layout += 1
+
+    def __repr__(self):
+        return 'ValidityMap(%r)' % self.items()
+
+    def get(self, name, default=None):
+        """Return the flag for `name`, or `default` if it isn't present."""
+        try:
+            return self._flags[self._slots[name]] == 1
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self._slots.keys()
+
+    def values(self):
+        flags = self._flags
+        return [flags[slot] == 1 for slot in self._slots.itervalues()]
+
+    def items(self):
+        flags = self._flags
+        return [(name, flags[slot] == 1)
+                for name, slot in self._slots.iteritems()]
+
+    def indices(self, names):
+        """Return a list of the slots for `names`. The slots remain valid
+        until :attr:`layout` changes.
+        """
+        slots = self._slots
+        return [slots[name] for name in names]
+
+    def get_indices(self, indices):
+        """Return a list of the flags for the given slots."""
+        flags = self._flags
+        return [flags[slot] == 1 for slot in indices]
+
+    def set_all(self, valid):
+        """Set every flag to `valid`."""
+        self._flags[:] = ('\x01' if valid else '\x00') * len(self._flags)
+        self._ninvalid = 0 if valid else len(self._slots)
+
+    def set_indices(self, indices, valid):
+        """Set the flags for the given slots to `valid`."""
+        if valid and self._ninvalid == 0:
+            return
+        flags = self._flags
+        valid = 1 if valid else 0
+        changed = 0
+        for slot in indices:
+            if flags[slot] != valid:
+                flags[slot] = valid
+                changed += 1
+        self._ninvalid += -changed if valid else changed
+
+    def update_many(self, names, valid):
+        """Set the flags for the names in the sequence `names` to `valid`,
+        adding any that are missing.
+        """
+        try:
+            indices = self.indices(names)
+        except KeyError:
+            for name in names:
+                self[name] = valid
+        else:
+            self.set_indices(indices, valid)
@@ -788,6 +788,26 @@ class test__PhysicalUnit(unittest.TestCase):
 
 
 class test__moduleFunctions(unittest.TestCase):
+    def test_get_conversion_tuple(self):
+        factor, offset = units.get_conversion_tuple('ft', 'inch')
+        self.assertAlmostEqual(factor, 12.0, 10)
+        self.assertEqual(offset, 0.0)
+        self.assertTrue(units.get_conversion_tuple('ft', 'inch') is 
+                        units.get_conversion_tuple('ft', 'inch'))
+        
+        factor, offset = units.get_conversion_tuple('degC', 'degF')
+        self.assertAlmostEqual((100.0 + offset) * factor, 212.0, 10)
+        self.assertAlmostEqual(units.convert_units(100.0, 'degC', 'degF'),
+                               212.0, 10)
+        
+        try:
+            units.get_conversion_tuple('ft', 'kg')
+        except TypeError, err:
+            self.assertEqual(str(err), 'Incompatible units')
+        else:
+            self.fail("Expecting TypeError")
+            
+
     def test_add_unit(self):
         try:
             units.add_unit('ft','20*m')
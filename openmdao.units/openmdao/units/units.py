@@ -756,13 +756,28 @@ def _update_library(cfg):
                          ' defined units:%s' % [x[0] for x in retry1])
 
 
+_CONVERSION_CACHE = {}
+
+def get_conversion_tuple(src_units, target_units):
+    """Return the ``(factor, offset)`` tuple that converts a value in
+    `src_units` to `target_units` via ``(value + offset) * factor``.
+    Results are cached by unit string, so after the first call for a given
+    pair this is a single dictionary lookup.
+    """
+    try:
+        return _CONVERSION_CACHE[(src_units, target_units)]
+    except KeyError:
+        conv = _find_unit(src_units).conversion_tuple_to(
+                                                    _find_unit(target_units))
+        _CONVERSION_CACHE[(src_units, target_units)] = conv
+        return conv
+
 def convert_units(value, units, convunits):
     """Return the given value (given in units) converted 
     to convunits.
     """
-    pq = PhysicalQuantity(value, units)
-    pq.convert_to_unit(convunits)
-    return pq.value
+    factor, offset = get_conversion_tuple(units, convunits)
+    return (value + offset) * factor
     
 
 try:
@@ -31,6 +31,29 @@ def _getformat(val):
         return "%.16g"
 
 
+def _format_value(val):
+    # Returns the text written into a template field for val.
+
+    if isinstance(val, _Slot):
+        return '\x00f%d\x00' % val.index
+    elif isinstance(val, float):
+        return _getformat(val) % val
+    else:
+        return str(val)
+
+
+class _Slot(object):
+    """Placeholder for a value while compiling a template. Values written
+    into template fields and values appended to the end of an array line
+    are formatted differently, so they get different markers."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def __str__(self):
+        return '\x00s%d\x00' % self.index
+
+
 class _SubHelper(object):
     """Replaces file text at the correct word location in a line. This
     class contains the Helper Function that is passed to re.sub, etc."""
@@ -68,10 +91,7 @@ class _SubHelper(object):
         self.current_location += 1
         
         if self.current_location == self.replace_location:
-            if isinstance(self.newtext, float):
-                return _getformat(self.newtext) % self.newtext
-            else:
-                return str(self.newtext)
+            return _format_value(self.newtext)
         else:
             return text.group()
         
@@ -86,11 +106,7 @@ class _SubHelper(object):
         if self.current_location >= self.start_location and \
            self.current_location <= self.end_location and \
            self.counter < end:
-            if isinstance(self.newtext[self.counter], float):
-                val = self.newtext[self.counter]
-                newval = _getformat(val) % val
-            else:
-                newval = str(self.newtext[self.counter])
+            newval = _format_value(self.newtext[self.counter])
             self.counter += 1
             return newval
         else:
@@ -191,13 +207,21 @@ class InputFileGenerator(object):
         self.data = []
         self.current_row = 0
         self.anchored = False
+
+        self._template = []  # Template as read, for compile().
+        self._ops = None     # Operations applied since reading the template,
+                             # None unless they are recorded for compile().
     
-    def set_template_file(self, filename):
+    def set_template_file(self, filename, compilable=False):
         """Set the name of the template file to be used The template
         file is also read into memory when this method is called.
         
         filename: str
-            Name of the template file to be used."""
+            Name of the template file to be used.
+
+        compilable: bool
+            If True, the subsequent operations are recorded so that
+            :meth:`compile` can be called."""
         
         self.template_filename = filename
         
@@ -205,6 +229,13 @@ class InputFileGenerator(object):
         self.data = templatefile.readlines()
         templatefile.close()
 
+        if compilable:
+            self._template = self.data[:]
+            self._ops = [('set_delimiters', (self.delimiter,))]
+        else:
+            self._template = []
+            self._ops = None
+
     def set_generated_file(self, filename):
         """Set the name of the file that will be generated.
         
@@ -222,6 +253,8 @@ class InputFileGenerator(object):
         
         self.delimiter = delimiter
         self.reg = re.compile('[^' + delimiter + '\n]+')
+        if self._ops is not None:
+            self._ops.append(('set_delimiters', (delimiter,)))
         
     def mark_anchor(self, anchor, occurrence=1):
         """Marks the location of a landmark, which lets you describe data by
@@ -239,6 +272,8 @@ class InputFileGenerator(object):
         
         if not isinstance(occurrence, int):
             raise ValueError("The value for occurrence must be an integer")
+        if self._ops is not None:
+            self._ops.append(('mark_anchor', (anchor, occurrence)))
         
         instance = 0
         if occurrence > 0:
@@ -290,6 +325,8 @@ class InputFileGenerator(object):
         
         self.current_row = 0
         self.anchored = False
+        if self._ops is not None:
+            self._ops.append(('reset_anchor', ()))
         
     def transfer_var(self, value, row, field):
         """Changes a single variable in the template relative to the 
@@ -300,6 +337,8 @@ class InputFileGenerator(object):
         
         field - which word in line to replace, as denoted by delimiter(s)"""
 
+        if self._ops is not None:
+            self._ops.append(('transfer_var', (value, row, field)))
         j = self.current_row + row
         line = self.data[j]
         
@@ -339,6 +378,10 @@ class InputFileGenerator(object):
         # Simplified input for single-line arrays
         if row_end == None:
             row_end = row_start
+        if self._ops is not None:
+            self._ops.append(('transfer_array', (list(value), row_start,
+                                                 field_start, field_end,
+                                                 row_end, sep)))
             
         sub = _SubHelper()
         for row in range(row_start, row_end+1):
@@ -401,6 +444,10 @@ class InputFileGenerator(object):
         sep: str (optional) (currently unsupported)
             Separator to append between values if we go beyond the template."""
 
+        if self._ops is not None:
+            self._ops.append(('transfer_2Darray', (value.copy(), row_start,
+                                                   row_end, field_start,
+                                                   field_end, sep)))
         sub = _SubHelper()
         i = 0
         for row in range(row_start, row_end+1):
@@ -426,6 +473,8 @@ class InputFileGenerator(object):
         row: integer
             row number to clear, relative to current anchor."""
 
+        if self._ops is not None:
+            self._ops.append(('clearline', (row,)))
         self.data[self.current_row + row] = "\n"
         
     def generate(self):
@@ -435,6 +484,161 @@ class InputFileGenerator(object):
         infile.writelines(self.data)
         infile.close()
 
+    def compile(self):
+        """Return a :class:`CompiledTemplate` which repeats the anchor and
+        transfer operations made since the template file was read, with new
+        values. The template file must have been set with `compilable` True.
+        Anchors are resolved and field positions located once, so each
+        subsequent input file is produced by a single join of template text
+        and formatted values.
+
+        The compiled template is checked against the current data, so the
+        operations should have been made with representative values. Anchors
+        should not match text written by an earlier transfer."""
+
+        if self._ops is None:
+            raise RuntimeError("Operations on %s weren't recorded, use"
+                               " set_template_file(filename, compilable=True)"
+                               % self.template_filename)
+        return CompiledTemplate(self)
+
+
+class CompiledTemplate(object):
+    """An input file template with precomputed substitution locations.
+    Created by :meth:`InputFileGenerator.compile`.
+
+    The output is identical to what the :class:`InputFileGenerator`
+    operations would produce. If a value would change the field structure
+    of the template (it contains a delimiter, is empty, or an array has a
+    different size than when compiled) the operations are simply replayed.
+    """
+
+    def __init__(self, generator):
+
+        if '\x00' in ''.join(generator._template):
+            raise ValueError("Can't compile a template containing NUL")
+
+        self.template_filename = generator.template_filename
+        self.output_filename = generator.output_filename
+
+        self._template = generator._template[:]
+        self._ops = generator._ops[:]
+        self._unsafe = re.compile('[' + generator.delimiter + '\n]')
+
+        # Replay the operations with placeholders in place of the values.
+        shapes = []
+        placeholders = []
+        nslots = 0
+        for name, args in self._ops:
+            if name == 'transfer_var':
+                shape = None
+                placeholder = _Slot(nslots)
+                nslots += 1
+            elif name == 'transfer_array':
+                shape = len(args[0])
+                placeholder = [_Slot(nslots+i) for i in range(shape)]
+                nslots += shape
+            elif name == 'transfer_2Darray':
+                shape = args[0].shape
+                placeholder = zeros(shape, dtype=object)
+                for i in range(shape[0]):
+                    for j in range(shape[1]):
+                        placeholder[i, j] = _Slot(nslots)
+                        nslots += 1
+            else:
+                continue
+            shapes.append(shape)
+            placeholders.append(placeholder)
+        self._shapes = shapes
+
+        text = ''.join(self._replay(placeholders))
+        parts = re.split('\x00([fs])([0-9]+)\x00', text)
+        self._chunks = parts[0::3]
+        self._slots = [(kind == 'f', int(index))
+                       for kind, index in zip(parts[1::3], parts[2::3])]
+
+        values = [args[0] for name, args in self._ops
+                          if name.startswith('transfer_')]
+        if self.render(values) != ''.join(generator.data):
+            raise RuntimeError("Compiled template %s doesn't reproduce the"
+                               " current data" % self.template_filename)
+
+    def _replay(self, values):
+        """Return the template lines after replaying the operations
+        with `values`."""
+
+        gen = InputFileGenerator()
+        gen.template_filename = self.template_filename
+        gen.data = self._template[:]
+        values = iter(values)
+        for name, args in self._ops:
+            if name.startswith('transfer_'):
+                args = (values.next(),) + args[1:]
+            getattr(gen, name)(*args)
+        return gen.data
+
+    def _flatten(self, values):
+        """Return a flat list of the individual values in `values`, or None
+        if an array doesn't have the compiled size."""
+
+        flat = []
+        for value, shape in zip(values, self._shapes):
+            if shape is None:
+                flat.append(value)
+            elif isinstance(shape, int):
+                if len(value) != shape:
+                    return None
+                flat.extend(value)
+            else:
+                if getattr(value, 'shape', None) != shape:
+                    return None
+                for row in value:
+                    flat.extend(row)
+        return flat
+
+    def render(self, values):
+        """Return the text of the input file for `values`.
+
+        values: list
+            The values for each ``transfer_*`` call, in the order they were
+            made."""
+
+        if len(values) != len(self._shapes):
+            raise ValueError("Expected %d values, got %d"
+                             % (len(self._shapes), len(values)))
+        flat = self._flatten(values)
+        if flat is not None:
+            unsafe = self._unsafe
+            chunks = self._chunks
+            out = [chunks[0]]
+            for (field, index), chunk in zip(self._slots, chunks[1:]):
+                if field:
+                    text = _format_value(flat[index])
+                else:
+                    text = str(flat[index])
+                if not text or unsafe.search(text):
+                    break
+                out.append(text)
+                out.append(chunk)
+            else:
+                return ''.join(out)
+        return ''.join(self._replay(values))
+
+    def generate(self, values, filename=None):
+        """Generate the input file for `values`.
+
+        values: list
+            The values for each ``transfer_*`` call, in the order they were
+            made.
+
+        filename: str (optional)
+            Name of the input file to be generated. Defaults to the generated
+            file of the :class:`InputFileGenerator` compiled."""
+
+        infile = open(filename or self.output_filename, 'w')
+        infile.write(self.render(values))
+        infile.close()
+
 
 @stub_if_missing_deps('numpy')
 class FileParser(object):
@@ -0,0 +1,71 @@
+"""
+Support for 'api' pseudo packages whose contents are imported on first use.
+"""
+
+#public symbols
+__all__ = ['lazy_import', 'LazyModule']
+
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module whose public names are imported from their defining modules
+    the first time they are accessed. Once imported, a name is stored in
+    the module so later accesses are ordinary attribute lookups.
+
+    module: module
+        The module being replaced.
+
+    imports: list
+        List of ``(modname, names)`` tuples, where `names` is a sequence of
+        names to be imported from `modname`.
+    """
+
+    def __init__(self, module, imports):
+        super(LazyModule, self).__init__(module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+        # Keep a reference, otherwise Python 2 clears the original module's
+        # globals when it is removed from sys.modules.
+        self.__dict__['_lazy_module'] = module
+        lazy = {}
+        for modname, names in imports:
+            for name in names:
+                lazy[name] = modname
+        self.__dict__['_lazy_imports'] = lazy
+        if '__all__' not in self.__dict__:
+            self.__dict__['__all__'] = sorted(lazy.keys())
+
+    def __getattr__(self, name):
+        """ Called only when `name` hasn't been imported yet. """
+        try:
+            modname = self._lazy_imports[name]
+        except KeyError:
+            raise AttributeError("module '%s' has no attribute '%s'"
+                                 % (self.__name__, name))
+        __import__(modname)
+        value = getattr(sys.modules[modname], name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__.keys()) | set(self._lazy_imports))
+
+
+def lazy_import(modname, imports):
+    """
+    Replace module `modname` in :data:`sys.modules` with a
+    :class:`LazyModule` which imports `imports` on demand.
+    Intended to be called at the end of an 'api' module as
+    ``lazy_import(__name__, [...])``.
+
+    modname: string
+        Name of the module to replace.
+
+    imports: list
+        List of ``(modname, names)`` tuples.
+    """
+    module = LazyModule(sys.modules[modname], imports)
+    sys.modules[modname] = module
+    return module
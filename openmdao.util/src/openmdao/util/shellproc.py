@@ -107,8 +107,11 @@ class ShellProc(subprocess.Popen):
         Returns ``(return_code, error_msg)``.
 
         poll_delay: float (seconds)
-            Time to delay between polling for command completion.
-            A value of zero uses an internal default.
+            Maximum time to delay between polling for command completion.
+            Polling starts with a short delay which is doubled until
+            reaching this value, so short commands are detected promptly.
+            A value of zero uses an internal default, or if `timeout` is also
+            zero, blocks until the command completes without polling.
 
         timeout: float (seconds)
             Maximum time to wait for command completion.
@@ -116,20 +119,26 @@ class ShellProc(subprocess.Popen):
         """
         return_code = None
         try:
-            if poll_delay <= 0:
-                poll_delay = max(0.1, timeout/100.)
-                poll_delay = min(10., poll_delay)
-            npolls = int(timeout / poll_delay) + 1
-
-            time.sleep(poll_delay)
-            return_code = self.poll()
-            while return_code is None:
-                npolls -= 1
-                if (timeout > 0) and (npolls < 0):
-                    self.terminate()
-                    break
-                time.sleep(poll_delay)
+            if poll_delay <= 0 and timeout <= 0:
+                return_code = subprocess.Popen.wait(self)
+            else:
+                if poll_delay <= 0:
+                    poll_delay = max(0.1, timeout/100.)
+                    poll_delay = min(10., poll_delay)
+                deadline = time.time() + timeout
+                delay = min(0.001, poll_delay)
+
                 return_code = self.poll()
+                while return_code is None:
+                    if timeout > 0:
+                        remaining = deadline - time.time()
+                        if remaining <= 0:
+                            self.terminate()
+                            break
+                        delay = min(delay, remaining)
+                    time.sleep(delay)
+                    delay = min(delay*2, poll_delay)
+                    return_code = self.poll()
         finally:
             self.close_files()
 
@@ -186,8 +195,8 @@ def call(args, stdin=None, stdout=None, stderr=None, env=None,
         Environment variables for the command.
 
     poll_delay: float (seconds)
-        Time to delay between polling for command completion.
-        A value of zero uses an internal default.
+        Maximum time to delay between polling for command completion.
+        A value of zero uses an internal default. See :meth:`ShellProc.wait`.
 
     timeout: float (seconds)
         Maximum time to wait for command completion.
@@ -218,8 +227,8 @@ def check_call(args, stdin=None, stdout=None, stderr=None, env=None,
         Environment variables for the command.
 
     poll_delay: float (seconds)
-        Time to delay between polling for command completion.
-        A value of zero uses an internal default.
+        Maximum time to delay between polling for command completion.
+        A value of zero uses an internal default. See :meth:`ShellProc.wait`.
 
     timeout: float (seconds)
         Maximum time to wait for command completion.
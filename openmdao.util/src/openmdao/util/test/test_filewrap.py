@@ -6,7 +6,8 @@ import unittest, os
 
 from numpy import array, isnan, isinf
 
-from openmdao.util.filewrap import InputFileGenerator, FileParser
+from openmdao.util.filewrap import InputFileGenerator, FileParser, \
+                                    CompiledTemplate
 
 
 class TestCase(unittest.TestCase):
@@ -190,6 +191,69 @@ class TestCase(unittest.TestCase):
     
         self.assertEqual(answer, result)
 
+    def test_compiled_template(self):
+
+        template = "Junk\n" + \
+                   "Anchor\n" + \
+                   " A 1, 2 34, Test 1e65\n" + \
+                   " B 4 Stuff\n" + \
+                   "Anchor\n" + \
+                   " C 77 False Inf 333.444\n" + \
+                   "0 0 0 0 0\n" + \
+                   "0 0 0\n" + \
+                   "0 0 0\n"
+
+        outfile = open(self.templatename, 'w')
+        outfile.write(template)
+        outfile.close()
+
+        def transfer(gen, values, compilable=False):
+            gen.set_template_file(self.templatename, compilable)
+            gen.set_generated_file(self.filename)
+            gen.set_delimiters(', ')
+            gen.mark_anchor('Anchor')
+            gen.transfer_var(values[0], 2, 0)
+            gen.transfer_var(values[1], 1, 3)
+            gen.reset_anchor()
+            gen.mark_anchor('Anchor', 2)
+            gen.transfer_var(values[2], 1, 4)
+            gen.clearline(-1)
+            gen.transfer_array(values[3], 2, 3, 5, sep=' ')
+            gen.transfer_2Darray(values[4], 3, 4, 1, 3)
+
+        def expected(values):
+            gen = InputFileGenerator()
+            transfer(gen, values)
+            return ''.join(gen.data)
+
+        values = ['CC', 3.0, 'NaN', array([1, 2, 3, 4.75]),
+                  array([[1, 2, 3], [4, 5, 6]])]
+        gen = InputFileGenerator()
+        transfer(gen, values)
+        self.assertEqual(gen._ops, None)
+        self.assertRaises(RuntimeError, gen.compile)
+
+        gen = InputFileGenerator()
+        transfer(gen, values, compilable=True)
+        compiled = gen.compile()
+        self.assertTrue(isinstance(compiled, CompiledTemplate))
+        self.assertEqual(compiled.render(values), expected(values))
+
+        for values in (['DD', 1.5e-300, 7, array([5., 6., 7., 8.]),
+                        array([[1.5, 2, 3], [4, 5, 6.25]])],
+                       # Values which change the fields are replayed.
+                       ['two words', 2., '', array([1., 2.]),
+                        array([[1, 2], [3, 4]])]):
+            self.assertEqual(compiled.render(values), expected(values))
+
+        compiled.generate(values)
+        infile = open(self.filename, 'r')
+        result = infile.read()
+        infile.close()
+        self.assertEqual(result, expected(values))
+
+        self.assertRaises(ValueError, compiled.render, values[:2])
+
     def test_output_parse(self):
         
         data = "Junk\n" + \
@@ -0,0 +1,55 @@
+"""
+Test lazyimport.py
+"""
+
+import sys
+import types
+import unittest
+
+from openmdao.util.lazyimport import lazy_import, LazyModule
+
+
+class LazyImportTestCase(unittest.TestCase):
+
+    def setUp(self):
+        module = types.ModuleType('_lazy_test_api', 'Test api.')
+        module.keep = 42
+        sys.modules['_lazy_test_api'] = module
+
+    def tearDown(self):
+        del sys.modules['_lazy_test_api']
+
+    def test_lazy(self):
+        had_csv = 'csv' in sys.modules
+        api = lazy_import('_lazy_test_api', [('os.path', ('join', 'isfile')),
+                                             ('csv', ('reader',))])
+        self.assertTrue(isinstance(api, LazyModule))
+        self.assertTrue(sys.modules['_lazy_test_api'] is api)
+        self.assertEqual(api.__doc__, 'Test api.')
+        self.assertEqual(api.keep, 42)
+        self.assertEqual(api.__all__, ['isfile', 'join', 'reader'])
+        self.assertTrue('reader' in dir(api))
+        self.assertFalse('join' in api.__dict__)
+        if not had_csv:
+            self.assertFalse('csv' in sys.modules)
+
+        import os.path
+        self.assertTrue(api.join is os.path.join)
+        self.assertTrue('join' in api.__dict__)
+        self.assertFalse('isfile' in api.__dict__)
+
+        from _lazy_test_api import reader
+        import csv
+        self.assertTrue(reader is csv.reader)
+
+        try:
+            api.nosuch
+        except AttributeError as exc:
+            self.assertEqual(str(exc),
+                   "module '_lazy_test_api' has no attribute 'nosuch'")
+        else:
+            self.fail('Expected AttributeError')
+
+
+if __name__ == '__main__':
+    unittest.main()
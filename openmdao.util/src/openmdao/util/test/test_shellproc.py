@@ -6,8 +6,11 @@ import logging
 import os.path
 import signal
 import sys
+import time
 import unittest
 
+import nose
+
 from openmdao.util.shellproc import call, check_call, CalledProcessError, \
                                     ShellProc
 
@@ -80,9 +83,32 @@ class TestCase(unittest.TestCase):
         else:
             self.assertEqual(msg, ': SIGTERM')
 
+    def test_wait(self):
+        logging.debug('')
+        logging.debug('test_wait')
+
+        if sys.platform == 'win32':
+            raise nose.SkipTest('Requires sleep command')
+
+        # Completion is detected promptly regardless of poll_delay.
+        for poll_delay, timeout in ((0, 0), (0, 60), (5, 0)):
+            start = time.time()
+            return_code, error_msg = call(['sleep', '0.1'],
+                                          poll_delay=poll_delay,
+                                          timeout=timeout)
+            elapsed = time.time() - start
+            self.assertEqual(return_code, 0)
+            self.assertTrue(elapsed < 1, 'elapsed %g' % elapsed)
+
+        # Timeout.
+        start = time.time()
+        return_code, error_msg = call(['sleep', '10'], timeout=0.5)
+        self.assertEqual(return_code, None)
+        self.assertEqual(error_msg, 'Timed out')
+        self.assertTrue(time.time() - start < 5)
+
 
 if __name__ == '__main__':
-    import nose
     sys.argv.append('--cover-package=openmdao.util')
     sys.argv.append('--cover-erase')
     nose.runmodule()